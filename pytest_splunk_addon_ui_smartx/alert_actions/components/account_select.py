@@ -17,6 +17,7 @@
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
 
+from ...components.select_options import find_option, get_options
 from .action_controls import ActionControls
 from .alert_base_component import AlertBaseComponent, Selector
 from .alert_base_control import AlertBaseControl
@@ -68,9 +69,7 @@ class AlertAccountSelect(ActionControls):
         """
         self.wait_to_be_clickable("dropdown")
         self.dropdown.click()
-        list_of_values = []
-        for each in self.get_elements("values"):
-            list_of_values.append(each.text.strip())
+        list_of_values = [each.label for each in get_options(self, "values")]
         self.wait_to_be_clickable("dropdown")
         self.dropdown.click()
         self.wait_for("internal_container")
@@ -100,13 +99,12 @@ class AlertAccountSelect(ActionControls):
             self.wait_to_be_clickable("dropdown")
             self.dropdown.click()
 
-        for each in self.get_elements("values"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                self.wait_for("internal_container")
-                return True
-        else:
+        option = find_option(self, "values", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        self.wait_for("internal_container")
+        return True
 
     def search(self, value):
         """
@@ -140,8 +138,8 @@ class AlertAccountSelect(ActionControls):
         Gets list of values which are visible. Used while filtering
             :returns: List of the values that are visible
         """
-        for each in self.get_elements("values"):
-            yield each.get_attribute("textContent")
+        for each in get_options(self, "values"):
+            yield each.text
 
     def get_value(self):
         """
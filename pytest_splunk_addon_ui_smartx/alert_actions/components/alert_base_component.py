@@ -21,7 +21,9 @@ from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains as action_chains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+from ...profiler import COMPONENT_PROFILER
+from ...wait_engine import WAIT_ENGINE
 
 DEFAULT_TIMEOUT = 20
 
@@ -50,6 +52,10 @@ class AlertBaseComponent:
     - In a container, there should be only one component of the same type.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        COMPONENT_PROFILER.profile_methods(cls)
+
     def __init__(self, browser, container):
         """
         :param browser: The instance of the selenium webdriver
@@ -57,7 +63,7 @@ class AlertBaseComponent:
         """
         self.elements = dict()
         self.browser = browser
-        self.wait = WebDriverWait(self.browser, DEFAULT_TIMEOUT)
+        self.wait = WAIT_ENGINE.create_wait(self.browser, DEFAULT_TIMEOUT, self)
         self.elements["container"] = container
 
     def get_clear_text(self, web_element):
@@ -137,7 +143,7 @@ class AlertBaseComponent:
             :param timeout: The amount of time specified to wait for the wait function
         """
         if timeout:
-            wait = WebDriverWait(self.browser, timeout)
+            wait = WAIT_ENGINE.create_wait(self.browser, timeout, self)
         else:
             wait = self.wait
         if key in self.elements:
@@ -184,7 +190,7 @@ class AlertBaseComponent:
     def wait_to_be_stale(self, key, msg=None):
         if not msg:
             msg = "{} element is not stale.".format(key)
-        wait = WebDriverWait(self.browser, DEFAULT_TIMEOUT)
+        wait = WAIT_ENGINE.create_wait(self.browser, DEFAULT_TIMEOUT, self)
         try:
             wait.until(EC.staleness_of(key), msg)
             return True
@@ -262,4 +268,7 @@ class AlertBaseComponent:
         return self.container.find_elements(by, select)
 
 
+# The methods shared by all the components, for ex. wait_for & get_element, are recorded under the class of the calling component
+COMPONENT_PROFILER.profile_methods(AlertBaseComponent)
+
 Selector = namedtuple("Selector", ["by", "select"], defaults=[By.CSS_SELECTOR, None])
@@ -0,0 +1,211 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .backend_confs import (
+    DEFAULT_BULK_WORKERS,
+    BulkOperationError,
+    ListBackendConf,
+    SingleBackendConf,
+)
+
+
+def run_concurrently(*coroutines):
+    """
+    Sync facade to run the async backend conf calls concurrently from the fixtures & tests.
+    For ex. run_concurrently(accounts.delete_all_stanzas(), proxy.update_parameters(DEFAULT_PROXY))
+        :param coroutines: coroutines to run
+        :returns: list of the results in the order of the coroutines
+    """
+
+    async def gather():
+        return await asyncio.gather(*coroutines)
+
+    return asyncio.run(gather())
+
+
+class AsyncBackendConf:
+    """
+    Base Class of the asyncio variant of the backend confs.
+    The requests are sent by the sync backend conf in a thread pool of max_concurrency threads, so they share its pooled http session.
+    The number of concurrent requests is limited by max_concurrency, the connection pool of the session is enlarged to match it.
+    """
+
+    sync_class = None
+
+    def __init__(
+        self,
+        url,
+        username,
+        password,
+        session_key=None,
+        max_concurrency=DEFAULT_BULK_WORKERS,
+        cache_ttl=0,
+    ):
+        """
+        :param url: management url of the Splunk instance.
+        :param username: username of the Splunk instance
+        :param password: password of the Splunk instance
+        :param session_key: session key of the Splunk instance, for ex. RestHelper.session_key
+        :param max_concurrency: maximum number of the concurrent requests
+        :param cache_ttl: seconds for which the fetched stanzas are reused, see BackendConf
+        """
+        self.backend_conf = self.sync_class(
+            url,
+            username,
+            password,
+            session_key=session_key,
+            pool_size=max_concurrency,
+            cache_ttl=cache_ttl,
+        )
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def close(self):
+        """
+        Stop the threads which send the requests, once the pending calls are done
+        """
+        self._executor.shutdown(wait=True)
+
+    def _get_semaphore(self):
+        """
+        Get the semaphore limiting the concurrent requests. A semaphore is bound to the event loop, so it is created once per loop.
+            :returns: asyncio.Semaphore
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _run(self, method, *args):
+        """
+        Call the method of the sync backend conf in the thread pool.
+            :param method: name of the method
+            :returns: result of the method
+        """
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                functools.partial(getattr(self.backend_conf, method), *args),
+            )
+
+
+class AsyncListBackendConf(AsyncBackendConf):
+    """
+    Asyncio variant of ListBackendConf
+    """
+
+    sync_class = ListBackendConf
+
+    async def get_all_stanzas(self, query=None):
+        """
+        Get list of all stanzas of the configuration
+            :query: query params for filter the stanza
+            :returns: dictionary {stanza: {param: value, ... }, ... }
+        """
+        return await self._run("get_all_stanzas", query)
+
+    async def get_stanza(self, stanza, decrypt=False, bypass_cache=False):
+        """
+        Get a specific stanza of the configuration.
+            :param stanza: stanza to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
+            :returns: dictionary {param: value, ... }
+        """
+        return await self._run("get_stanza", stanza, decrypt, bypass_cache)
+
+    async def get_stanza_value(self, stanza, param, decrypt=False, bypass_cache=False):
+        """
+        Get value of a specific parameter from a stanza
+            :param stanza: str The Stanza we are interested in
+            :param param: the parameter to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
+            :returns: str value
+        """
+        return await self._run("get_stanza_value", stanza, param, decrypt, bypass_cache)
+
+    async def post_stanza(self, url, kwargs):
+        """
+        Create a specific stanza of the configuration.
+            :param url: url to call
+            :param kwargs: body of request method
+            :returns: json result of the request
+        """
+        return await self._run("post_stanza", url, kwargs)
+
+    async def delete_stanza(self, stanza):
+        """
+        Delete a specific stanza of the configuration.
+            :param stanza: stanza to delete
+        """
+        return await self._run("delete_stanza", stanza)
+
+    async def delete_all_stanzas(self, query=None):
+        """
+        Delete all stanza from the configuration. The stanzas are deleted concurrently.
+            :query: query params for filter the stanza
+            :raises BulkOperationError: if some of the stanzas could not be deleted
+        """
+        all_stanzas = list((await self.get_all_stanzas(query)).keys())
+        results = await asyncio.gather(
+            *[self.delete_stanza(stanza) for stanza in all_stanzas],
+            return_exceptions=True,
+        )
+        failures = {
+            stanza: result
+            for stanza, result in zip(all_stanzas, results)
+            if isinstance(result, Exception)
+        }
+        if failures:
+            raise BulkOperationError("delete_all_stanzas", failures)
+
+
+class AsyncSingleBackendConf(AsyncBackendConf):
+    """
+    Asyncio variant of SingleBackendConf
+    """
+
+    sync_class = SingleBackendConf
+
+    async def get_stanza(self, decrypt=False, bypass_cache=False):
+        """
+        Get the values of the Stanza from the configuration
+            :param bypass_cache: fetch the stanza from the server even if it is cached
+            :returns: dictionary {param: value, ... }
+        """
+        return await self._run("get_stanza", decrypt, bypass_cache)
+
+    async def get_parameter(self, param, decrypt=False, bypass_cache=False):
+        """
+        Get value of a specific parameter from the stanza
+            :param param: the parameter to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
+            :returns: str value
+        """
+        return await self._run("get_parameter", param, decrypt, bypass_cache)
+
+    async def update_parameters(self, kwargs):
+        """
+        Updates the values of the stanza in the configuration
+            :param kwargs: body of request method
+            :returns: json result of the request
+        """
+        return await self._run("update_parameters", kwargs)
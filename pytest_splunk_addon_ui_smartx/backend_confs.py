@@ -13,43 +13,328 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import copy
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .utils import backend_retry
 
+DEFAULT_POOL_SIZE = 10
+# Same as the connection pool size, so that the bulk operations do not wait for a free connection
+DEFAULT_BULK_WORKERS = DEFAULT_POOL_SIZE
+RETRY_BACKOFF = 0.5
+DEFAULT_CACHE_SIZE = 128
+
+_http_sessions = dict()
+_http_pool_sizes = dict()
+_http_sessions_lock = threading.Lock()
+_stanza_caches = dict()
+_stanza_caches_lock = threading.Lock()
+
+
+class BackendServerError(AssertionError):
+    """
+    Raised when the Splunk management port responded with a 5xx status code
+    """
+
+
+# POST & DELETE are not idempotent, they are retried only if the request did not reach Splunk or Splunk failed
+WRITE_RETRY_ERRORS = (requests.ConnectionError, requests.Timeout, BackendServerError)
+
+
+def check_status(res, url, *status_codes):
+    """
+    Check the status code of the response
+        :param res: the response
+        :param url: the requested url
+        :param status_codes: the expected status codes
+        :raises BackendServerError: on a 5xx status code, AssertionError on the other unexpected status codes
+    """
+    if res.status_code in status_codes:
+        return
+    message = "url={}, status_code={}, error_msg={}".format(
+        url, res.status_code, res.text
+    )
+    if res.status_code >= 500:
+        raise BackendServerError(message)
+    raise AssertionError(message)
+
+
+def get_base_url(url):
+    """
+    Get the scheme & host part of the url
+        :param url: any url of the Splunk management port
+        :returns: str for ex. https://localhost:8089
+    """
+    parsed_url = urllib.parse.urlsplit(url)
+    return "{}://{}".format(parsed_url.scheme, parsed_url.netloc)
+
+
+def get_http_session(url, pool_size=DEFAULT_POOL_SIZE):
+    """
+    Get the keep-alive http session shared by all the configurations of the same Splunk management url.
+    The connection pool of an existing session is enlarged if a larger pool size is requested.
+        :param url: any url of the Splunk management port
+        :param pool_size: maximum number of the connections kept open to the management port
+        :returns: requests.Session
+    """
+    base_url = get_base_url(url)
+    with _http_sessions_lock:
+        session = _http_sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            session.verify = False
+            _http_sessions[base_url] = session
+        if pool_size > _http_pool_sizes.get(base_url, 0):
+            # the requests in flight keep the connections of the previous adapter
+            session.mount(
+                base_url,
+                HTTPAdapter(pool_connections=1, pool_maxsize=pool_size),
+            )
+            _http_pool_sizes[base_url] = pool_size
+        return session
+
+
+def close_http_sessions():
+    """
+    Close all the shared http sessions
+    """
+    with _http_sessions_lock:
+        sessions = list(_http_sessions.values())
+        _http_sessions.clear()
+        _http_pool_sizes.clear()
+    for session in sessions:
+        session.close()
+
+
+class StanzaCache:
+    """
+    LRU cache of the parsed stanzas. The entries expire after the ttl given while reading them.
+    The generation is incremented on every clear, so that a read which started before a write does not store a stale value.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        """
+        :param max_size: maximum number of the cached stanzas
+        """
+        self.max_size = max_size
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl):
+        """
+        Get the cached value
+            :param key: tuple (endpoint, stanza, decrypt)
+            :param ttl: maximum age of the value in seconds
+            :returns: the cached value, None if not cached or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation):
+        """
+        Store the value, unless the cache was cleared since the value was fetched.
+            :param key: tuple (endpoint, stanza, decrypt)
+            :param value: the value to cache
+            :param generation: generation of the cache when the value was fetched
+        """
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop all the cached values
+        """
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+def get_stanza_cache(url, max_size=DEFAULT_CACHE_SIZE):
+    """
+    Get the stanza cache shared by all the configurations of the same Splunk management url.
+    A write to any of the configurations clears the whole cache, as the endpoints of an add-on can reflect each other.
+        :param url: any url of the Splunk management port
+        :param max_size: maximum number of the cached stanzas, applied when the cache is created for the first time
+        :returns: StanzaCache
+    """
+    base_url = get_base_url(url)
+    with _stanza_caches_lock:
+        cache = _stanza_caches.get(base_url)
+        if cache is None:
+            cache = _stanza_caches[base_url] = StanzaCache(max_size)
+        return cache
+
+
+class BulkOperationError(Exception):
+    """
+    Raised when some of the requests of a bulk operation failed. The remaining requests are completed anyway.
+    """
+
+    def __init__(self, operation, failures):
+        """
+        :param operation: name of the bulk operation
+        :param failures: dictionary {stanza: exception}
+        """
+        self.failures = failures
+        super().__init__(
+            "{} failed for {} stanza(s): {}".format(
+                operation,
+                len(failures),
+                "; ".join(
+                    "{}: {}".format(stanza, error) for stanza, error in failures.items()
+                ),
+            )
+        )
+
+
+def run_bulk(operation, method, items, max_workers=DEFAULT_BULK_WORKERS):
+    """
+    Call the method for each item over a bounded thread pool.
+        :param operation: name of the bulk operation, used in the error message
+        :param method: callable taking an item
+        :param items: list of tuples (stanza, item)
+        :param max_workers: maximum number of the concurrent requests
+        :returns: list of results in the order of the items, or raises BulkOperationError with the failures
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [(stanza, executor.submit(method, item)) for stanza, item in items]
+    results, failures = [], dict()
+    for stanza, future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            failures[stanza] = e
+    if failures:
+        raise BulkOperationError(operation, failures)
+    return results
+
 
 class BackendConf:
     """
     Base Class to fetch configurations from rest endpoint. The classes need management url & session_id of the splunk to fetch the configurations.
     """
 
-    def __init__(self, url, username, password):
+    def __init__(
+        self,
+        url,
+        username,
+        password,
+        session_key=None,
+        pool_size=DEFAULT_POOL_SIZE,
+        cache_ttl=0,
+    ):
         """
         :param url: management url of the Splunk instance.
         :param username: username of the Splunk instance
         :param password: password of the Splunk instance
+        :param session_key: session key of the Splunk instance, for ex. RestHelper.session_key. Basic auth is used if not provided or expired.
+        :param pool_size: maximum number of the connections kept open to the management port
+        :param cache_ttl: seconds for which the fetched stanzas are reused. The cache is disabled by default.
+            The cache is cleared by the writes done through the backend confs, but not by the changes done from UI.
         """
         self.url = url
         self.username = username
         self.password = password
+        self.session_key = session_key
+        self.session = get_http_session(url, pool_size)
+        self.cache_ttl = cache_ttl
+        self.cache = get_stanza_cache(url)
+
+    def get_cached(self, key, fetch, bypass_cache=False):
+        """
+        Read through the stanza cache.
+            :param key: tuple (endpoint, stanza, decrypt)
+            :param fetch: callable which fetches the value from the server
+            :param bypass_cache: fetch the value from the server even if it is cached
+            :returns: copy of the value
+        """
+        if not self.cache_ttl:
+            return fetch()
+        if not bypass_cache:
+            value = self.cache.get(key, self.cache_ttl)
+            if value is not None:
+                return copy.deepcopy(value)
+        generation = self.cache.generation
+        value = fetch()
+        self.cache.set(key, value, generation)
+        return copy.deepcopy(value)
+
+    def request(self, method, url, **kwargs):
+        """
+        Send the request over the shared http session.
+        The writes clear the stanza cache of the management url.
+            :param method: http method
+            :param url: url to call
+            :returns: requests.Response
+        """
+        if method != "GET":
+            try:
+                return self._request(method, url, **kwargs)
+            finally:
+                self.cache.clear()
+        return self._request(method, url, **kwargs)
+
+    def _request(self, method, url, **kwargs):
+        """
+        Send the request with the session key, or with basic auth if the session key is not available or rejected.
+            :param method: http method
+            :param url: url to call
+            :returns: requests.Response
+        """
+        if self.session_key:
+            res = self.session.request(
+                method,
+                url,
+                headers={"Authorization": "Splunk {}".format(self.session_key)},
+                verify=False,
+                **kwargs,
+            )
+            if res.status_code != 401:
+                return res
+            self.session_key = None
+        return self.session.request(
+            method, url, auth=(self.username, self.password), verify=False, **kwargs
+        )
 
-    @backend_retry(3)
+    @backend_retry(3, backoff=RETRY_BACKOFF)
     def rest_call(self, url):
         """
         rest call to the splunk rest-endpoint
             :param url: url to call
             :returns: json result of the request
         """
-        res = requests.get(url, auth=(self.username, self.password), verify=False)
+        res = self.request("GET", url)
         assert res.status_code == 200, "url={}, status_code={}, error_msg={}".format(
             url, res.status_code, res.text
         )
         return res.json()
 
+    @backend_retry(3, backoff=RETRY_BACKOFF, retry_on=WRITE_RETRY_ERRORS)
     def rest_call_post(self, url, kwargs):
         """
         rest call to the splunk rest-endpoint
@@ -59,24 +344,19 @@ class BackendConf:
             :param kwargs: body of request method
             :returns: json result of the request
         """
-        res = requests.post(
-            url, kwargs, auth=(self.username, self.password), verify=False
-        )
-        assert (
-            res.status_code == 200 or res.status_code == 201
-        ), "url={}, status_code={}, error_msg={}".format(url, res.status_code, res.text)
+        res = self.request("POST", url, data=kwargs)
+        check_status(res, url, 200, 201)
         return res.json()
 
+    @backend_retry(3, backoff=RETRY_BACKOFF, retry_on=WRITE_RETRY_ERRORS)
     def rest_call_delete(self, url):
         """
         rest call to the splunk rest-endpoint
             :param url: url to call
             :returns: json result of the request
         """
-        res = requests.delete(url, auth=(self.username, self.password), verify=False)
-        assert (
-            res.status_code == 200 or res.status_code == 201
-        ), "url={}, status_code={}, error_msg={}".format(url, res.status_code, res.text)
+        res = self.request("DELETE", url)
+        check_status(res, url, 200, 201)
 
     def parse_conf(self, json_res, single_stanza=False):
         """
@@ -117,10 +397,11 @@ class ListBackendConf(BackendConf):
         res = self.rest_call(url)
         return self.parse_conf(res)
 
-    def get_stanza(self, stanza, decrypt=False):
+    def get_stanza(self, stanza, decrypt=False, bypass_cache=False):
         """
         Get a specific stanza of the configuration.
             :param stanza: stanza to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
             :returns: dictionary {param: value, ... }
         """
         url = "{}/{}?count=0&output_mode=json".format(
@@ -128,8 +409,11 @@ class ListBackendConf(BackendConf):
         )
         if decrypt:
             url = "{}&--cred--=1".format(url)
-        res = self.rest_call(url)
-        return self.parse_conf(res, single_stanza=True)
+        return self.get_cached(
+            (self.url, stanza, decrypt),
+            lambda: self.parse_conf(self.rest_call(url), single_stanza=True),
+            bypass_cache,
+        )
 
     def post_stanza(self, url, kwargs):
         """
@@ -143,15 +427,39 @@ class ListBackendConf(BackendConf):
         kwargs["output_mode"] = "json"
         return self.rest_call_post(url, kwargs)
 
-    def delete_all_stanzas(self, query=None):
+    def post_stanzas(self, url, stanzas, max_workers=DEFAULT_BULK_WORKERS):
+        """
+        Create many stanzas of the configuration concurrently.
+            :param url: url to call
+            :param stanzas: list of request bodies, each of them having the "name" of the stanza
+            :param max_workers: maximum number of the concurrent requests
+            :returns: list of json results of the requests, in the order of the stanzas
+            :raises BulkOperationError: if some of the stanzas could not be created
+        """
+        return run_bulk(
+            "post_stanzas",
+            lambda kwargs: self.post_stanza(url, kwargs),
+            [
+                (kwargs.get("name", index), kwargs)
+                for index, kwargs in enumerate(stanzas)
+            ],
+            max_workers,
+        )
+
+    def delete_all_stanzas(self, query=None, max_workers=DEFAULT_BULK_WORKERS):
         """
-        Delete all stanza from the configuration.
+        Delete all stanza from the configuration. The stanzas are deleted concurrently.
             :query: query params for filter the stanza
-            :returns: json result of the request
+            :param max_workers: maximum number of the concurrent requests
+            :raises BulkOperationError: if some of the stanzas could not be deleted
         """
         all_stanzas = list(self.get_all_stanzas(query).keys())
-        for stanza in all_stanzas:
-            self.delete_stanza(stanza)
+        run_bulk(
+            "delete_all_stanzas",
+            self.delete_stanza,
+            [(stanza, stanza) for stanza in all_stanzas],
+            max_workers,
+        )
 
     def delete_stanza(self, stanza):
         """
@@ -162,14 +470,15 @@ class ListBackendConf(BackendConf):
         url = "{}/{}".format(self.url, urllib.parse.quote_plus(stanza))
         self.rest_call_delete(url)
 
-    def get_stanza_value(self, stanza, param, decrypt=False):
+    def get_stanza_value(self, stanza, param, decrypt=False, bypass_cache=False):
         """
         Get value of a specific parameter from a stanza
             :param stanza: str The Stanza we are interested in
             :param param: the parameter to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
             :returns: str value
         """
-        stanza_map = self.get_stanza(stanza, decrypt)
+        stanza_map = self.get_stanza(stanza, decrypt, bypass_cache)
         return stanza_map[param]
 
 
@@ -178,24 +487,29 @@ class SingleBackendConf(BackendConf):
     For the configurations which can only have one stanza. for example, logging.
     """
 
-    def get_stanza(self, decrypt=False):
+    def get_stanza(self, decrypt=False, bypass_cache=False):
         """
         Get the values of the Stanza from the configuration
+            :param bypass_cache: fetch the stanza from the server even if it is cached
             :returns: dictionary {param: value, ... }
         """
         url = self.url + "?output_mode=json"
         if decrypt:
             url = "{}&--cred--=1".format(url)
-        res = self.rest_call(url)
-        return self.parse_conf(res, single_stanza=True)
+        return self.get_cached(
+            (self.url, None, decrypt),
+            lambda: self.parse_conf(self.rest_call(url), single_stanza=True),
+            bypass_cache,
+        )
 
-    def get_parameter(self, param, decrypt=False):
+    def get_parameter(self, param, decrypt=False, bypass_cache=False):
         """
         Get value of a specific parameter from the stanza
             :param param: the parameter to fetch
+            :param bypass_cache: fetch the stanza from the server even if it is cached
             :returns: str value
         """
-        stanza_map = self.get_stanza(decrypt)
+        stanza_map = self.get_stanza(decrypt, bypass_cache)
         return stanza_map[param]
 
     def update_parameters(self, kwargs):
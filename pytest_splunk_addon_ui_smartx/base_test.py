@@ -23,15 +23,25 @@ from msedge.selenium_tools import Edge
 from selenium import webdriver
 from selenium.common.exceptions import ElementNotInteractableException, TimeoutException
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
-from selenium.webdriver.support.ui import WebDriverWait
 
+from .components.login import Login
+from .grid import get_hosts, get_hub_url
 from .pages.login import LoginPage
-from .utils import backend_retry
+from .perf_presets import (
+    block_urls,
+    get_chrome_arguments,
+    get_chrome_preferences,
+    get_firefox_preferences,
+)
+from .utils import backend_retry, mark_navigation, set_implicit_wait
+from .wait_engine import WAIT_ENGINE
+from .web_session import COOKIE_DOMAIN_PATH, LOGIN_URL_FRAGMENT, SPLUNK_WEB_SESSIONS
 
 # requests.urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 PNG_PATH = "assets"
+REMOTE_IMPLICIT_WAIT = 3
 
 
 class SeleniumHelper:
@@ -49,11 +59,25 @@ class SeleniumHelper:
         cred=("admin", "Chang3d!"),
         headless=False,
         test_case=None,
+        fast_login=False,
+        explicit_waits_only=False,
+        browser_profiles=None,
+        perf_preset=None,
+        selenium_grid=None,
     ):
         self.splunk_web_url = splunk_web_url
         self.splunk_mgmt_url = splunk_mgmt_url
         self.cred = cred
         self.test_case = test_case
+        self.fast_login = fast_login
+        # The disk cache is only kept for the local Chrome & Firefox, the remote browsers run on another host
+        self.browser_profiles = None
+        self.profile_session = None
+        if browser_profiles and debug and browser in ("chrome", "firefox"):
+            self.browser_profiles = browser_profiles
+            self.profile_session = browser_profiles.create_session()
+        self.perf_preset = perf_preset
+        self.selenium_grid = selenium_grid
 
         selenium_host = os.environ.get("SELENIUM_HOST")
 
@@ -61,16 +85,20 @@ class SeleniumHelper:
             if browser == "firefox":
                 if debug:
                     self.browser = webdriver.Firefox(
-                        firefox_options=SeleniumHelper.get_local_firefox_opts(headless)
+                        firefox_options=SeleniumHelper.get_local_firefox_opts(
+                            headless, **self.get_browser_options(browser)
+                        )
                     )
                 elif selenium_host:
-                    self.browser = webdriver.Remote(
-                        command_executor=f"{selenium_host}:4444/wd/hub",
-                        options=SeleniumHelper.get_local_firefox_opts(
-                            headless_run=False
+                    self.browser = self.get_remote_browser(
+                        selenium_host,
+                        SeleniumHelper.get_local_firefox_opts(
+                            headless_run=False, **self.get_preset_options(browser)
                         ),
                     )
-                    self.browser.implicitly_wait(3)
+                    set_implicit_wait(
+                        self.browser, 0 if explicit_waits_only else REMOTE_IMPLICIT_WAIT
+                    )
                 else:
                     raise Exception(
                         f"Firefox tests have to be run either with --local or in CI environment with selenium host!"
@@ -79,17 +107,21 @@ class SeleniumHelper:
             elif browser == "chrome":
                 if debug:
                     self.browser = webdriver.Chrome(
-                        chrome_options=SeleniumHelper.get_local_chrome_opts(headless),
+                        chrome_options=SeleniumHelper.get_local_chrome_opts(
+                            headless, **self.get_browser_options(browser)
+                        ),
                         service_args=["--verbose"],
                     )
                 elif selenium_host:
-                    self.browser = webdriver.Remote(
-                        command_executor=f"{selenium_host}:4444/wd/hub",
-                        options=SeleniumHelper.get_local_chrome_opts(
-                            headless_run=False
+                    self.browser = self.get_remote_browser(
+                        selenium_host,
+                        SeleniumHelper.get_local_chrome_opts(
+                            headless_run=False, **self.get_preset_options(browser)
                         ),
                     )
-                    self.browser.implicitly_wait(3)
+                    set_implicit_wait(
+                        self.browser, 0 if explicit_waits_only else REMOTE_IMPLICIT_WAIT
+                    )
                 else:
                     raise Exception(
                         f"Chrome tests have to be run either with --local or in CI environment with selenium host!"
@@ -126,18 +158,97 @@ class SeleniumHelper:
                     f"No valid browser found.! expected=[firefox, chrome, edge, IE, safari], got={browser}"
                 )
         except Exception as e:
+            self.release_profile()
             raise e
 
         try:
+            if self.perf_preset and browser == "chrome":
+                block_urls(self.browser, self.perf_preset)
             self.browser_session = self.browser.session_id
             self.login_to_splunk(*self.cred)
         except Exception as e:
             self.browser.quit()
+            self.release_profile()
             logger.error(
                 f"An unexpected error occurred during SeleniumHelper initialization: {e})"
             )
             raise
 
+    def get_remote_browser(self, selenium_host, options):
+        """
+        Create the remote browser on the Selenium hub, or on the least loaded hub of the grid if SELENIUM_HOST lists several hosts.
+            :param selenium_host: value of SELENIUM_HOST
+            :param options: The options of the browser
+            :returns: The remote webdriver
+        """
+        if self.selenium_grid:
+            return self.selenium_grid.create_session(
+                lambda hub: webdriver.Remote(command_executor=hub, options=options),
+                options.capabilities.get("browserName"),
+            )
+        return webdriver.Remote(
+            command_executor=get_hub_url(get_hosts(selenium_host)[0]), options=options
+        )
+
+    def get_profile_options(self, browser):
+        """
+        Get the keyword arguments of get_local_chrome_opts / get_local_firefox_opts for the profile session
+            :param browser: chrome or firefox
+            :returns: Dict, empty if the disk cache is not kept
+        """
+        if not self.profile_session:
+            return dict()
+        if browser == "chrome":
+            return {
+                "profile_arguments": self.browser_profiles.get_chrome_arguments(
+                    self.profile_session
+                )
+            }
+        return {
+            "preferences": self.browser_profiles.get_firefox_preferences(
+                self.profile_session
+            )
+        }
+
+    def get_preset_options(self, browser):
+        """
+        Get the keyword arguments of get_local_chrome_opts / get_local_firefox_opts for the performance preset
+            :param browser: chrome or firefox
+            :returns: Dict, empty if there is no preset
+        """
+        if not self.perf_preset:
+            return dict()
+        if browser == "chrome":
+            return {
+                "arguments": get_chrome_arguments(self.perf_preset),
+                "preferences": get_chrome_preferences(self.perf_preset),
+            }
+        return {"preferences": get_firefox_preferences(self.perf_preset)}
+
+    def get_browser_options(self, browser):
+        """
+        Get the keyword arguments of get_local_chrome_opts / get_local_firefox_opts
+        for the profile session & the performance preset
+            :param browser: chrome or firefox
+            :returns: Dict
+        """
+        options = self.get_preset_options(browser)
+        profile_options = self.get_profile_options(browser)
+        if "preferences" in options and "preferences" in profile_options:
+            profile_options["preferences"] = dict(
+                options["preferences"], **profile_options["preferences"]
+            )
+        options.update(profile_options)
+        return options
+
+    def release_profile(self):
+        """
+        Release the profile session once the browser is quit, so that its disk cache is reused by the next browsers
+        """
+        if self.profile_session:
+            self.browser_profiles.release_session(self.profile_session)
+            self.profile_session = None
+
     @staticmethod
     def get_local_ie_opts():
         capabilities = DesiredCapabilities.INTERNETEXPLORER
@@ -149,25 +260,37 @@ class SeleniumHelper:
         return capabilities
 
     @staticmethod
-    def get_local_chrome_opts(headless_run):
+    def get_local_chrome_opts(
+        headless_run, profile_arguments=None, arguments=None, preferences=None
+    ):
         chrome_opts = webdriver.ChromeOptions()
         chrome_opts.set_capability("goog:loggingPrefs", {"browser": "ALL"})
         chrome_opts.add_argument("--ignore-ssl-errors=yes")
         chrome_opts.add_argument("--ignore-certificate-errors")
         chrome_opts.add_argument("--disable-dev-shm-usage")
         chrome_opts.add_argument("--window-size=1280,768")
-        chrome_opts.add_argument("--guest")
+        if profile_arguments:
+            for argument in profile_arguments:
+                chrome_opts.add_argument(argument)
+        else:
+            chrome_opts.add_argument("--guest")
+        for argument in arguments or list():
+            chrome_opts.add_argument(argument)
+        if preferences:
+            chrome_opts.add_experimental_option("prefs", preferences)
         if headless_run:
             chrome_opts.add_argument("--headless")
         return chrome_opts
 
     @staticmethod
-    def get_local_firefox_opts(headless_run):
+    def get_local_firefox_opts(headless_run, preferences=None):
         firefox_opts = webdriver.FirefoxOptions()
         firefox_opts.add_argument("--ignore-ssl-errors=yes")
         firefox_opts.add_argument("--ignore-certificate-errors")
         firefox_opts.add_argument("--disable-dev-shm-usage")
         firefox_opts.log.level = "trace"
+        for name, value in (preferences or dict()).items():
+            firefox_opts.set_preference(name, value)
         if headless_run:
             firefox_opts.add_argument("--headless")
             firefox_opts.add_argument("--window-size=1280,768")
@@ -199,8 +322,14 @@ class SeleniumHelper:
 
     def login_to_splunk(self, *cred):
         try:
+            if self.fast_login and self.login_to_splunk_with_cookies(*cred):
+                return
             login_page = LoginPage(self)
             login_page.login.login(*cred)
+            if self.fast_login:
+                SPLUNK_WEB_SESSIONS.set(
+                    self.splunk_web_url, cred[0], self.browser.get_cookies()
+                )
         except Exception as e:
             logger.error(
                 f"An unexpected error error occurred while logging to splunk: {e}"
@@ -208,6 +337,33 @@ class SeleniumHelper:
             self.browser.save_screenshot(os.path.join(PNG_PATH, "login_error.png"))
             raise
 
+    def login_to_splunk_with_cookies(self, username, password):
+        """
+        Login by injecting the cached Splunk web session cookies instead of filling the login form.
+        The cookies are fetched once per Splunk web url & user.
+            :returns: Bool True if logged in, False if the login form has to be used
+        """
+        try:
+            cookies = SPLUNK_WEB_SESSIONS.login(self.splunk_web_url, username, password)
+        except Exception as e:
+            logger.warning(f"Could not get the Splunk web session cookies: {e}")
+            return False
+        self.browser.get(self.splunk_web_url + COOKIE_DOMAIN_PATH)
+        for cookie in cookies:
+            self.browser.add_cookie(cookie)
+        self.browser.get(self.splunk_web_url)
+        mark_navigation(self.browser)
+        try:
+            if LOGIN_URL_FRAGMENT not in self.browser.current_url:
+                Login(self.browser).wait_for("homepage")
+                return True
+        except TimeoutException:
+            pass
+        logger.info("Cached Splunk web session is not valid anymore, using login form")
+        SPLUNK_WEB_SESSIONS.invalidate(self.splunk_web_url, username)
+        self.browser.delete_all_cookies()
+        return False
+
 
 class RestHelper:
     def __init__(self, splunk_mgmt_url, username, password):
@@ -248,7 +404,7 @@ class UccTester:
 
     def setup_class(self):
         WAIT_TIMEOUT = 20
-        self.wait = WebDriverWait(None, WAIT_TIMEOUT)
+        self.wait = WAIT_ENGINE.create_wait(None, WAIT_TIMEOUT, "UccTester.assert_util")
 
     def assert_util(
         self, left, right, operator="==", left_args={}, right_args={}, msg=None
@@ -0,0 +1,150 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import logging
+import threading
+
+from .utils import mark_navigation
+from .web_session import LOGIN_URL_FRAGMENT
+
+logger = logging.getLogger(__name__)
+
+CLEAR_STORAGE_SCRIPT = (
+    "try{window.localStorage.clear();}catch(e){}"
+    "try{window.sessionStorage.clear();}catch(e){}"
+)
+
+
+class BrowserPool:
+    """
+    Session level pool of pre-launched & pre-authenticated browsers.
+
+    The tests check out a SeleniumHelper from the pool and return it once the test is finished.
+    The browser is reset before it is handed out again and the sessions which became unhealthy are evicted.
+    """
+
+    def __init__(self, factory, size=1, reset_url=None):
+        """
+        :param factory: callable which returns a new logged in SeleniumHelper
+        :param size: maximum number of idle browsers kept in the pool
+        :param reset_url: the url to navigate to while resetting a browser. Defaults to the Splunk web url of the helper.
+        """
+        self.factory = factory
+        self.size = size
+        self.reset_url = reset_url
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """
+        Launch the browsers upfront so that the first tests do not pay for the browser launch & login.
+        """
+        while self.idle_count < self.size:
+            helper = self.factory()
+            with self._lock:
+                self._idle.append(helper)
+
+    @property
+    def idle_count(self):
+        with self._lock:
+            return len(self._idle)
+
+    def checkout(self, test_case=None):
+        """
+        Get a healthy browser from the pool. A new browser is launched if the pool is empty.
+            :param test_case: name of the test case which will use the browser
+            :returns: SeleniumHelper
+        """
+        while True:
+            with self._lock:
+                helper = self._idle.pop() if self._idle else None
+            if helper is None:
+                helper = self.factory()
+                break
+            if self.is_healthy(helper):
+                break
+            self.evict(helper)
+        helper.test_case = test_case
+        return helper
+
+    def checkin(self, helper):
+        """
+        Return the browser to the pool. The browser gets reset, and evicted if the reset fails or the pool is full.
+            :param helper: SeleniumHelper which was checked out from the pool
+        """
+        try:
+            self.reset(helper)
+        except Exception as e:
+            logger.warning(f"Evicting the browser as it could not be reset: {e}")
+            self.evict(helper)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(helper)
+                return
+        self.evict(helper)
+
+    def reset(self, helper):
+        """
+        Bring the browser back to a known state: close the extra windows, clear the storage and navigate to a known url.
+        Login again if the Splunk session has expired meanwhile.
+            :param helper: SeleniumHelper to reset
+        """
+        browser = helper.browser
+        handles = browser.window_handles
+        for handle in handles[1:]:
+            browser.switch_to.window(handle)
+            browser.close()
+        browser.switch_to.window(handles[0])
+        browser.execute_script(CLEAR_STORAGE_SCRIPT)
+        browser.get(self.reset_url or helper.splunk_web_url)
+        mark_navigation(browser)
+        if LOGIN_URL_FRAGMENT in browser.current_url:
+            helper.login_to_splunk(*helper.cred)
+
+    def is_healthy(self, helper):
+        """
+        Check whether the WebDriver session of the browser is still responsive.
+            :param helper: SeleniumHelper to check
+            :returns: Bool
+        """
+        try:
+            helper.browser.current_url
+            return True
+        except Exception as e:
+            logger.warning(
+                f"Browser session {helper.browser_session} is unhealthy: {e}"
+            )
+            return False
+
+    def evict(self, helper):
+        """
+        Quit the browser without returning it to the pool.
+            :param helper: SeleniumHelper to evict
+        """
+        try:
+            helper.browser.quit()
+        except Exception as e:
+            logger.debug(f"Got exception while quitting the evicted browser: {e}")
+        helper.release_profile()
+
+    def close(self):
+        """
+        Quit all the idle browsers of the pool
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for helper in idle:
+            self.evict(helper)
@@ -0,0 +1,143 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 200 * 1024 * 1024
+# Session directories older than this are left over by crashed runs and removed.
+STALE_SESSION_AGE = 24 * 60 * 60
+
+
+class BrowserProfiles:
+    """
+    Keeps the HTTP disk cache of the local browsers warm across the browser sessions.
+
+    Every browser gets its own session directory with a fresh profile, so that the cookies & storage stay isolated.
+    Its disk cache starts as a copy of the cache template of the worker, and becomes the new template once the browser is quit,
+    so that the static assets of Splunk web & UCC are served from the cache on the first page load.
+    A cache which grew over the size cap is discarded instead.
+    """
+
+    def __init__(self, root, cache_size=DEFAULT_CACHE_SIZE, worker=None):
+        """
+        :param root: The directory in which the profiles are kept
+        :param cache_size: The maximum size of the disk cache in bytes
+        :param worker: The name of the pytest-xdist worker. Defaults to PYTEST_XDIST_WORKER.
+        """
+        worker = worker or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.root = os.path.join(os.path.abspath(root), worker)
+        self.cache_size = cache_size
+        self.template = os.path.join(self.root, "template")
+        self.sessions = os.path.join(self.root, "sessions")
+        self._lock = threading.Lock()
+        os.makedirs(self.sessions, exist_ok=True)
+        self.remove_stale_sessions()
+
+    def create_session(self):
+        """
+        Create the session directory of a new browser, with a copy of the cache template.
+            :returns: Str path of the session directory
+        """
+        session = tempfile.mkdtemp(dir=self.sessions)
+        cache = os.path.join(session, "cache")
+        with self._lock:
+            if os.path.isdir(self.template):
+                shutil.copytree(self.template, cache)
+        os.makedirs(cache, exist_ok=True)
+        os.makedirs(os.path.join(session, "profile"))
+        return session
+
+    def release_session(self, session):
+        """
+        Promote the disk cache of a quit browser to the cache template, and remove its session directory.
+            :param session: path of the session directory, as returned by create_session
+        """
+        cache = os.path.join(session, "cache")
+        try:
+            if not os.path.isdir(cache):
+                return
+            size = get_directory_size(cache)
+            if size > self.cache_size:
+                logger.info(
+                    f"Discarding the browser cache of {size} bytes, over the cap of {self.cache_size} bytes"
+                )
+                return
+            with self._lock:
+                previous = self.template + ".previous"
+                if os.path.isdir(self.template):
+                    os.rename(self.template, previous)
+                os.rename(cache, self.template)
+                shutil.rmtree(previous, ignore_errors=True)
+        finally:
+            shutil.rmtree(session, ignore_errors=True)
+
+    def remove_stale_sessions(self):
+        """
+        Remove the session directories left over by the browsers which were never released
+        """
+        now = time.time()
+        for name in os.listdir(self.sessions):
+            session = os.path.join(self.sessions, name)
+            if now - os.path.getmtime(session) > STALE_SESSION_AGE:
+                shutil.rmtree(session, ignore_errors=True)
+
+    def get_chrome_arguments(self, session):
+        """
+        Get the Chrome arguments to use the session directory.
+            :param session: path of the session directory
+            :returns: List of arguments
+        """
+        return [
+            "--user-data-dir={}".format(os.path.join(session, "profile")),
+            "--disk-cache-dir={}".format(os.path.join(session, "cache")),
+            "--disk-cache-size={}".format(self.cache_size),
+        ]
+
+    def get_firefox_preferences(self, session):
+        """
+        Get the Firefox preferences to use the disk cache of the session directory.
+        geckodriver creates a fresh profile for every browser.
+            :param session: path of the session directory
+            :returns: Dict of the preferences
+        """
+        return {
+            "browser.cache.disk.enable": True,
+            "browser.cache.disk.parent_directory": os.path.join(session, "cache"),
+            "browser.cache.disk.smart_size.enabled": False,
+            "browser.cache.disk.capacity": self.cache_size // 1024,
+        }
+
+
+def get_directory_size(path):
+    """
+    Get the total size of the files within the directory
+        :param path: path of the directory
+        :returns: Int size in bytes
+    """
+    size = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    return size
@@ -16,15 +16,105 @@
 
 import re
 from collections import namedtuple
-from time import sleep
 
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.action_chains import ActionChains as action_chains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from ..profiler import COMPONENT_PROFILER
+from ..utils import get_navigation_generation, suppress_implicit_wait
+from ..wait_engine import WAIT_ENGINE
+
 DEFAULT_TIMEOUT = 20
+SETTLE_TIMEOUT = 3
+SETTLE_POLL_FREQUENCY = 0.05
+# Finds the first element matching a [by, select] locator, to be embedded in the scripts.
+FIND_ELEMENT_FUNCTION = """
+function findElement(locator) {
+    var by = locator[0];
+    var select = locator[1];
+    if (by === "css selector") {
+        return document.querySelector(select);
+    }
+    if (by === "xpath") {
+        return document.evaluate(
+            select, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    if (by === "id") {
+        return document.getElementById(select);
+    }
+    throw new Error("Unsupported locator strategy: " + by);
+}
+"""
+# Checks whether the target element is present, or whether the component is settled without it.
+# arguments: target locator, list of [locator, expected presence]
+SETTLED_PROBE_SCRIPT = FIND_ELEMENT_FUNCTION + """
+if (findElement(arguments[0])) {
+    return "present";
+}
+var conditions = arguments[1];
+for (var i = 0; i < conditions.length; i++) {
+    if (!!findElement(conditions[i][0]) !== conditions[i][1]) {
+        return null;
+    }
+}
+return "settled";
+"""
+# Number of consecutive polls for which the component must be settled, so that a render in progress is not taken as empty.
+SETTLED_POLLS = 2
+# Counts the elements matching a locator within the root element (or the document), without any wait.
+# arguments: by, select, root element
+COUNT_ELEMENTS_SCRIPT = """
+var by = arguments[0];
+var select = arguments[1];
+var root = arguments[2] || document;
+if (by === "css selector") {
+    return root.querySelectorAll(select).length;
+}
+if (by === "xpath") {
+    return document.evaluate(
+        select, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    ).snapshotLength;
+}
+if (by === "id") {
+    return root.querySelectorAll('[id="' + select.replace(/"/g, '\\\\"') + '"]').length;
+}
+throw new Error("Unsupported locator strategy: " + by);
+"""
+# Returns the position of the element, or null while a finite CSS animation / transition
+# is running on the element, its ancestors or its descendants.
+SETTLE_PROBE_SCRIPT = """
+var element = arguments[0] || document.documentElement;
+if (!element.isConnected) {
+    return "detached";
+}
+if (document.getAnimations) {
+    var animations = document.getAnimations();
+    for (var i = 0; i < animations.length; i++) {
+        var animation = animations[i];
+        var target = animation.effect && animation.effect.target;
+        if (!target || animation.playState !== "running") {
+            continue;
+        }
+        if (animation.effect.getTiming().iterations === Infinity) {
+            continue;
+        }
+        if (target === element || target.contains(element) || element.contains(target)) {
+            return null;
+        }
+    }
+}
+var rect = element.getBoundingClientRect();
+return [rect.left, rect.top, rect.width, rect.height].join(",");
+"""
 
 
 class ActionChains(action_chains):
@@ -39,6 +129,36 @@ class ActionChains(action_chains):
             self.w3c_actions.key_action.pause = lambda *a, **k: None
 
 
+class CachedWebElement(WebElement):
+    """
+    Purpose:
+    A web element handle cached by a component.
+    If the element went stale, e.g. because the component was re-rendered, it is located again once and the command is retried.
+    """
+
+    def __init__(self, element, locate):
+        """
+        :param element: The located web element
+        :param locate: Callable which locates the element again
+        """
+        super().__init__(element.parent, element.id, w3c=element._w3c)
+        self._locate = locate
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._locate().id
+            return super()._execute(command, params)
+
+    def unwrap(self):
+        """
+        Get a plain web element for the current handle, which does not recover once stale.
+            :returns: WebElement
+        """
+        return WebElement(self._parent, self._id, w3c=self._w3c)
+
+
 class BaseComponent:
     """
     Purpose:
@@ -52,6 +172,10 @@ class BaseComponent:
     - In a container, there should be only one component of the same type.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        COMPONENT_PROFILER.profile_methods(cls)
+
     def __init__(self, browser, container):
         """
         :param browser: The instance of the selenium webdriver
@@ -59,8 +183,13 @@ class BaseComponent:
         """
         self.elements = dict()
         self.browser = browser
-        self.wait = WebDriverWait(self.browser, DEFAULT_TIMEOUT)
+        self.wait = WAIT_ENGINE.create_wait(self.browser, DEFAULT_TIMEOUT, self)
         self.elements["container"] = container
+        # {key: {indicator key: expected presence}}, the state in which the component is rendered without the key elements.
+        # get_elements & get_child_elements return an empty list as soon as the state is reached instead of waiting for the timeout.
+        self.settled_when = dict()
+        # {(by, select): (navigation generation, CachedWebElement)}
+        self._element_cache = dict()
 
     def get_clear_text(self, web_element):
         """
@@ -74,12 +203,39 @@ class BaseComponent:
         """
         Get the web-element.
 
-        Note: There is a wait in get_element.
+        Note: There is a wait in get_element, the first time the element is located.
+        The element is then reused until it goes stale or the browser navigates to another page.
             :param key: The key of the element mentioned in self.elements
             :returns: element The element we are looking for by key
         """
         element = self.elements[key]
-        return self._get_element(element.by, element.select)
+        locator = (element.by, element.select)
+        generation = get_navigation_generation(self.browser)
+        cached = self._element_cache.get(locator)
+        if cached and cached[0] == generation:
+            return cached[1]
+        return self._cache_element(
+            locator, self._get_element(element.by, element.select)
+        )
+
+    def invalidate_element_cache(self):
+        """
+        Forget the cached web elements of the component, so that they are located again on the next access.
+        """
+        self._element_cache.clear()
+
+    def _cache_element(self, locator, element):
+        """
+        Cache the located web element for the locator.
+            :param locator: Tuple of the locator (by, select)
+            :param element: The located web element
+            :returns: The web element to use, wrapped in CachedWebElement if it can be cached
+        """
+        if not isinstance(element, WebElement):
+            return element
+        cached = CachedWebElement(element, lambda: self._get_element(*locator))
+        self._element_cache[locator] = (get_navigation_generation(self.browser), cached)
+        return cached
 
     def get_elements(self, key):
         """
@@ -90,7 +246,8 @@ class BaseComponent:
             :returns: list of elements we are searching for by key, or an empty list
         """
         try:
-            self.wait_for(key)
+            if not self.wait_for_elements(key):
+                return list()
             element = self.elements[key]
             return self._get_elements(element.by, element.select)
         except:
@@ -120,12 +277,47 @@ class BaseComponent:
             :returns: list The child elements of the element searched by key
         """
         try:
-            self.wait_for(key)
+            if not self.wait_for_elements(key):
+                return list()
             element = self.elements[key]
             return self._get_child_elements(element.by, element.select)
         except:
             return list()
 
+    def wait_for_elements(self, key):
+        """
+        Wait for the web elements to be present, or for the component to be settled without them as declared in self.settled_when.
+        Raises TimeoutException if neither happens.
+            :param key: The key of the element mentioned in self.elements
+            :returns: Bool True if the elements are present, False if the component is settled without them
+        """
+        conditions = self.settled_when.get(key)
+        if not conditions:
+            self.wait_for(key)
+            return True
+        target = list(self.elements[key])
+        indicators = [
+            [list(self.elements[indicator]), expected]
+            for indicator, expected in conditions.items()
+        ]
+        settled_polls = [0]
+
+        def _present_or_settled(browser):
+            state = browser.execute_script(SETTLED_PROBE_SCRIPT, target, indicators)
+            if state == "present":
+                return state
+            settled_polls[0] = settled_polls[0] + 1 if state == "settled" else 0
+            return settled_polls[0] >= SETTLED_POLLS and state
+
+        msg = "{} element is not present and the component is not settled".format(key)
+        try:
+            return self.wait_for(_present_or_settled, msg) == "present"
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            self.wait_for(key)
+            return True
+
     def get_tuple(self, key):
         """
         get the locator of the element in a tuple form.
@@ -134,6 +326,41 @@ class BaseComponent:
         """
         return self.elements[key].by, self.elements[key].select
 
+    def count_now(self, key, within=None):
+        """
+        Count the web elements present right now, without any explicit or implicit wait.
+            :param key: The key of the element mentioned in self.elements
+            :param within: The web element to search in. The whole page if not provided.
+            :returns: Int the number of the elements
+        """
+        return self._count_now(self.elements[key], within)
+
+    def exists_now(self, key, within=None):
+        """
+        Check whether the web element is present right now, without any explicit or implicit wait.
+            :param key: The key of the element mentioned in self.elements
+            :param within: The web element to search in. The whole page if not provided.
+            :returns: Bool True if the element is present
+        """
+        return self.count_now(key, within) > 0
+
+    def _count_now(self, locator, within=None):
+        """
+        Count the elements matching the locator with a single query.
+            :param locator: Selector of the elements
+            :param within: The web element to search in. The whole page if not provided.
+            :returns: Int the number of the elements
+        """
+        try:
+            return self.browser.execute_script(
+                COUNT_ELEMENTS_SCRIPT, locator.by, locator.select, within
+            )
+        except WebDriverException:
+            with suppress_implicit_wait(self.browser):
+                return len(
+                    (within or self.browser).find_elements(locator.by, locator.select)
+                )
+
     def wait_for(self, key, msg=None, timeout=None):
         """
         if key in element, Wait for an web element to be visible. Raises TimeoutException if the element not found.
@@ -144,7 +371,7 @@ class BaseComponent:
             :param timeout: The amount of time specified to wait for the wait function
         """
         if timeout:
-            wait = WebDriverWait(self.browser, timeout)
+            wait = WAIT_ENGINE.create_wait(self.browser, timeout, self)
         else:
             wait = self.wait
         if key in self.elements:
@@ -191,7 +418,9 @@ class BaseComponent:
     def wait_to_be_stale(self, key, msg=None):
         if not msg:
             msg = "{} element is not stale.".format(key)
-        wait = WebDriverWait(self.browser, DEFAULT_TIMEOUT)
+        if isinstance(key, CachedWebElement):
+            key = key.unwrap()
+        wait = WAIT_ENGINE.create_wait(self.browser, DEFAULT_TIMEOUT, self)
         try:
             wait.until(EC.staleness_of(key), msg)
             return True
@@ -206,8 +435,39 @@ class BaseComponent:
         """
         if not msg:
             msg = "{} element is not clickable".format(key)
-        self.wait.until(EC.element_to_be_clickable(self.get_tuple(key)), msg)
-        sleep(1)
+        element = self.wait.until(EC.element_to_be_clickable(self.get_tuple(key)), msg)
+        self._cache_element(self.get_tuple(key), element)
+        self.wait_for_settle(element)
+
+    def wait_for_settle(self, key=None, timeout=SETTLE_TIMEOUT):
+        """
+        Wait for the animations & transitions of an web element to finish and for its position to be stable.
+        Does not raise if the element does not settle within the timeout.
+            :param key: The key of the element mentioned in self.elements, or a web element. The whole page if not provided.
+            :param timeout: The maximum amount of time to wait for
+            :returns: Bool True if the element settled
+        """
+        element = key
+        if isinstance(key, str):
+            elements = self.browser.find_elements(*self.get_tuple(key))
+            if not elements:
+                return False
+            element = elements[0]
+        positions = []
+
+        def _is_settled(browser):
+            position = browser.execute_script(SETTLE_PROBE_SCRIPT, element)
+            settled = position is not None and positions[-1:] == [position]
+            positions.append(position)
+            return settled
+
+        try:
+            WebDriverWait(
+                self.browser, timeout, poll_frequency=SETTLE_POLL_FREQUENCY
+            ).until(_is_settled)
+            return True
+        except (TimeoutException, WebDriverException):
+            return False
 
     def __getattr__(self, key):
         """
@@ -270,4 +530,7 @@ class BaseComponent:
         return self.container.find_elements(by, select)
 
 
+# The methods shared by all the components, for ex. wait_for & get_element, are recorded under the class of the calling component
+COMPONENT_PROFILER.profile_methods(BaseComponent)
+
 Selector = namedtuple("Selector", ["by", "select"], defaults=[By.CSS_SELECTOR, None])
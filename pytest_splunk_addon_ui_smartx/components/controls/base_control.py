@@ -18,6 +18,13 @@ from selenium.webdriver.common.by import By
 
 from ..base_component import BaseComponent, Selector
 
+# The text of the label itself, without the text of its children.
+LABEL_TEXT_SCRIPT = (
+    "if(arguments[0].hasChildNodes()){var r='';var C=arguments[0].childNodes;"
+    "for(var n=0;n<C.length;n++){if(C[n].nodeType==Node.TEXT_NODE){r+=' '+C[n].nodeValue}}"
+    "return r.trim()}else{return arguments[0].innerText}"
+)
+
 
 class BaseControl(BaseComponent):
     """
@@ -53,6 +60,26 @@ class BaseControl(BaseComponent):
         )
         self.browser = browser
 
+    def value_probe(self):
+        """
+        Describe how the form value of the control is read in a single script by Entity.get_values.
+            :return: Tuple (kind, key of the element mentioned in self.elements), or None if the control has no form value
+        """
+        return None
+
+    def get_form_value(self):
+        """
+        Get the form value of the control, as read by Entity.get_values
+        """
+        return self.get_value()
+
+    def set_form_value(self, value):
+        """
+        Set the form value of the control, as done by Entity.set_values
+            :param value: The value to set
+        """
+        self.set_value(value)
+
     def get_tooltip_text(self):
         self.hover_over_element("tooltip_icon")
         self.wait_for("tooltip_text")
@@ -65,10 +92,5 @@ class BaseControl(BaseComponent):
         """
         get field label value
         """
-        GET_PARENT_ELEMENT = (
-            "if(arguments[0].hasChildNodes()){var r='';var C=arguments[0].childNodes;"
-            "for(var n=0;n<C.length;n++){if(C[n].nodeType==Node.TEXT_NODE){r+=' '+C[n].nodeValue}}"
-            "return r.trim()}else{return arguments[0].innerText}"
-        )
-        parent_text = self.browser.execute_script(GET_PARENT_ELEMENT, self.label_text)
+        parent_text = self.browser.execute_script(LABEL_TEXT_SCRIPT, self.label_text)
         return parent_text
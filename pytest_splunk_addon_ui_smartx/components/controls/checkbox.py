@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
@@ -70,10 +69,10 @@ class Checkbox(BaseControl):
             try:
                 self.wait_to_be_clickable("checkbox")
                 self.checkbox_btn.click()
+                self.wait_for_settle("checkbox")
                 after_toggle = self.is_checked()
                 if before_toggle != after_toggle:
                     return
-                time.sleep(0.25)
             except Exception as e:
                 print(f"Toggle checkbox failed with {e}")
 
@@ -105,6 +104,18 @@ class Checkbox(BaseControl):
         except Exception as e:
             print(f"Uncheck checkbox failed with {e}")
 
+    def value_probe(self):
+        return "checked", "checkbox"
+
+    def get_form_value(self):
+        return self.is_checked()
+
+    def set_form_value(self, value):
+        if value:
+            self.check()
+        else:
+            self.uncheck()
+
     def is_checked(self):
         """
         Returns True if the checkbox is already checked, otherwise False
@@ -19,6 +19,7 @@ from selenium.common.exceptions import ElementClickInterceptedException
 from selenium.webdriver.common.keys import Keys
 
 from ..base_component import Selector
+from ..select_options import find_option, get_options
 from .base_control import BaseControl
 
 
@@ -102,25 +103,24 @@ class MultiSelect(BaseControl):
         self.elements.update(
             {"values": Selector(select=popover_id + ' [data-test="option"]')}
         )
-        for each in self.get_elements("values"):
-            if each.text.strip().lower() == value.lower():
-                try:
-                    each.click()
-                except ElementClickInterceptedException:
-                    self.elements.update(
-                        {
-                            value.lower(): Selector(
-                                select=popover_id
-                                + f' [data-test="option"][data-test-value="{value.lower()}"]'
-                            )
-                        }
-                    )
-                    self.hover_over_element(f"{value.lower()}")
-                    each.click()
-                self.wait_for("input")
-                return True
-        else:
+        option = find_option(self, "values", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        try:
+            option.element.click()
+        except ElementClickInterceptedException:
+            self.elements.update(
+                {
+                    value.lower(): Selector(
+                        select=popover_id
+                        + f' [data-test="option"][data-test-value="{value.lower()}"]'
+                    )
+                }
+            )
+            self.hover_over_element(f"{value.lower()}")
+            option.element.click()
+        self.wait_for("input")
+        return True
 
     def deselect(self, value):
         """
@@ -150,13 +150,27 @@ class MultiSelect(BaseControl):
         """
         return [each.text.strip() for each in self.get_child_elements("selected")]
 
+    def value_probe(self):
+        return "texts", "selected"
+
+    def get_form_value(self):
+        return self.get_values()
+
+    def set_form_value(self, value):
+        selected = self.get_values()
+        for each in selected:
+            if each not in value:
+                self.deselect(each)
+        for each in value:
+            if each not in selected:
+                self.select(each)
+
     def list_of_values(self):
         """
         Get list of possible values to select from dropdown
             :return: List of options within the multi-select dropdown
         """
         self.wait_for("root")
-        list_of_values = []
         self.input.click()
         popover_id = "#" + self.root.get_attribute("data-test-popover-id")
         self.elements.update(
@@ -166,9 +180,7 @@ class MultiSelect(BaseControl):
                 )
             }
         )
-        for each in self.get_elements("values"):
-            list_of_values.append(each.text.strip())
-        return list_of_values
+        return [each.label for each in get_options(self, "values")]
 
     def get_list_count(self):
         """
@@ -191,8 +203,8 @@ class MultiSelect(BaseControl):
                 )
             }
         )
-        for each in self.get_elements("values"):
-            yield each.get_attribute("textContent")
+        for each in get_options(self, "values"):
+            yield each.text
 
     def wait_for_values(self):
         """
@@ -15,6 +15,7 @@
 #
 
 from ..base_component import Selector
+from ..select_options import find_option, get_options
 from .base_control import BaseControl
 
 
@@ -58,12 +59,11 @@ class OAuthSelect(BaseControl):
                 )
             }
         )
-        for each in self.get_elements("values"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                return True
-        else:
+        option = find_option(self, "values", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        return True
 
     def get_value(self):
         """
@@ -82,12 +82,8 @@ class OAuthSelect(BaseControl):
         """
         selected_val = self.get_value()
         self.root.click()
-        first_element = None
-        list_of_values = []
         popover_id = "#" + self.root.get_attribute("data-test-popover-id")
         self.elements.update(
             {"values": Selector(select=popover_id + ' [data-test="option"]')}
         )
-        for each in self.get_elements("values"):
-            list_of_values.append(each.text.strip())
-        return list_of_values
+        return [each.label for each in get_options(self, "values")]
@@ -18,6 +18,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 
 from ..base_component import Selector
+from ..select_options import find_option, get_options
 from .base_control import BaseControl
 
 
@@ -88,12 +89,11 @@ class SingleSelect(BaseControl):
             }
         )
 
-        for each in self.get_elements("values"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                return True
-        else:
+        option = find_option(self, "values", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        return True
 
     def search(self, value, open_dropdown=True):
         """
@@ -182,10 +182,8 @@ class SingleSelect(BaseControl):
                     )
                 }
             )
-        for each in self.get_elements("values"):
-            yield each.get_attribute(
-                "data-test-current-value-option"
-            ) or each.get_attribute("textContent")
+        for each in get_options(self, "values"):
+            yield each.text
 
     def get_value(self):
         """
@@ -210,6 +208,14 @@ class SingleSelect(BaseControl):
             else:
                 return False
 
+    def value_probe(self):
+        if self.allow_new_values:
+            return "value", "selected"
+        return "select", "root"
+
+    def set_form_value(self, value):
+        self.select(value)
+
     def cancel_selected_value(self):
         """
         Cancels the currently selected value in the SingleSelect
@@ -229,8 +235,7 @@ class SingleSelect(BaseControl):
         selected_val = self.get_value()
         self.wait_to_be_clickable("root")
         self.root.click()
-        first_element = None
-        list_of_values = []
+        first_value = None
 
         popover_id = "#" + self.root.get_attribute("data-test-popover-id")
         if self.allow_new_values:
@@ -251,17 +256,16 @@ class SingleSelect(BaseControl):
             {"values": Selector(select=popover_id + ' [data-test="option"]')}
         )
 
-        for each in self.get_elements("values"):
-            if not first_element:
-                first_element = each
-            list_of_values.append(each.text.strip())
+        list_of_values = [each.label for each in get_options(self, "values")]
+        if list_of_values:
+            first_value = list_of_values[0]
         if selected_val and not self.allow_new_values:
             # as the dropdown is already open we dont try to open it
             self.select(selected_val, open_dropdown=False)
         elif self.searchable:
             self.input.send_keys(Keys.ESCAPE)
-        elif first_element:
-            self.select(first_element.text.strip(), open_dropdown=False)
+        elif first_value:
+            self.select(first_value, open_dropdown=False)
         self.wait_for("root")
         return list_of_values
 
@@ -28,12 +28,14 @@ class TextArea(TextBox):
     Entity-Component: TextBox
     """
 
-    def __init__(self, browser, container, encrypted=False):
+    def __init__(self, browser, container, encrypted=False, fast_fill=None):
         """
         :param browser: The selenium webdriver
         :param container: The locator of the container where the control is located in.
+        :param encrypted: Whether the value of the textarea is encrypted
+        :param fast_fill: Set the value in one operation instead of typing it. Defaults to TextBox.fast_fill_default
         """
-        super().__init__(browser, container)
+        super().__init__(browser, container, encrypted=encrypted, fast_fill=fast_fill)
         self.elements.update(
             {
                 "input": Selector(
@@ -49,6 +51,9 @@ class TextArea(TextBox):
         """
         return self.input.get_attribute("value")
 
+    def value_probe(self):
+        return "value", "input"
+
     def get_textarea_height(self) -> int:
         """
         Get the height of the displayed textarea.
@@ -60,6 +65,13 @@ class TextArea(TextBox):
         """
         Appends the specified 'value' to an textarea element
         """
+        if self._is_fast_fill():
+            original = self.get_value()
+            if self.fill_value(original + value):
+                return
+            # the script may have set a value which reads back differently (line endings, maxlength),
+            # it is restored so that the typed value is not appended twice
+            self.fill_value(original)
         self.input.send_keys(value)
 
     def screenshot(self) -> str:
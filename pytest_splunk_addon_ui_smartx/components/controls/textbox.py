@@ -15,6 +15,7 @@
 #
 import platform
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 
@@ -22,6 +23,17 @@ from ..base_component import Selector
 from .base_control import BaseControl
 
 os_base = platform.system()
+# Sets the value through the native value setter, so that React notices the change, and fires the input & change events.
+# arguments: input or textarea element, value. Returns the value read back from the element.
+FAST_FILL_SCRIPT = """
+var element = arguments[0];
+var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value").set;
+element.focus();
+setter.call(element, arguments[1]);
+element.dispatchEvent(new Event("input", {bubbles: true}));
+element.dispatchEvent(new Event("change", {bubbles: true}));
+return element.value;
+"""
 
 
 class TextBox(BaseControl):
@@ -29,13 +41,19 @@ class TextBox(BaseControl):
     Entity-Component: TextBox
     """
 
-    def __init__(self, browser, container, encrypted=False):
+    # Default of the fast_fill parameter, set by the --fast-fill option.
+    fast_fill_default = False
+
+    def __init__(self, browser, container, encrypted=False, fast_fill=None):
         """
         :param browser: The selenium webdriver
         :param container: The locator of the container where the control is located in.
+        :param encrypted: Whether the value of the textbox is encrypted
+        :param fast_fill: Set the value in one operation instead of typing it. Defaults to TextBox.fast_fill_default
         """
         super().__init__(browser, container)
         self.encrypted = encrypted
+        self.fast_fill = fast_fill
         self.container = container
         self.browser = browser
         if container.by == "xpath":
@@ -53,6 +71,8 @@ class TextBox(BaseControl):
         """
         # first condition added for safari browser
         self.wait_to_be_clickable("input")
+        if self._is_fast_fill() and self.fill_value(value):
+            return
         if self.browser.capabilities["browserName"] == "Safari":
             self.input.send_keys(Keys.COMMAND)
             self.input.send_keys("a")
@@ -63,6 +83,26 @@ class TextBox(BaseControl):
         self.input.send_keys(Keys.DELETE)
         self.input.send_keys(value)
 
+    def fill_value(self, value):
+        """
+        Set the value of the textbox in one operation, without typing it character by character.
+            :param value: The value to set
+            :return: Bool True if the value was set, False if it has to be typed
+        """
+        try:
+            filled = self.browser.execute_script(FAST_FILL_SCRIPT, self.input, value)
+        except WebDriverException:
+            return False
+        return filled == value
+
+    def value_probe(self):
+        return "value_trim", "input"
+
+    def _is_fast_fill(self):
+        if self.fast_fill is None:
+            return self.fast_fill_default
+        return self.fast_fill
+
     def get_value(self):
         """
         get value from the textbox
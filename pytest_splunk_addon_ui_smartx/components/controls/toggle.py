@@ -70,6 +70,12 @@ class Toggle(BaseControl):
 
         WebDriverWait(self.browser, 10).until(try_click)
 
+    def value_probe(self):
+        return "text", "selected"
+
+    def set_form_value(self, value):
+        self.select(value)
+
     def get_value(self):
         """
         Returns the value of the toggle element
@@ -14,8 +14,8 @@
 # limitations under the License.
 #
 
-import time
 from .base_component import BaseComponent, Selector
+from .select_options import find_option, get_options
 from selenium.common.exceptions import ElementClickInterceptedException
 
 
@@ -56,12 +56,11 @@ class Dropdown(BaseComponent):
                 "page_list": Selector(select=popover_id + ' [data-test="label"]'),
             }
         )
-        for each in self.get_elements("page_list"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                return True
-        else:
+        option = find_option(self, "page_list", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        return True
 
     def get_value(self):
         """
@@ -91,12 +90,11 @@ class Dropdown(BaseComponent):
             }
         )
 
-        for each in self.get_elements("values"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                return True
-        else:
+        option = find_option(self, "values", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        return True
 
     def select_nested(self, values: list):
         """
@@ -111,26 +109,24 @@ class Dropdown(BaseComponent):
         popoverid = "#" + self.root.get_attribute("data-test-popover-id")
         dropdown_selector = ' [data-test="item"] [data-test="label"]'
         for value in values:
-            found = False
             self.elements.update(
-                {"dropdown_options": Selector(select=popoverid + dropdown_selector)}
+                {
+                    "dropdown_options": Selector(select=popoverid + dropdown_selector),
+                    "popover": Selector(select=popoverid),
+                }
             )
-            for each in self.get_elements("dropdown_options"):
-                if each.text.strip().lower() == value.lower():
-                    found = True
-                    try:
-                        each.click()
-                    except ElementClickInterceptedException:
-                        self.hover_over_element("root")  # avoid tooltip interception
-                        each.click()
-                    time.sleep(
-                        1
-                    )  # sleep here prevents broken animation resulting in unclicable button
-                    break
-            if not found:
+            option = find_option(self, "dropdown_options", value)
+            if option is None:
                 raise ValueError(
-                    f"{value} not found in select list. Values found {[_.text.strip().lower() for _ in self.get_elements('dropdown_options')]}"
+                    f"{value} not found in select list. Values found {[_.label.lower() for _ in get_options(self, 'dropdown_options')]}"
                 )
+            try:
+                option.element.click()
+            except ElementClickInterceptedException:
+                self.hover_over_element("root")  # avoid tooltip interception
+                option.element.click()
+            # wait for the animation, otherwise the next button is not clickable
+            self.wait_for_settle("popover")
         return True
 
     def select_input_type(self, value, open_dropdown=True):
@@ -151,12 +147,11 @@ class Dropdown(BaseComponent):
                 ),
             }
         )
-        for each in self.get_elements("type_filter_list"):
-            if each.text.strip().lower() == value.lower():
-                each.click()
-                return True
-        else:
+        option = find_option(self, "type_filter_list", value)
+        if option is None:
             raise ValueError("{} not found in select list".format(value))
+        option.element.click()
+        return True
 
     def get_inputs_list(self):
         """
@@ -171,7 +166,7 @@ class Dropdown(BaseComponent):
                 "type_list": Selector(select=popover_id + ' [data-test="item"]'),
             }
         )
-        return [each.text.strip() for each in self.get_elements("type_list")]
+        return [each.label for each in get_options(self, "type_list")]
 
     def get_pagination_list(self):
         """
@@ -186,7 +181,7 @@ class Dropdown(BaseComponent):
                 "page_list": Selector(select=popover_id + ' [data-test="label"]'),
             }
         )
-        return [each.text.strip() for each in self.get_elements("page_list")]
+        return [each.label for each in get_options(self, "page_list")]
 
     def get_input_type_list(self):
         """
@@ -203,7 +198,10 @@ class Dropdown(BaseComponent):
                 ),
             }
         )
-        return [each.text.strip() for each in self.get_elements("type_filter_list")]
+        return [each.label for each in get_options(self, "type_filter_list")]
 
     def wait_to_be_stale(self, msg=None):
-        return super().wait_to_be_stale(key=self.get_element("root"), msg=msg)
+        root = self.elements["root"]
+        return super().wait_to_be_stale(
+            key=self._get_element(root.by, root.select), msg=msg
+        )
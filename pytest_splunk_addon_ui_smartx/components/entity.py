@@ -13,18 +13,135 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import Union
+from enum import Enum, auto
+from typing import NamedTuple, Union
 
 import selenium.common
 from selenium.webdriver.common.by import By
 
-from .base_component import BaseComponent, Selector
+from .base_component import (
+    DEFAULT_TIMEOUT,
+    FIND_ELEMENT_FUNCTION,
+    BaseComponent,
+    Selector,
+)
+from .controls.base_control import BaseControl
 from .controls.button import Button
 from .controls.message import Message
 from .dropdown import Dropdown
 
 import warnings
 
+# Watches the save button of a single page entity, to know that the save was submitted once it is enabled again.
+# arguments: save button & loading spinner locators. Returns whether the save button was found.
+SAVE_WATCH_SCRIPT = FIND_ELEMENT_FUNCTION + """
+var save = findElement(arguments[0]);
+var spinner = arguments[1];
+if (!save) {
+    return false;
+}
+if (save.__uccSmartxSaveObserver) {
+    save.__uccSmartxSaveObserver.disconnect();
+}
+save.__uccSmartxSaveBusy = false;
+var observer = new MutationObserver(function () {
+    if (save.disabled || findElement(spinner)) {
+        save.__uccSmartxSaveBusy = true;
+        observer.disconnect();
+    }
+});
+observer.observe(document.body, {attributes: true, childList: true, subtree: true});
+save.__uccSmartxSaveObserver = observer;
+return true;
+"""
+# Checks everything which can happen after clicking on save in a single round trip.
+# arguments: error message, warning message, entity container, loading spinner & save button locators
+SAVE_OUTCOME_PROBE_SCRIPT = FIND_ELEMENT_FUNCTION + """
+function getText(locator) {
+    var element = findElement(locator);
+    return element ? element.innerText.trim() : "";
+}
+var save = findElement(arguments[4]);
+return {
+    error: getText(arguments[0]),
+    warning: getText(arguments[1]),
+    container: !!findElement(arguments[2]),
+    spinner: !!findElement(arguments[3]),
+    submitted: !!save && save.__uccSmartxSaveBusy === true && !save.disabled
+};
+"""
+# Reads the form values of all the controls of an entity in a single round trip.
+# arguments: list of [control name, value kind, locator]. Returns {control name: value}, null for an absent control.
+FORM_VALUES_SCRIPT = FIND_ELEMENT_FUNCTION + """
+function findElements(locator) {
+    if (locator[0] === "css selector") {
+        return Array.prototype.slice.call(document.querySelectorAll(locator[1]));
+    }
+    if (locator[0] === "xpath") {
+        var result = document.evaluate(
+            locator[1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        var elements = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            elements.push(result.snapshotItem(i));
+        }
+        return elements;
+    }
+    var element = findElement(locator);
+    return element ? [element] : [];
+}
+function readValue(kind, locator) {
+    if (kind === "texts") {
+        return findElements(locator).map(function (each) {
+            return each.innerText.trim();
+        });
+    }
+    var element = findElement(locator);
+    if (!element) {
+        return null;
+    }
+    if (kind === "value") {
+        return element.value;
+    }
+    if (kind === "value_trim") {
+        return element.value.trim();
+    }
+    if (kind === "checked") {
+        return element.getAttribute("data-test-selected") === "true";
+    }
+    if (kind === "text") {
+        return element.innerText.trim();
+    }
+    if (kind === "select") {
+        if (element.getAttribute("data-test-loading") !== "false" || !element.getAttribute("data-test-value")) {
+            return false;
+        }
+        var label = element.querySelector('[data-test="label"]');
+        return label ? label.innerText.trim() : element.getAttribute("label");
+    }
+    throw new Error("Unsupported value kind: " + kind);
+}
+var values = {};
+var controls = arguments[0];
+for (var i = 0; i < controls.length; i++) {
+    values[controls[i][0]] = readValue(controls[i][1], controls[i][2]);
+}
+return values;
+"""
+
+
+class SaveStatus(Enum):
+    ERROR = auto()
+    WARNING = auto()
+    CLOSED = auto()
+    SAVED = auto()
+    TIMEOUT = auto()
+
+
+class SaveOutcome(NamedTuple):
+    status: SaveStatus
+    message: str = ""
+
 
 class Entity(BaseComponent):
     """
@@ -42,6 +159,7 @@ class Entity(BaseComponent):
         """
         self.browser = browser
         super().__init__(browser, container)
+        self.is_single_page = is_single_page
 
         # Controls
         self.save_btn = Button(browser, Selector(select=container.select + " .saveBtn"))
@@ -49,8 +167,6 @@ class Entity(BaseComponent):
             browser,
             Selector(select=container.select + ' button[data-test="wait-spinner"]'),
         )
-        if not is_single_page:
-            self.add_btn = add_btn
         self.msg_error = Message(
             browser, Selector(select='div[data-test-type="error"]')
         )
@@ -69,10 +185,65 @@ class Entity(BaseComponent):
         self.close_btn = Button(
             browser, Selector(select=container.select + ' button[data-test="close"]')
         )
-        if self.add_btn == None:
-            self.create_new_input = Dropdown(
-                browser, Selector(by=By.ID, select="addInputBtn")
+        if not is_single_page:
+            self.add_btn = add_btn
+            if self.add_btn == None:
+                self.create_new_input = Dropdown(
+                    browser, Selector(by=By.ID, select="addInputBtn")
+                )
+
+    def get_controls(self):
+        """
+        Discover the controls of the entity which have a form value
+            :return: Dict {attribute name: control}
+        """
+        return {
+            name: control
+            for name, control in vars(self).items()
+            if isinstance(control, BaseControl) and control.value_probe() is not None
+        }
+
+    def get_values(self, names=None):
+        """
+        Get the values of the controls of the entity in a single round trip.
+            :param names: The attribute names of the controls to read. All the controls with a form value if not provided.
+            :return: Dict {attribute name: value}. The value is None for a control which is not displayed.
+        """
+        controls = self.get_controls()
+        if names is not None:
+            controls = {name: controls[name] for name in names}
+        probes = list()
+        for name, control in controls.items():
+            kind, key = control.value_probe()
+            probes.append([name, kind, list(control.elements[key])])
+        try:
+            return self.browser.execute_script(FORM_VALUES_SCRIPT, probes)
+        except selenium.common.exceptions.WebDriverException:
+            return {
+                name: control.get_form_value() for name, control in controls.items()
+            }
+
+    def set_values(self, values):
+        """
+        Set the values of the controls of the entity. Only the controls whose value differs are updated.
+            :param values: Dict {attribute name: value}
+            :return: List of the attribute names of the updated controls
+        """
+        controls = self.get_controls()
+        unknown = set(values) - set(controls)
+        if unknown:
+            raise ValueError(
+                "Controls not found in the entity: {}".format(
+                    ", ".join(sorted(unknown))
+                )
             )
+        current = self.get_values(list(values))
+        changed = list()
+        for name, value in values.items():
+            if current.get(name) != value:
+                controls[name].set_form_value(value)
+                changed.append(name)
+        return changed
 
     def get_warning(self):
         """
@@ -87,6 +258,14 @@ class Entity(BaseComponent):
         return self.msg_error.get_msg()
 
     def is_error_closed(self):
+        """
+        Check whether the error message is not displayed anymore. Does not wait for the error message.
+            :return: Bool True if there is no error message
+        """
+        try:
+            return not self._probe_save_outcome()["error"]
+        except selenium.common.exceptions.WebDriverException:
+            pass
         try:
             self.msg_error.get_msg()
             return False
@@ -105,7 +284,79 @@ class Entity(BaseComponent):
             stacklevel=2,
         )
         self.save_btn.wait_to_be_clickable()
+        watched = not self.is_single_page or self.watch_save()
         self.save_btn.click()
+        if not watched:
+            return self._get_save_result_by_messages()
+        try:
+            outcome = self.wait_for_save_outcome()
+        except selenium.common.exceptions.WebDriverException:
+            return self._get_save_result_by_messages()
+        if outcome.status in (SaveStatus.ERROR, SaveStatus.WARNING):
+            return outcome.message
+        if outcome.status == SaveStatus.TIMEOUT:
+            self.loading.wait_loading()
+        return True
+
+    def watch_save(self):
+        """
+        Start watching the save button of a single page entity, before clicking on it.
+        The save is submitted once the save button has been disabled or the spinner shown, and the button is enabled again.
+            :return: Bool True if the save button is watched
+        """
+        try:
+            return self.browser.execute_script(
+                SAVE_WATCH_SCRIPT,
+                list(self.save_btn.elements["container"]),
+                list(self.loading.elements["container"]),
+            )
+        except selenium.common.exceptions.WebDriverException:
+            return False
+
+    def wait_for_save_outcome(self, timeout=DEFAULT_TIMEOUT):
+        """
+        Wait for the first outcome of the save: an error message, a warning message, the entity getting closed,
+        or, for the single page entities watched with watch_save, the save button enabled again after the submission.
+            :param timeout: The maximum amount of time to wait for
+            :return: SaveOutcome, with the status TIMEOUT if none of the outcomes happened
+        """
+
+        def _get_outcome(browser):
+            probe = self._probe_save_outcome()
+            if probe["error"]:
+                return SaveOutcome(SaveStatus.ERROR, probe["error"])
+            if probe["warning"]:
+                return SaveOutcome(SaveStatus.WARNING, probe["warning"])
+            if not probe["container"]:
+                return SaveOutcome(SaveStatus.CLOSED)
+            if self.is_single_page and probe["submitted"] and not probe["spinner"]:
+                return SaveOutcome(SaveStatus.SAVED)
+            return False
+
+        try:
+            return self.wait_for(_get_outcome, "No outcome of the save", timeout)
+        except selenium.common.exceptions.TimeoutException:
+            return SaveOutcome(SaveStatus.TIMEOUT)
+
+    def _probe_save_outcome(self):
+        """
+        Get the error & warning messages, the presence of the entity & loading spinner and whether the watched save was submitted.
+            :return: dict with the keys error, warning, container, spinner, submitted
+        """
+        return self.browser.execute_script(
+            SAVE_OUTCOME_PROBE_SCRIPT,
+            list(self.msg_error.elements["msg_text"]),
+            list(self.msg_warning.elements["msg_text"]),
+            list(self.elements["container"]),
+            list(self.loading.elements["container"]),
+            list(self.save_btn.elements["container"]),
+        )
+
+    def _get_save_result_by_messages(self):
+        """
+        Wait for the error message and then for the warning message. Used if the outcome can not be probed with a script.
+            :return: Str the error or warning message, True if there was none
+        """
         try:
             error_message = self.get_error()
         except selenium.common.exceptions.TimeoutException:
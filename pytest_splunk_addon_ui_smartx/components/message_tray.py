@@ -58,6 +58,7 @@ class MessageTray(BaseComponent):
                 ),
             }
         )
+        self.settled_when["message_row"] = {"no_msgs": True}
 
     def open(self):
         self.wait_for("message_tray_dropdown")
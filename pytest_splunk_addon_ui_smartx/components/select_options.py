@@ -0,0 +1,185 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from .base_component import SETTLED_POLLS
+
+# Finds the scrollable menu of the options, within their popover.
+OPTIONS_MENU_FUNCTION = """
+function getMenu(options) {
+    var popover = options.length ? options[0].closest('[data-test="popover"]') : null;
+    if (!popover) {
+        return null;
+    }
+    var menu = options[options.length - 1].parentElement;
+    while (menu !== popover && menu.scrollHeight <= menu.clientHeight) {
+        menu = menu.parentElement;
+    }
+    return menu.scrollHeight > menu.clientHeight ? menu : null;
+}
+"""
+# Reads all the options of an open popover in a single round trip, without scrolling.
+# snapshot.more tells whether the menu can be scrolled further, to a virtualized or scroll-loaded batch.
+# arguments: options css selector
+OPTIONS_SNAPSHOT_SCRIPT = OPTIONS_MENU_FUNCTION + """
+var options = document.querySelectorAll(arguments[0]);
+var snapshot = {options: [], more: false};
+for (var i = 0; i < options.length; i++) {
+    var option = options[i];
+    snapshot.options.push({
+        element: option,
+        label: option.innerText.trim(),
+        text: option.getAttribute("data-test-current-value-option") || option.textContent,
+        value: option.getAttribute("data-test-value"),
+        disabled: option.disabled === true
+            || option.getAttribute("aria-disabled") === "true"
+            || option.getAttribute("data-test-disabled") === "true",
+        selected: option.getAttribute("data-test-selected") === "true"
+            || option.getAttribute("aria-selected") === "true"
+    });
+}
+var menu = getMenu(options);
+snapshot.more = !!menu && menu.scrollTop + menu.clientHeight < menu.scrollHeight;
+return snapshot;
+"""
+# Scrolls the menu of the options down by a page. Returns whether the menu scrolled.
+# arguments: options css selector
+OPTIONS_SCROLL_SCRIPT = OPTIONS_MENU_FUNCTION + """
+var menu = getMenu(document.querySelectorAll(arguments[0]));
+if (!menu) {
+    return false;
+}
+var top = menu.scrollTop;
+menu.scrollTop = top + menu.clientHeight;
+return menu.scrollTop > top;
+"""
+
+# Seconds to wait for the next batch of options to render or load after the menu scrolled.
+OPTIONS_BATCH_TIMEOUT = 2
+
+OptionSnapshot = namedtuple(
+    "OptionSnapshot", ["element", "label", "text", "value", "disabled", "selected"]
+)
+
+
+def get_options(component, key, match=None):
+    """
+    Get the options of an open select-like popover, reading all of them with a single script per batch.
+    Virtualized and scroll-loaded lists are read batch by batch, by scrolling their menu, until no new option shows up.
+    The menu is only scrolled after a batch is read and did not contain the match,
+    so the element of the matched option is the one rendered, ready to be clicked.
+    The lists render or load the next batch asynchronously, so it is polled for up to OPTIONS_BATCH_TIMEOUT after a scroll.
+
+    Note: There is a wait for the first option.
+        :param component: The component, which has the options locator in its elements
+        :param key: The key of the options mentioned in component.elements
+        :param match: Stop reading at the option with this label (case insensitive)
+        :returns: List of OptionSnapshot
+    """
+    try:
+        component.wait_for(key)
+    except TimeoutException:
+        return list()
+    locator = component.elements[key]
+    if locator.by != By.CSS_SELECTOR:
+        return _get_options_by_elements(component, key)
+    options = list()
+    seen = set()
+    settled_polls = [0]
+
+    def _next_batch(browser):
+        snapshot = browser.execute_script(OPTIONS_SNAPSHOT_SCRIPT, locator.select)
+        if any(
+            (each["value"], each["label"]) not in seen for each in snapshot["options"]
+        ):
+            return snapshot
+        # the end of the list, once the menu can not be scrolled further for consecutive polls
+        settled_polls[0] = 0 if snapshot["more"] else settled_polls[0] + 1
+        return settled_polls[0] >= SETTLED_POLLS and snapshot
+
+    try:
+        snapshot = component.browser.execute_script(
+            OPTIONS_SNAPSHOT_SCRIPT, locator.select
+        )
+        while True:
+            # the batches of a virtualized list overlap, the options read by a previous batch are skipped
+            new_options = [
+                OptionSnapshot(**each)
+                for each in snapshot["options"]
+                if (each["value"], each["label"]) not in seen
+            ]
+            for each in new_options:
+                options.append(each)
+                if match is not None and _is_match(each, match):
+                    return options
+            seen.update((each.value, each.label) for each in new_options)
+            if not snapshot["more"] or not component.browser.execute_script(
+                OPTIONS_SCROLL_SCRIPT, locator.select
+            ):
+                return options
+            settled_polls[0] = 0
+            try:
+                snapshot = component.wait_for(
+                    _next_batch,
+                    "No new option after scrolling the menu",
+                    OPTIONS_BATCH_TIMEOUT,
+                )
+            except TimeoutException:
+                return options
+    except WebDriverException:
+        return _get_options_by_elements(component, key)
+
+
+def find_option(component, key, label):
+    """
+    Find the option with the label (case insensitive) in an open select-like popover.
+        :param component: The component, which has the options locator in its elements
+        :param key: The key of the options mentioned in component.elements
+        :param label: The label of the option
+        :returns: OptionSnapshot, or None if the option is not found
+    """
+    for each in get_options(component, key, match=label):
+        if _is_match(each, label):
+            return each
+    return None
+
+
+def _is_match(option, label):
+    return option.label.lower() == label.lower()
+
+
+def _get_options_by_elements(component, key):
+    """
+    Read the options element by element, used if the script can not be executed.
+        :param component: The component, which has the options locator in its elements
+        :param key: The key of the options mentioned in component.elements
+        :returns: List of OptionSnapshot
+    """
+    return [
+        OptionSnapshot(
+            element=each,
+            label=each.text.strip(),
+            text=each.get_attribute("data-test-current-value-option")
+            or each.get_attribute("textContent"),
+            value=each.get_attribute("data-test-value"),
+            disabled=each.get_attribute("aria-disabled") == "true",
+            selected=each.get_attribute("data-test-selected") == "true",
+        )
+        for each in component.get_elements(key)
+    ]
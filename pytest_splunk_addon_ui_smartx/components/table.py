@@ -16,7 +16,7 @@
 
 import copy
 import re
-import time
+from collections import namedtuple
 from contextlib import contextmanager
 
 from selenium import webdriver
@@ -27,6 +27,91 @@ from selenium.webdriver.common.keys import Keys
 from .base_component import BaseComponent, Selector
 from .dropdown import Dropdown
 
+HEADER_TEXT_SCRIPT = "return arguments[0].innerText.trim();"
+# Render generation of the table body. A MutationObserver increments the counter on every change,
+# and a new token is issued when the body gets replaced or the page is reloaded.
+# The page globals are reset by a reload, so the tokens are prefixed with an id of the page load.
+# arguments: table key, table body selector
+TABLE_GENERATION_FUNCTION = """
+function tableGeneration(key, bodySelector) {
+    var body = document.querySelector(bodySelector);
+    if (!body) {
+        return null;
+    }
+    if (!window.__smartxPageId) {
+        window.__smartxPageId = (performance.timeOrigin || Date.now())
+            + "-" + Math.random().toString(36).slice(2);
+    }
+    var tables = window.__smartxTables = window.__smartxTables || {};
+    var state = tables[key];
+    if (!state || state.body !== body) {
+        window.__smartxTableSeq = (window.__smartxTableSeq || 0) + 1;
+        state = tables[key] = {
+            body: body,
+            token: window.__smartxPageId + "." + window.__smartxTableSeq,
+            changes: 0
+        };
+        new MutationObserver(function () {
+            state.changes++;
+        }).observe(body, {childList: true, subtree: true, characterData: true});
+    }
+    return state.token + ":" + state.changes;
+}
+"""
+TABLE_GENERATION_SCRIPT = (
+    TABLE_GENERATION_FUNCTION + "return tableGeneration(arguments[0], arguments[1]);"
+)
+# Extracts the whole table in a single round trip.
+# arguments: rows selector, header selector, status selector, {action: selector}, table key, table body selector
+TABLE_SNAPSHOT_SCRIPT = TABLE_GENERATION_FUNCTION + """
+var rows = document.querySelectorAll(arguments[0]);
+var headers = document.querySelectorAll(arguments[1]);
+var snapshot = {headers: [], rows: []};
+for (var h = 0; h < headers.length; h++) {
+    snapshot.headers.push(headers[h].innerText.trim());
+}
+for (var r = 0; r < rows.length; r++) {
+    var row = rows[r];
+    var columns = {};
+    var cells = [];
+    var actions = {};
+    var named = row.querySelectorAll('[data-test="cell"][data-column]');
+    for (var c = 0; c < named.length; c++) {
+        var column = named[c].getAttribute("data-column");
+        if (!(column in columns)) {
+            columns[column] = named[c].innerText;
+        }
+    }
+    for (var c = 0; c < row.children.length; c++) {
+        cells.push(row.children[c].innerText);
+    }
+    for (var action in arguments[3]) {
+        actions[action] = row.querySelectorAll(arguments[3][action]).length;
+    }
+    var status = row.querySelector(arguments[2]);
+    snapshot.rows.push({
+        element: row,
+        columns: columns,
+        cells: cells,
+        status: status ? status.innerText : null,
+        actions: actions
+    });
+}
+snapshot.generation = tableGeneration(arguments[4], arguments[5]);
+return snapshot;
+"""
+TableSnapshot = namedtuple("TableSnapshot", ["headers", "rows", "generation"])
+RowSnapshot = namedtuple(
+    "RowSnapshot", ["element", "columns", "cells", "status", "actions"]
+)
+# The snapshot could not be taken or does not match the expected DOM, use the per-element path.
+SNAPSHOT_ERRORS = (
+    exceptions.WebDriverException,
+    KeyError,
+    IndexError,
+)
+TABLE_ACTIONS = ("edit", "clone", "search", "delete")
+
 
 class Table(BaseComponent):
     """
@@ -108,7 +193,10 @@ class Table(BaseComponent):
                 "status_cell": Selector(select='[data-test="status"]'),
             }
         )
+        self.settled_when["rows"] = {"app_listings": True, "waitspinner": False}
         self.wait_for_seconds = wait_for_seconds
+        self._row_index = None
+        self._row_index_generation = None
 
     def get_count_title(self):
         """
@@ -130,9 +218,8 @@ class Table(BaseComponent):
             :return: Generator for Str list The headers in the table
         """
         headers = []
-        GET_PARENT_ELEMENT = "return arguments[0].innerText.trim();"
         for each in self.get_elements("header"):
-            parent_text = self.browser.execute_script(GET_PARENT_ELEMENT, each)
+            parent_text = self.browser.execute_script(HEADER_TEXT_SCRIPT, each)
             headers.append(parent_text)
 
         return headers
@@ -250,6 +337,41 @@ class Table(BaseComponent):
         Get whole table in dictionary form. The row_name will will be the key and all header:values will be it's value. {row_1 : {header_1: value_1, . . .}, . . .}
             :return: dict The data within the table
         """
+        try:
+            snapshot = self.get_snapshot()
+            table = dict()
+            for each_row in snapshot.rows:
+                row_name = self._get_snapshot_value(each_row, "name")
+                table[row_name] = dict()
+                for each_col in snapshot.headers:
+                    each_col = each_col.lower()
+                    if each_col == "actions":
+                        table[row_name][each_col] = ""
+                        if each_row.actions["edit"]:
+                            table[row_name][each_col] = "Edit"
+                        if each_row.actions["clone"]:
+                            table[row_name][each_col] += " | Clone"
+                        if each_row.actions["search"]:
+                            table[row_name][each_col] += " | Search"
+                        if each_row.actions["delete"]:
+                            table[row_name][each_col] += " | Delete"
+                        continue
+                    if each_col == "status":
+                        table[row_name][each_col] = self._get_snapshot_status(each_row)
+                        continue
+                    if each_col:
+                        table[row_name][each_col] = self._get_snapshot_value(
+                            each_row, each_col
+                        )
+            return table
+        except SNAPSHOT_ERRORS:
+            return self._get_table_by_elements()
+
+    def _get_table_by_elements(self):
+        """
+        Get whole table in dictionary form by reading each cell separately. Used if the snapshot can not be taken.
+            :return: dict The data within the table
+        """
 
         table = dict()
         headers = list(self.get_headers())
@@ -261,13 +383,13 @@ class Table(BaseComponent):
                 each_col = each_col.lower()
                 if each_col == "actions":
                     table[row_name][each_col] = ""
-                    if self.edit != None:
+                    if self.exists_now("edit"):
                         table[row_name][each_col] = "Edit"
-                    if self.clone != None:
+                    if self.exists_now("clone"):
                         table[row_name][each_col] += " | Clone"
-                    if self.search != None:
+                    if self.exists_now("search"):
                         table[row_name][each_col] += " | Search"
-                    if self.delete != None:
+                    if self.exists_now("delete"):
                         table[row_name][each_col] += " | Delete"
                     continue
                 if each_col == "status":
@@ -288,6 +410,13 @@ class Table(BaseComponent):
             :param column: column header of the table
             :return: str The value within the cell that we are looking for
         """
+        try:
+            _row = self._get_snapshot_row(self.get_snapshot(), name)
+            if column.lower() == "status":
+                return self._get_snapshot_status(_row)
+            return self._get_snapshot_value(_row, column)
+        except SNAPSHOT_ERRORS:
+            pass
         _row = self._get_row(name)
         if column.lower() == "status":
             return _row.find_element_by_css_selector('[data-test="status"]').text
@@ -299,11 +428,143 @@ class Table(BaseComponent):
             :param column: column header of the table
             :return: List The values within the certain column
         """
+        try:
+            return [
+                self._get_snapshot_value(each_row, column)
+                for each_row in self.get_snapshot().rows
+            ]
+        except SNAPSHOT_ERRORS:
+            pass
         value_list = []
         for each_row in self._get_rows():
             value_list.append(self._get_column_value(each_row, column))
         return value_list
 
+    def get_snapshot(self):
+        """
+        Extract the whole table (headers, cells, status, actions & row elements) in a single JavaScript call.
+        Raises one of SNAPSHOT_ERRORS if the snapshot can not be taken.
+            :return: TableSnapshot
+        """
+        locators = [self.elements[key] for key in ("rows", "header", "status_cell")]
+        locators += [self.elements[action] for action in TABLE_ACTIONS]
+        if any(locator.by != By.CSS_SELECTOR for locator in locators):
+            raise exceptions.InvalidSelectorException(
+                "Table snapshot supports only css selectors"
+            )
+        try:
+            self.wait_for_elements("rows")
+        except exceptions.TimeoutException:
+            pass
+        snapshot = self.browser.execute_script(
+            TABLE_SNAPSHOT_SCRIPT,
+            self.elements["rows"].select,
+            self.elements["header"].select,
+            self.elements["status_cell"].select,
+            {action: self.elements[action].select for action in TABLE_ACTIONS},
+            self.elements["container"].select,
+            self.elements["app_listings"].select,
+        )
+        if not isinstance(snapshot, dict):
+            raise exceptions.JavascriptException(
+                "Unexpected table snapshot: {!r}".format(snapshot)
+            )
+        return TableSnapshot(
+            generation=snapshot.get("generation"),
+            headers=snapshot["headers"],
+            rows=[
+                RowSnapshot(
+                    element=each["element"],
+                    columns=each["columns"],
+                    cells=each["cells"],
+                    status=each["status"],
+                    actions=each["actions"],
+                )
+                for each in snapshot["rows"]
+            ],
+        )
+
+    def get_row_index(self):
+        """
+        Get the index of the rows by their name. The index is built from a single snapshot and reused until the table re-renders.
+        Raises one of SNAPSHOT_ERRORS if the index can not be built.
+            :return: dict {row_name: row element}
+        """
+        if (
+            self._row_index is not None
+            and self._row_index_generation is not None
+            and self._get_render_generation() == self._row_index_generation
+        ):
+            return self._row_index
+        snapshot = self.get_snapshot()
+        row_index = dict()
+        for each_row in snapshot.rows:
+            row_index.setdefault(
+                self._get_snapshot_value(each_row, "name"), each_row.element
+            )
+        self._row_index = row_index
+        self._row_index_generation = snapshot.generation
+        return row_index
+
+    def invalidate_row_index(self):
+        """
+        Drop the row index, it will be built again on the next row lookup.
+        """
+        self._row_index = None
+        self._row_index_generation = None
+
+    def _get_render_generation(self):
+        """
+        Get the render generation of the table body. The generation changes whenever the table body is modified.
+            :return: str The generation token, None if the table body is not present
+        """
+        try:
+            return self.browser.execute_script(
+                TABLE_GENERATION_SCRIPT,
+                self.elements["container"].select,
+                self.elements["app_listings"].select,
+            )
+        except exceptions.WebDriverException:
+            return None
+
+    def _get_snapshot_value(self, row, column):
+        """
+        Get the column value of a row from the snapshot. Resolves the header_mapping same as _get_column_value.
+            :param row: RowSnapshot
+            :param column: the header name of the column
+            :return: str The value of the column
+        """
+        column = column.lower().replace(" ", "_")
+        if column in self.header_mapping:
+            column = self.header_mapping[column]
+        if isinstance(column, int):
+            value = row.cells[column - 1]
+        else:
+            value = row.columns[column]
+        return re.sub(r"\s+", " ", value).strip()
+
+    def _get_snapshot_status(self, row):
+        """
+        Get the status of a row from the snapshot.
+            :param row: RowSnapshot
+            :return: str The status of the row
+        """
+        if row.status is None:
+            raise KeyError("status")
+        return row.status.strip()
+
+    def _get_snapshot_row(self, snapshot, name):
+        """
+        Get the specified row from the snapshot.
+            :param snapshot: TableSnapshot
+            :param name: row name
+            :return: RowSnapshot, or raises a ValueError if not found
+        """
+        for each_row in snapshot.rows:
+            if self._get_snapshot_value(each_row, "name") == name:
+                return each_row
+        raise ValueError("{} row not found in table".format(name))
+
     def get_list_of_actions(self, name):
         """
         Get list of possible actions for a specific row
@@ -312,27 +573,14 @@ class Table(BaseComponent):
         """
         value_list = []
         _row = self._get_row(name)
-        # use `find_elements` over `find_element` to avoid NoSuchElementException exception when
-        # the action isn't present + to verify only 1 icon of the action is present
-        if (
-            len(_row.find_elements(*list(self.elements["edit"]._asdict().values())))
-            == 1
-        ):
+        # count the action icons to avoid waiting for the absent actions + to verify only 1 icon of the action is present
+        if self.count_now("edit", within=_row) == 1:
             value_list.append("Edit")
-        if (
-            len(_row.find_elements(*list(self.elements["clone"]._asdict().values())))
-            == 1
-        ):
+        if self.count_now("clone", within=_row) == 1:
             value_list.append("Clone")
-        if (
-            len(_row.find_elements(*list(self.elements["search"]._asdict().values())))
-            == 1
-        ):
+        if self.count_now("search", within=_row) == 1:
             value_list.append("Search")
-        if (
-            len(_row.find_elements(*list(self.elements["delete"]._asdict().values())))
-            == 1
-        ):
+        if self.count_now("delete", within=_row) == 1:
             value_list.append("Delete")
 
         return value_list
@@ -373,7 +621,7 @@ class Table(BaseComponent):
         # Click on action
         with self.wait_stale():
             _row = self._get_row(name)
-            time.sleep(0.5)
+            self.wait_for_settle(_row)
             _row.find_element(*list(self.elements["delete"]._asdict().values())).click()
 
             self.wait_for("delete_prompt")
@@ -408,6 +656,7 @@ class Table(BaseComponent):
 
     @contextmanager
     def wait_stale(self):
+        self.invalidate_row_index()
         rows = list(self._get_rows())
         col = copy.deepcopy(self.elements["col"])
         col = col._replace(select=col.select.format(column="name"))
@@ -415,6 +664,8 @@ class Table(BaseComponent):
         yield
         if len(rows) > 0 and self.wait_to_be_stale(rows[0]):
             self.wait_to_be_stale(col_element)
+        self.invalidate_row_index()
+        self.invalidate_element_cache()
 
     def clean_filter(self):
         """
@@ -462,6 +713,14 @@ class Table(BaseComponent):
         :param name: row name
             :return: element Gets the row specified within the table, or raises a warning if not found
         """
+        try:
+            row_index = self.get_row_index()
+        except SNAPSHOT_ERRORS:
+            row_index = None
+        if row_index is not None:
+            if name in row_index:
+                return row_index[name]
+            raise ValueError("{} row not found in table".format(name))
         for each_row in self._get_rows():
             if self._get_column_value(each_row, "name") == name:
                 return each_row
@@ -569,11 +828,7 @@ class Table(BaseComponent):
         col = col._replace(select=col.select.format(column=column_selector))
 
         _row = self._get_row(row_name)
-        try:
-            _row.find_element(*list(col._asdict().values()))
-            return True
-        except exceptions.NoSuchElementException:
-            return False
+        return self._count_now(col, within=_row) > 0
 
     def __getattr__(self, key):
         """
@@ -0,0 +1,632 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import functools
+
+import lxml.html
+from cssselect import SelectorError
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPathError
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from .components.base_component import (
+    COUNT_ELEMENTS_SCRIPT,
+    SETTLE_PROBE_SCRIPT,
+    SETTLED_PROBE_SCRIPT,
+)
+from .components.controls.base_control import LABEL_TEXT_SCRIPT
+from .components.controls.textbox import FAST_FILL_SCRIPT
+from .components.entity import (
+    FORM_VALUES_SCRIPT,
+    SAVE_OUTCOME_PROBE_SCRIPT,
+    SAVE_WATCH_SCRIPT,
+)
+from .components.select_options import (
+    OPTIONS_SCROLL_SCRIPT,
+    OPTIONS_SNAPSHOT_SCRIPT,
+)
+from .components.table import (
+    HEADER_TEXT_SCRIPT,
+    TABLE_GENERATION_SCRIPT,
+    TABLE_SNAPSHOT_SCRIPT,
+)
+
+CLICK_SCRIPT = "arguments[0].click()"
+BOOLEAN_ATTRIBUTES = ("checked", "disabled", "readonly", "selected", "hidden")
+KEYS = frozenset(
+    value for name, value in vars(Keys).items() if not name.startswith("_")
+)
+MODIFIER_KEYS = (Keys.CONTROL, Keys.COMMAND)
+# Commands which have no effect on the DOM
+NO_OP_COMMANDS = (
+    Command.IMPLICIT_WAIT,
+    Command.SET_TIMEOUTS,
+    Command.MOUSE_DOWN,
+    Command.MOUSE_UP,
+    Command.SEND_KEYS_TO_ACTIVE_ELEMENT,
+    Command.REFRESH,
+    Command.QUIT,
+    Command.DELETE_ALL_COOKIES,
+    Command.MAXIMIZE_WINDOW,
+    Command.SET_WINDOW_SIZE,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_css(select):
+    """
+    :param select: CSS selector
+    :returns: the compiled lxml CSSSelector, cached
+    """
+    return CSSSelector(select)
+
+
+class DomWebDriver(WebDriver):
+    """
+    WebDriver stand-in backed by an lxml DOM, loaded from the saved HTML of a UCC page.
+    The components can be exercised against it in-process, in milliseconds, without a browser.
+
+    - Elements are found by CSS selector, XPath, ID, name, tag name & class name, with the semantics of the browser:
+      a CSS selector searched within an element is matched against the whole document.
+    - The attributes & the innerText of the elements are read from the DOM, an element is hidden by the hidden attribute,
+      display:none or visibility:hidden on itself or an ancestor.
+    - Typing & clearing change the value attribute of the elements, a click toggles the checkboxes & radio buttons.
+      Anything else a click does on the page is emulated by the hooks registered with on_click.
+    - The scripts of the components are run by their python counterparts,
+      the other scripts raise a JavascriptException, so that the components take their fallback paths.
+
+    The commands are recorded in the commands list, to count the round trips of an operation.
+    """
+
+    def __init__(self, html, url="https://localhost:8000/en-US/app/"):
+        """
+        :param html: The HTML of the page
+        :param url: The current url reported to the components
+        """
+        self.session_id = "dom"
+        self.w3c = False
+        self.capabilities = {"browserName": "chrome"}
+        self.error_handler = ErrorHandler()
+        self._is_remote = False
+        self.url = url
+        self.commands = list()
+        self.mutations = 0
+        self._click_hooks = list()
+        self._scroll_hooks = dict()
+        self._tables = dict()
+        self._table_sequence = 0
+        self.page_loads = 0
+        self._select_all = None
+        self._pointer = None
+        self._save_watch = None
+        self.scripts = {
+            SETTLED_PROBE_SCRIPT: self._settled_probe,
+            COUNT_ELEMENTS_SCRIPT: self._count_elements,
+            SETTLE_PROBE_SCRIPT: self._settle_probe,
+            OPTIONS_SNAPSHOT_SCRIPT: self._options_snapshot,
+            OPTIONS_SCROLL_SCRIPT: self._options_scroll,
+            TABLE_GENERATION_SCRIPT: self._table_generation,
+            TABLE_SNAPSHOT_SCRIPT: self._table_snapshot,
+            FORM_VALUES_SCRIPT: self._form_values,
+            SAVE_OUTCOME_PROBE_SCRIPT: self._save_outcome_probe,
+            SAVE_WATCH_SCRIPT: self._save_watch_script,
+            FAST_FILL_SCRIPT: self._fast_fill,
+            LABEL_TEXT_SCRIPT: self._label_text,
+            HEADER_TEXT_SCRIPT: lambda element: self.inner_text(element),
+            CLICK_SCRIPT: self.click,
+        }
+        self.load(html)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """
+        :param path: path of the saved HTML of the page
+        :returns: DomWebDriver serving the page
+        """
+        with open(path, encoding="utf-8") as page:
+            return cls(page.read(), **kwargs)
+
+    def load(self, html):
+        """
+        Replace the page. The elements of the previous page become stale.
+            :param html: The HTML of the page
+        """
+        self.document = lxml.html.document_fromstring(html)
+        self._nodes = dict()
+        self._ids = dict()
+        self._tables = dict()
+        # the sequence is a page global, only the id of the page load tells the pages apart
+        self._table_sequence = 0
+        self.page_loads += 1
+        self._select_all = None
+        self._pointer = None
+        self._save_watch = None
+        self.mutated()
+
+    def on_click(self, by, select, hook):
+        """
+        Register a hook, called when an element matching the locator, or one of its descendants, is clicked.
+            :param by: The locator strategy, as in selenium.webdriver.common.by.By
+            :param select: The locator
+            :param hook: callable(driver, element) which changes the DOM, element is the matching lxml element
+        """
+        self._click_hooks.append((by, select, hook))
+
+    def on_scroll(self, select, hook, delay=1):
+        """
+        Register a hook emulating a scroll-loaded list of options. The menu of the options can be scrolled while the hook is registered.
+        The next batch loads asynchronously: the hook adds it once the given number of snapshots have been read after the scroll.
+            :param select: The css selector of the options
+            :param hook: callable(driver) which adds the next batch to the DOM, returns whether more batches can be loaded
+            :param delay: The number of the snapshots read before the batch is added
+        """
+        self._scroll_hooks[select] = [hook, delay, None]
+
+    def mutated(self):
+        """
+        Record a change of the DOM. Done by the driver after typing, clearing & clicking.
+        """
+        self.mutations += 1
+
+    @property
+    def round_trips(self):
+        return len(self.commands)
+
+    def reset_counters(self):
+        self.commands = list()
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        params = params or dict()
+        if driver_command in NO_OP_COMMANDS:
+            return {"value": None}
+        if driver_command == Command.MOVE_TO:
+            if params.get("element"):
+                self._pointer = params["element"]
+            return {"value": None}
+        if driver_command == Command.CLICK:
+            if self._pointer is not None:
+                self.click(self._get_node(self._pointer))
+            return {"value": None}
+        if driver_command == Command.GET:
+            self.url = params["url"]
+            return {"value": None}
+        if driver_command == Command.GET_CURRENT_URL:
+            return {"value": self.url}
+        if driver_command == Command.GET_TITLE:
+            return {"value": self.document.findtext(".//title") or ""}
+        if driver_command == Command.EXECUTE_SCRIPT:
+            return {"value": self._execute_script(params["script"], params["args"])}
+        if driver_command in (Command.FIND_ELEMENT, Command.FIND_ELEMENTS):
+            root = self.document
+        elif "id" in params:
+            root = self._get_node(params["id"])
+        else:
+            raise WebDriverException("Unsupported command {}".format(driver_command))
+        handler = getattr(self, "_" + driver_command, None)
+        if handler is None:
+            raise WebDriverException("Unsupported command {}".format(driver_command))
+        return {"value": handler(root, params)}
+
+    # Element registry
+
+    def _get_id(self, node):
+        if node not in self._ids:
+            element_id = str(len(self._ids) + 1)
+            self._ids[node] = element_id
+            self._nodes[element_id] = node
+        return self._ids[node]
+
+    def _get_node(self, element_id):
+        node = self._nodes.get(element_id)
+        if node is None or node.getroottree().getroot() is not self.document:
+            raise StaleElementReferenceException(
+                "Element {} is stale".format(element_id)
+            )
+        return node
+
+    def _wrap(self, node):
+        return self.create_web_element(self._get_id(node))
+
+    def _unwrap(self, value):
+        if isinstance(value, WebElement):
+            return self._get_node(value.id)
+        if isinstance(value, (list, tuple)):
+            return [self._unwrap(each) for each in value]
+        if isinstance(value, dict):
+            return {key: self._unwrap(each) for key, each in value.items()}
+        return value
+
+    def _wrap_result(self, value):
+        if isinstance(value, lxml.html.HtmlElement):
+            return self._wrap(value)
+        if isinstance(value, list):
+            return [self._wrap_result(each) for each in value]
+        if isinstance(value, dict):
+            return {key: self._wrap_result(each) for key, each in value.items()}
+        return value
+
+    # DOM helpers, also meant for the click hooks
+
+    def query(self, root, by, select):
+        """
+        Find the elements matching the locator within the root element
+            :param root: lxml element, or the document
+            :param by: The locator strategy
+            :param select: The locator
+            :returns: List of lxml elements
+        """
+        try:
+            if by == "css selector":
+                return self.select(root, select)
+            if by == "xpath":
+                return [each for each in root.xpath(select) if hasattr(each, "tag")]
+            if by == "id":
+                return root.xpath(".//*[@id=$id]", id=select)
+            if by == "name":
+                return root.xpath(".//*[@name=$name]", name=select)
+            if by == "tag name":
+                return root.xpath(".//" + select)
+            if by == "class name":
+                return self.select(root, "." + select)
+        except (SelectorError, XPathError) as e:
+            raise InvalidSelectorException(str(e))
+        raise InvalidSelectorException("Unsupported locator strategy {}".format(by))
+
+    def query_one(self, root, locator):
+        """
+        :param root: lxml element, or the document
+        :param locator: (by, select)
+        :returns: The first lxml element matching the locator, or None
+        """
+        found = self.query(root, *locator)
+        return found[0] if found else None
+
+    def select(self, root, select):
+        # like querySelectorAll, the whole selector is matched against the document
+        found = compile_css(select)(self.document)
+        if root is self.document:
+            return found
+        return [each for each in found if root in each.iterancestors()]
+
+    def is_displayed(self, node):
+        while node is not None:
+            style = (node.get("style") or "").replace(" ", "")
+            if (
+                node.get("hidden") is not None
+                or "display:none" in style
+                or "visibility:hidden" in style
+                or (node.tag == "input" and node.get("type") == "hidden")
+            ):
+                return False
+            node = node.getparent()
+        return True
+
+    def inner_text(self, node):
+        if not self.is_displayed(node):
+            return ""
+        return " ".join(node.text_content().split())
+
+    def get_value(self, node):
+        if node.tag == "textarea":
+            return node.get("value", node.text or "")
+        return node.get("value", "")
+
+    def set_value(self, node, value):
+        node.set("value", value)
+        self.mutated()
+
+    def click(self, node):
+        """
+        Click on the element: toggle the checkboxes & radio buttons and run the matching click hooks, innermost first.
+            :param node: lxml element
+        """
+        if not self.is_displayed(node):
+            raise ElementNotInteractableException("element not interactable")
+        if node.tag == "input" and node.get("type") in ("checkbox", "radio"):
+            if node.get("checked") is None or node.get("type") == "radio":
+                node.set("checked", "checked")
+            else:
+                del node.attrib["checked"]
+        path = [node] + list(node.iterancestors())
+        calls = list()
+        for by, select, hook in self._click_hooks:
+            matches = [
+                each for each in self.query(self.document, by, select) if each in path
+            ]
+            if matches:
+                target = min(matches, key=path.index)
+                calls.append((path.index(target), target, hook))
+        # like the bubbling of the click event, the hooks of the innermost elements run first
+        for _, target, hook in sorted(calls, key=lambda each: each[0]):
+            hook(self, target)
+        self.mutated()
+
+    # Commands
+
+    def _findElement(self, root, params):
+        found = self.query(root, params["using"], params["value"])
+        if not found:
+            raise NoSuchElementException(
+                "Unable to locate element: {}".format(params["value"])
+            )
+        return self._wrap(found[0])
+
+    def _findElements(self, root, params):
+        return [
+            self._wrap(each)
+            for each in self.query(root, params["using"], params["value"])
+        ]
+
+    _findChildElement = _findElement
+    _findChildElements = _findElements
+
+    def _getElementText(self, node, params):
+        return self.inner_text(node)
+
+    def _getElementAttribute(self, node, params):
+        name = params["name"]
+        if name == "innerText":
+            return self.inner_text(node)
+        if name == "textContent":
+            return node.text_content()
+        if name == "value":
+            return self.get_value(node)
+        if name.lower() in BOOLEAN_ATTRIBUTES:
+            return "true" if node.get(name.lower()) is not None else None
+        return node.get(name)
+
+    def _getElementProperty(self, node, params):
+        return self._getElementAttribute(node, params)
+
+    def _getElementTagName(self, node, params):
+        return node.tag
+
+    def _getElementValueOfCssProperty(self, node, params):
+        for declaration in (node.get("style") or "").split(";"):
+            name, _, value = declaration.partition(":")
+            if name.strip() == params["propertyName"]:
+                return value.strip()
+        return ""
+
+    def _isElementDisplayed(self, node, params):
+        return self.is_displayed(node)
+
+    def _isElementEnabled(self, node, params):
+        return node.get("disabled") is None
+
+    def _isElementSelected(self, node, params):
+        return (
+            node.get("checked") is not None
+            or node.get("selected") is not None
+            or node.get("aria-checked") == "true"
+            or node.get("aria-selected") == "true"
+        )
+
+    def _clickElement(self, node, params):
+        self.click(node)
+
+    def _clearElement(self, node, params):
+        self.set_value(node, "")
+
+    def _sendKeysToElement(self, node, params):
+        value = self.get_value(node)
+        modifier = False
+        for key in params["text"]:
+            if key in MODIFIER_KEYS:
+                modifier = True
+            elif key == Keys.NULL:
+                modifier = False
+            elif modifier and key.lower() == "a":
+                self._select_all = node
+            elif key in (Keys.DELETE, Keys.BACKSPACE):
+                value = "" if self._select_all is node else value[:-1]
+                self._select_all = None
+            elif key not in KEYS:
+                value = key if self._select_all is node else value + key
+                self._select_all = None
+        self.set_value(node, value)
+
+    def _getElementLocationOnceScrolledIntoView(self, node, params):
+        return {"x": 0, "y": 0}
+
+    def _getElementLocation(self, node, params):
+        return {"x": 0, "y": 0}
+
+    def _getElementSize(self, node, params):
+        return {"width": 100, "height": 20}
+
+    # Scripts of the components
+
+    def _execute_script(self, script, args):
+        handler = self.scripts.get(script)
+        if handler is None:
+            raise JavascriptException("Script not supported by the DOM driver")
+        return self._wrap_result(handler(*self._unwrap(args)))
+
+    def _settled_probe(self, target, indicators):
+        if self.query_one(self.document, target) is not None:
+            return "present"
+        for locator, expected in indicators:
+            if (self.query_one(self.document, locator) is not None) != expected:
+                return None
+        return "settled"
+
+    def _count_elements(self, by, select, root=None):
+        return len(self.query(root if root is not None else self.document, by, select))
+
+    def _settle_probe(self, element=None):
+        if element is not None and element.getroottree().getroot() is not self.document:
+            return "detached"
+        return "0,0,100,20"
+
+    def _options_scroll(self, select):
+        scroll = self._scroll_hooks.get(select)
+        if scroll is None or scroll[2] is not None:
+            return False
+        scroll[2] = scroll[1]
+        return True
+
+    def _options_snapshot(self, select):
+        scroll = self._scroll_hooks.get(select)
+        if scroll is not None and scroll[2] is not None:
+            if scroll[2]:
+                scroll[2] -= 1
+            else:
+                scroll[2] = None
+                if not scroll[0](self):
+                    del self._scroll_hooks[select]
+                self.mutated()
+        options = list()
+        for option in self.select(self.document, select):
+            options.append(
+                {
+                    "element": option,
+                    "label": self.inner_text(option),
+                    "text": option.get("data-test-current-value-option")
+                    or option.text_content(),
+                    "value": option.get("data-test-value"),
+                    "disabled": option.get("disabled") is not None
+                    or option.get("aria-disabled") == "true"
+                    or option.get("data-test-disabled") == "true",
+                    "selected": option.get("data-test-selected") == "true"
+                    or option.get("aria-selected") == "true",
+                }
+            )
+        # the menu is scrolled to its end while the next batch loads
+        scroll = self._scroll_hooks.get(select)
+        return {"options": options, "more": scroll is not None and scroll[2] is None}
+
+    def _table_generation(self, key, body_select):
+        body = self.query_one(self.document, ("css selector", body_select))
+        if body is None:
+            return None
+        state = self._tables.get(key)
+        if state is None or state[0] is not body:
+            self._table_sequence += 1
+            state = self._tables[key] = (body, self._table_sequence, self.mutations)
+        return "{}.{}:{}".format(self.page_loads, state[1], self.mutations - state[2])
+
+    def _table_snapshot(self, rows, headers, status, actions, key, body_select):
+        snapshot = {
+            "headers": [
+                self.inner_text(each) for each in self.select(self.document, headers)
+            ],
+            "rows": list(),
+        }
+        for row in self.select(self.document, rows):
+            columns = dict()
+            for cell in self.select(row, '[data-test="cell"][data-column]'):
+                columns.setdefault(cell.get("data-column"), self.inner_text(cell))
+            status_cell = self.query_one(row, ("css selector", status))
+            snapshot["rows"].append(
+                {
+                    "element": row,
+                    "columns": columns,
+                    "cells": [self.inner_text(each) for each in row],
+                    "status": (
+                        self.inner_text(status_cell)
+                        if status_cell is not None
+                        else None
+                    ),
+                    "actions": {
+                        action: len(self.select(row, select))
+                        for action, select in actions.items()
+                    },
+                }
+            )
+        snapshot["generation"] = self._table_generation(key, body_select)
+        return snapshot
+
+    def _form_values(self, controls):
+        values = dict()
+        for name, kind, locator in controls:
+            if kind == "texts":
+                values[name] = [
+                    self.inner_text(each)
+                    for each in self.query(self.document, *locator)
+                ]
+                continue
+            element = self.query_one(self.document, locator)
+            if element is None:
+                values[name] = None
+            elif kind == "value":
+                values[name] = self.get_value(element)
+            elif kind == "value_trim":
+                values[name] = self.get_value(element).strip()
+            elif kind == "checked":
+                values[name] = element.get("data-test-selected") == "true"
+            elif kind == "text":
+                values[name] = self.inner_text(element)
+            elif kind == "select":
+                if element.get("data-test-loading") != "false" or not element.get(
+                    "data-test-value"
+                ):
+                    values[name] = False
+                    continue
+                label = self.query_one(element, ("css selector", '[data-test="label"]'))
+                values[name] = (
+                    self.inner_text(label)
+                    if label is not None
+                    else element.get("label")
+                )
+            else:
+                raise JavascriptException("Unsupported value kind: " + kind)
+        return values
+
+    def _save_watch_script(self, save, spinner):
+        element = self.query_one(self.document, save)
+        if element is None:
+            return False
+        # the DOM changes synchronously, any change after the watch stands for the submission
+        self._save_watch = (element, self.mutations)
+        return True
+
+    def _save_outcome_probe(self, error, warning, container, spinner, save):
+        def get_text(locator):
+            element = self.query_one(self.document, locator)
+            return self.inner_text(element) if element is not None else ""
+
+        element = self.query_one(self.document, save)
+        return {
+            "error": get_text(error),
+            "warning": get_text(warning),
+            "container": self.query_one(self.document, container) is not None,
+            "spinner": self.query_one(self.document, spinner) is not None,
+            "submitted": self._save_watch is not None
+            and self._save_watch[0] is element
+            and self.mutations > self._save_watch[1]
+            and element.get("disabled") is None,
+        }
+
+    def _fast_fill(self, element, value):
+        self.set_value(element, value)
+        return self.get_value(element)
+
+    def _label_text(self, element):
+        texts = [element.text] + [each.tail for each in element]
+        return "".join(" " + each for each in texts if each).strip()
@@ -0,0 +1,243 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import logging
+import threading
+import time
+from collections import namedtuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+HUB_PORT = 4444
+HUB_PATH = "/wd/hub"
+
+HubStatus = namedtuple("HubStatus", ["url", "ready", "free_slots", "latency"])
+
+
+class GridSaturatedError(Exception):
+    """
+    Raised when no hub of the grid had a free slot for a new session within the queue timeout.
+    """
+
+
+class GridUnreachableError(ConnectionError):
+    """
+    Raised when none of the hubs of the grid answered its /status.
+    """
+
+
+def get_hub_url(host):
+    """
+    Get the url of the hub of a SELENIUM_HOST entry.
+        :param host: host of the hub, for ex. http://selenium. Used as is if it already ends with /wd/hub
+        :returns: Str url of the hub, for ex. http://selenium:4444/wd/hub
+    """
+    host = host.strip().rstrip("/")
+    if host.endswith(HUB_PATH):
+        return host
+    return "{}:{}{}".format(host, HUB_PORT, HUB_PATH)
+
+
+def get_hosts(selenium_host):
+    """
+    :param selenium_host: value of SELENIUM_HOST, a comma separated list of hosts
+    :returns: List of the hosts
+    """
+    return [each.strip() for each in (selenium_host or "").split(",") if each.strip()]
+
+
+def get_free_slots(status, browser=None):
+    """
+    Count the free slots of a hub from its /status response.
+        :param status: the "value" of the /status response
+        :param browser: count only the slots of this browser name
+        :returns: Int number of free slots, None if the hub does not report its slots (Selenium 3 hub)
+    """
+    nodes = status.get("nodes")
+    if nodes is None:
+        return None
+    free_slots = 0
+    for node in nodes:
+        if node.get("availability", "UP") != "UP":
+            continue
+        for slot in node.get("slots", list()):
+            stereotype = slot.get("stereotype") or dict()
+            if browser and stereotype.get("browserName", browser) != browser:
+                continue
+            if not slot.get("session"):
+                free_slots += 1
+    return free_slots
+
+
+class SeleniumGrid:
+    """
+    Balances the new browser sessions across several Selenium hubs.
+
+    - The /status of every hub is queried, and the hubs are tried by decreasing number of free slots, then by latency.
+      The sessions being created by this process are deducted from the free slots, until the hub reports them.
+    - A hub on which the session creation failed is skipped for the cooldown, and the next hub is tried.
+    - When all the hubs are saturated or down, the session creation is queued until a slot is free,
+      GridSaturatedError is raised after the queue timeout.
+    """
+
+    def __init__(
+        self,
+        hosts,
+        queue_timeout=300,
+        status_timeout=2,
+        poll_frequency=2,
+        cooldown=30,
+    ):
+        """
+        :param hosts: List of the hosts of the hubs, as in SELENIUM_HOST
+        :param queue_timeout: seconds to wait for a free slot when all the hubs are saturated
+        :param status_timeout: seconds to wait for the /status of a hub
+        :param poll_frequency: seconds between the /status queries while queued
+        :param cooldown: seconds for which a hub is skipped after a failed session creation
+        """
+        self.hubs = [get_hub_url(each) for each in hosts]
+        self.queue_timeout = queue_timeout
+        self.status_timeout = status_timeout
+        self.poll_frequency = poll_frequency
+        self.cooldown = cooldown
+        self._pending = dict()
+        self._failures = dict()
+        self._lock = threading.Lock()
+
+    def get_status(self, hub, browser=None):
+        """
+        Query the /status of the hub
+            :param hub: url of the hub
+            :param browser: count only the slots of this browser name
+            :returns: HubStatus, not ready & with a None latency if the hub could not be reached
+        """
+        start_time = time.perf_counter()
+        try:
+            response = requests.get(hub + "/status", timeout=self.status_timeout)
+            response.raise_for_status()
+            status = response.json().get("value") or dict()
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Could not get the status of {}: {}".format(hub, e))
+            return HubStatus(hub, False, 0, None)
+        return HubStatus(
+            hub,
+            bool(status.get("ready", True)),
+            get_free_slots(status, browser),
+            time.perf_counter() - start_time,
+        )
+
+    def get_statuses(self, browser=None):
+        """
+        Query the /status of the hubs which are not skipped for their cooldown
+            :param browser: count only the slots of this browser name
+            :returns: List of HubStatus, the pending sessions are deducted from the free slots
+        """
+        now = time.monotonic()
+        statuses = list()
+        for hub in self.hubs:
+            with self._lock:
+                if now - self._failures.get(hub, -self.cooldown) < self.cooldown:
+                    continue
+                pending = self._pending.get(hub, 0)
+            status = self.get_status(hub, browser)
+            if status.free_slots is not None:
+                status = status._replace(free_slots=status.free_slots - pending)
+            statuses.append(status)
+        return statuses
+
+    def rank(self, browser=None, statuses=None):
+        """
+        Get the hubs which can take a new session, the least loaded first.
+        The hubs which do not report their slots come after the ones which have free slots.
+            :param browser: count only the slots of this browser name
+            :param statuses: List of HubStatus returned by get_statuses, queried if not provided
+            :returns: List of HubStatus
+        """
+        if statuses is None:
+            statuses = self.get_statuses(browser)
+        candidates = [
+            each
+            for each in statuses
+            if each.ready and (each.free_slots is None or each.free_slots > 0)
+        ]
+        return sorted(
+            candidates,
+            key=lambda each: (
+                each.free_slots is None,
+                -(each.free_slots or 0),
+                each.latency,
+            ),
+        )
+
+    def wait_for_hubs(self, browser=None):
+        """
+        Wait until a hub can take a new session. The session creation is queued only while a hub is reachable.
+            :param browser: count only the slots of this browser name
+            :returns: List of HubStatus, the least loaded first
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        while True:
+            statuses = self.get_statuses(browser)
+            candidates = self.rank(browser, statuses)
+            if candidates:
+                return candidates
+            # the hubs skipped for their cooldown are queried again once it is over
+            if statuses and all(each.latency is None for each in statuses):
+                raise GridUnreachableError(
+                    "None of the Selenium hubs {} answered its status".format(
+                        ", ".join(self.hubs)
+                    )
+                )
+            if time.monotonic() >= deadline:
+                raise GridSaturatedError(
+                    "No free slot on the Selenium hubs {} after {} seconds".format(
+                        ", ".join(self.hubs), self.queue_timeout
+                    )
+                )
+            logger.info("All the Selenium hubs are saturated, waiting for a free slot")
+            time.sleep(self.poll_frequency)
+
+    def create_session(self, factory, browser=None):
+        """
+        Create a session on the least loaded hub, failing over to the next hubs.
+            :param factory: callable(hub url) which returns the remote webdriver
+            :param browser: browser name of the session, to count the matching slots only
+            :returns: the remote webdriver
+        """
+        last_exc = None
+        for status in self.wait_for_hubs(browser):
+            with self._lock:
+                self._pending[status.url] = self._pending.get(status.url, 0) + 1
+            try:
+                driver = factory(status.url)
+                with self._lock:
+                    self._failures.pop(status.url, None)
+                logger.debug("Created a session on {}".format(status.url))
+                return driver
+            except Exception as e:
+                last_exc = e
+                with self._lock:
+                    self._failures[status.url] = time.monotonic()
+                logger.warning(
+                    "Could not create a session on {}, trying the next hub: {}".format(
+                        status.url, e
+                    )
+                )
+            finally:
+                with self._lock:
+                    self._pending[status.url] -= 1
+        raise last_exc
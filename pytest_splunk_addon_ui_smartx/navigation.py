@@ -0,0 +1,112 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import logging
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from .components.tabs import Tab
+from .perf_presets import PAGE_STATS
+from .utils import mark_navigation
+
+logger = logging.getLogger(__name__)
+
+# Returns the state of the current page, used to decide whether it can be reused.
+# arguments: id of the tab to open, or null
+NAVIGATION_STATE_SCRIPT = """
+var tab = arguments[0]
+    ? document.querySelector('[data-test="tab"][data-test-tab-id="' + arguments[0] + '"]')
+    : null;
+return {
+    url: window.location.href,
+    ready: document.readyState === "complete",
+    modal: !!document.querySelector('[data-test="modal"]'),
+    tab: tab ? (tab.getAttribute("aria-selected") === "true" ? "active" : "present") : null
+};
+"""
+
+
+class Navigator:
+    """
+    Opens the pages of Splunk web.
+    With smart navigation, the page already displayed in the browser is reused instead of being loaded again:
+    - Nothing is done if the browser is already on the page & tab.
+    - The tab is switched through the tab bar if the browser is already on the page of the UCC app.
+    - The page is loaded with browser.get otherwise, for example to open another page or app.
+    A page is never reused while a modal is open, as it is left over by the previous test.
+    """
+
+    # Reuse the current page when possible, set by the --smart-navigation option.
+    enabled = False
+
+    def __init__(self, browser):
+        """
+        :param browser: The selenium webdriver
+        """
+        self.browser = browser
+        self._state = None
+
+    def open(self, url, tab=None):
+        """
+        Open the page, and the tab of the page if provided.
+            :param url: The url of the page
+            :param tab: id of the tab to open in the page
+            :returns: Bool True if the page was loaded, False if the current page was reused
+        """
+        if self.enabled and self.can_reuse(url, tab):
+            if tab and self._state["tab"] != "active":
+                Tab(self.browser).open_tab(tab)
+                mark_navigation(self.browser)
+            return False
+        PAGE_STATS.record(self.browser)
+        self.browser.get(url)
+        mark_navigation(self.browser)
+        if tab:
+            Tab(self.browser).open_tab(tab)
+        return True
+
+    def can_reuse(self, url, tab=None):
+        """
+        Check whether the page displayed in the browser can be used instead of loading the url.
+            :param url: The url of the page
+            :param tab: id of the tab to open in the page
+            :returns: Bool True if the current page can be reused
+        """
+        try:
+            self._state = self.browser.execute_script(NAVIGATION_STATE_SCRIPT, tab)
+        except WebDriverException as e:
+            logger.debug(f"Could not get the state of the current page: {e}")
+            return False
+        if not self._state["ready"] or self._state["modal"]:
+            return False
+        if tab and self._state["tab"] is None:
+            return False
+        return is_same_page(self._state["url"], url)
+
+
+def is_same_page(current_url, url):
+    """
+    Check whether the current url is the same page as the url. The query is compared only if the url has one.
+        :param current_url: The url of the browser
+        :param url: The url of the page to open
+        :returns: Bool True if the urls are of the same page
+    """
+    current, target = urlsplit(current_url), urlsplit(url)
+    if (current.scheme, current.netloc) != (target.scheme, target.netloc):
+        return False
+    if current.path.rstrip("/") != target.path.rstrip("/"):
+        return False
+    return not target.query or current.query == target.query
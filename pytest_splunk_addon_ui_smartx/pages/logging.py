@@ -22,7 +22,7 @@ from ..backend_confs import SingleBackendConf
 from ..components.base_component import Selector
 from ..components.controls.single_select import SingleSelect
 from ..components.entity import Entity
-from ..components.tabs import Tab
+from ..navigation import Navigator
 
 
 class Logging(Entity):
@@ -46,7 +46,11 @@ class Logging(Entity):
             self.ta_conf = "{}_settings".format(self.ta_name.lower())
 
         if ucc_smartx_selenium_helper:
-            super().__init__(ucc_smartx_selenium_helper.browser, entity_container)
+            super().__init__(
+                ucc_smartx_selenium_helper.browser,
+                entity_container,
+                is_single_page=True,
+            )
             self.splunk_web_url = ucc_smartx_selenium_helper.splunk_web_url
             self.log_level = SingleSelect(
                 ucc_smartx_selenium_helper.browser,
@@ -59,17 +63,17 @@ class Logging(Entity):
                 self._get_logging_url(),
                 ucc_smartx_rest_helper.username,
                 ucc_smartx_rest_helper.password,
+                session_key=ucc_smartx_rest_helper.session_key,
             )
 
     def open(self):
         """
         Open the required page. Page(super) class opens the page by default.
         """
-        self.browser.get(
-            "{}/en-US/app/{}/configuration".format(self.splunk_web_url, self.ta_name)
+        Navigator(self.browser).open(
+            "{}/en-US/app/{}/configuration".format(self.splunk_web_url, self.ta_name),
+            tab="logging",
         )
-        tab = Tab(self.browser)
-        tab.open_tab("logging")
 
     def _get_logging_url(self):
         """
@@ -14,6 +14,8 @@
 # limitations under the License.
 #
 
+from ..navigation import Navigator
+
 
 class Page:
     """
@@ -40,4 +42,4 @@ class Page:
         """
         Abstract Method. Open the page
         """
-        self.browser.get(self.splunk_web_url)
+        Navigator(self.browser).open(self.splunk_web_url)
@@ -23,7 +23,7 @@ from ..components.controls.checkbox import Checkbox
 from ..components.controls.single_select import SingleSelect
 from ..components.controls.textbox import TextBox
 from ..components.entity import Entity
-from ..components.tabs import Tab
+from ..navigation import Navigator
 
 
 class Proxy(Entity):
@@ -48,7 +48,11 @@ class Proxy(Entity):
             self.ta_conf = "{}_settings".format(self.ta_name.lower())
         entity_container = Selector(select='div[id="proxyTab"]')
         if ucc_smartx_selenium_helper:
-            super().__init__(ucc_smartx_selenium_helper.browser, entity_container)
+            super().__init__(
+                ucc_smartx_selenium_helper.browser,
+                entity_container,
+                is_single_page=True,
+            )
             self.splunk_web_url = ucc_smartx_selenium_helper.splunk_web_url
             self.host = TextBox(
                 ucc_smartx_selenium_helper.browser,
@@ -92,22 +96,23 @@ class Proxy(Entity):
                 self._get_proxy_configs_endpoint(),
                 ucc_smartx_rest_helper.username,
                 ucc_smartx_rest_helper.password,
+                session_key=ucc_smartx_rest_helper.session_key,
             )
             self.backend_conf_get = SingleBackendConf(
                 self._get_proxy_endpoint(),
                 ucc_smartx_rest_helper.username,
                 ucc_smartx_rest_helper.password,
+                session_key=ucc_smartx_rest_helper.session_key,
             )
 
     def open(self):
         """
         Open the required page. Page(super) class opens the page by default.
         """
-        self.browser.get(
-            "{}/en-US/app/{}/configuration".format(self.splunk_web_url, self.ta_name)
+        Navigator(self.browser).open(
+            "{}/en-US/app/{}/configuration".format(self.splunk_web_url, self.ta_name),
+            tab="proxy",
         )
-        tab = Tab(self.browser)
-        tab.open_tab("proxy")
 
     def _get_proxy_endpoint(self):
         """
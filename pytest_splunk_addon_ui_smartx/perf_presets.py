@@ -0,0 +1,259 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import logging
+import threading
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+def _extension_patterns(extensions):
+    return [
+        pattern.format(extension)
+        for extension in extensions
+        for pattern in ("*.{}", "*.{}?*")
+    ]
+
+
+IMAGE_URL_PATTERNS = _extension_patterns(["png", "jpg", "jpeg", "gif", "webp", "ico"])
+FONT_URL_PATTERNS = _extension_patterns(["woff", "woff2", "ttf", "otf", "eot"])
+# Usage telemetry beacons of Splunk web and the product news & help content it fetches from splunk.com
+SPLUNK_SERVICE_URL_PATTERNS = [
+    "*.api.splkmobile.com/*",
+    "*quickdraw.splunk.com/*",
+]
+
+# Chrome flags for the test runs: the timers of the background tabs are not throttled
+# and the animations honouring prefers-reduced-motion are skipped.
+LEAN_CHROME_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-extensions",
+    "--force-prefers-reduced-motion",
+]
+LEAN_FIREFOX_PREFERENCES = {
+    "dom.timeout.enable_budget_throttling": False,
+    "dom.min_background_timeout_value": 4,
+    "ui.prefersReducedMotion": 1,
+}
+
+PerfPreset = namedtuple(
+    "PerfPreset",
+    ["name", "blocked_urls", "block_images", "block_fonts", "lean"],
+    defaults=[(), False, False, False],
+)
+
+PERF_PRESETS = {
+    "lean": PerfPreset("lean", lean=True),
+    "no-media": PerfPreset(
+        "no-media",
+        blocked_urls=tuple(IMAGE_URL_PATTERNS + FONT_URL_PATTERNS),
+        block_images=True,
+        block_fonts=True,
+        lean=True,
+    ),
+    "minimal": PerfPreset(
+        "minimal",
+        blocked_urls=tuple(
+            IMAGE_URL_PATTERNS + FONT_URL_PATTERNS + SPLUNK_SERVICE_URL_PATTERNS
+        ),
+        block_images=True,
+        block_fonts=True,
+        lean=True,
+    ),
+}
+
+
+def get_perf_preset(name, blocked_urls=None):
+    """
+    Get the performance preset, with the additional url patterns to block
+        :param name: name of the preset in PERF_PRESETS, or None for the url patterns only
+        :param blocked_urls: list of additional url patterns, with * as wildcard
+        :returns: PerfPreset, or None if there is nothing to apply
+    """
+    if name is None:
+        if not blocked_urls:
+            return None
+        preset = PerfPreset("custom")
+    elif name in PERF_PRESETS:
+        preset = PERF_PRESETS[name]
+    else:
+        raise ValueError(
+            "Unknown performance preset {}, expected one of {}".format(
+                name, ", ".join(PERF_PRESETS)
+            )
+        )
+    if blocked_urls:
+        preset = preset._replace(
+            blocked_urls=tuple(preset.blocked_urls) + tuple(blocked_urls)
+        )
+    return preset
+
+
+def get_chrome_arguments(preset):
+    """
+    Get the Chrome arguments of the preset
+        :param preset: PerfPreset
+        :returns: List of arguments
+    """
+    return list(LEAN_CHROME_ARGUMENTS) if preset.lean else list()
+
+
+def get_chrome_preferences(preset):
+    """
+    Get the Chrome preferences of the preset.
+    The images are blocked through the preferences as well, for the browsers without the DevTools protocol.
+        :param preset: PerfPreset
+        :returns: Dict of the preferences
+    """
+    preferences = dict()
+    if preset.block_images:
+        preferences["profile.managed_default_content_settings.images"] = 2
+    return preferences
+
+
+def get_firefox_preferences(preset):
+    """
+    Get the Firefox preferences of the preset. Firefox can not block the url patterns.
+        :param preset: PerfPreset
+        :returns: Dict of the preferences
+    """
+    preferences = dict(LEAN_FIREFOX_PREFERENCES) if preset.lean else dict()
+    if preset.block_images:
+        preferences["permissions.default.image"] = 2
+    if preset.block_fonts:
+        preferences["gfx.downloadable_fonts.enabled"] = False
+    return preferences
+
+
+def block_urls(browser, preset):
+    """
+    Block the url patterns of the preset through the Chrome DevTools protocol
+        :param browser: The selenium webdriver
+        :param preset: PerfPreset
+        :returns: Bool True if the url patterns are blocked
+    """
+    if not preset.blocked_urls or not hasattr(browser, "execute_cdp_cmd"):
+        return False
+    try:
+        browser.execute_cdp_cmd("Network.enable", {})
+        browser.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": list(preset.blocked_urls)}
+        )
+    except WebDriverException as e:
+        logger.warning(f"Could not block the urls of the {preset.name} preset: {e}")
+        return False
+    return True
+
+
+# Reads the requests of the current page which were not reported yet, from the resource timing entries.
+# The index of the last reported entry is kept in the page, so that a page reused by several tests is counted once.
+# The browsers keep 250 resource timings per page by default, and drop the next ones
+RESOURCE_TIMING_BUFFER_SIZE = 250
+RESOURCE_TIMING_BUFFER_MAX_SIZE = 10000
+
+PAGE_RESOURCES_SCRIPT = """
+var resources = performance.getEntriesByType("resource");
+var entries = performance.getEntriesByType("navigation").concat(resources);
+var start = window.__uccSmartxReported || 0;
+window.__uccSmartxReported = entries.length;
+var stats = {url: window.location.href, load: start === 0, requests: 0, bytes: 0, cached: 0,
+    truncated: window.__uccSmartxBufferFull === true};
+if (start === 0) {
+    stats.truncated = resources.length >= arguments[0];
+    window.__uccSmartxBufferFull = false;
+    performance.setResourceTimingBufferSize(arguments[1]);
+    performance.addEventListener("resourcetimingbufferfull", function() {
+        window.__uccSmartxBufferFull = true;
+    });
+}
+for (var i = start; i < entries.length; i++) {
+    stats.requests += 1;
+    stats.bytes += entries[i].transferSize || 0;
+    if (entries[i].transferSize === 0 && entries[i].decodedBodySize > 0) {
+        stats.cached += 1;
+    }
+}
+return stats;
+"""
+
+PageStat = namedtuple("PageStat", ["loads", "requests", "bytes", "cached", "truncated"])
+
+
+class PageStats:
+    """
+    Counts the requests & the bytes transferred by the pages of Splunk web, per url path.
+    The pages are recorded before the browser leaves them, so that the requests of the whole page are counted.
+    The resource timing buffer of a page is enlarged when the page is first recorded. The records of the pages
+    whose buffer was full are counted as truncated, as their requests are undercounted.
+    Comparing the stats of runs with & without a preset gives the requests & the bytes saved by the preset.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats = dict()
+        self._lock = threading.Lock()
+
+    def record(self, browser):
+        """
+        Record the requests of the current page, not recorded yet
+            :param browser: The selenium webdriver
+        """
+        if not self.enabled:
+            return
+        try:
+            page = browser.execute_script(
+                PAGE_RESOURCES_SCRIPT,
+                RESOURCE_TIMING_BUFFER_SIZE,
+                RESOURCE_TIMING_BUFFER_MAX_SIZE,
+            )
+        except WebDriverException as e:
+            logger.debug(f"Could not read the requests of the current page: {e}")
+            return
+        if not page or not page["requests"]:
+            return
+        path = urlsplit(page["url"]).path or "/"
+        with self._lock:
+            stat = self._stats.get(path, PageStat(0, 0, 0, 0, 0))
+            self._stats[path] = PageStat(
+                loads=stat.loads + int(page["load"]),
+                requests=stat.requests + page["requests"],
+                bytes=stat.bytes + page["bytes"],
+                cached=stat.cached + page["cached"],
+                truncated=stat.truncated + int(page.get("truncated", False)),
+            )
+
+    def get_stats(self):
+        """
+        Get the request counters
+            :returns: dictionary {url path: PageStat}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        """
+        Reset the request counters
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+PAGE_STATS = PageStats()
@@ -21,9 +21,19 @@ from collections import namedtuple
 import pytest
 
 from .base_test import RestHelper, SeleniumHelper
+from .browser_pool import BrowserPool
+from .browser_profile import BrowserProfiles
+from .components.controls.textbox import TextBox
+from .grid import GridSaturatedError, SeleniumGrid, get_hosts
+from .navigation import Navigator
+from .perf_presets import PAGE_STATS, PERF_PRESETS, get_perf_preset
+from .profiler import COMPONENT_PROFILER, SORT_KEYS
+from .tracing import COMMAND_TRACER
+from .wait_engine import WAIT_ENGINE, parse_policy
 
 LOGGER = logging.getLogger("pytest-ucc-smartx")
 PNG_PATH = "assets"
+PROFILE_WORKEROUTPUT_KEY = "ucc_smartx_component_profile"
 
 
 def pytest_configure(config):
@@ -31,6 +41,14 @@ def pytest_configure(config):
     Setup configuration after command-line options are parsed
     """
     config.addinivalue_line("markers", "ucc: UCC Tests")
+    configure_wait_engine(config)
+    TextBox.fast_fill_default = config.getoption("--fast-fill")
+    Navigator.enabled = config.getoption("--smart-navigation")
+    PAGE_STATS.enabled = config.getoption("--page-stats")
+    COMPONENT_PROFILER.enabled = config.getoption("--profile-components")
+    COMMAND_TRACER.enabled = bool(
+        config.getoption("--trace-commands") or config.getoption("--trace-json")
+    )
     pytest_html = config.pluginmanager.getplugin("html")
     if pytest_html:
         try:
@@ -39,6 +57,139 @@ def pytest_configure(config):
             pass
 
 
+def pytest_runtest_logstart(nodeid, location):
+    """
+    Attribute the WebDriver commands sent from now on to the test
+    """
+    if COMMAND_TRACER.enabled:
+        COMMAND_TRACER.start_test(nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Write the WebDriver command aggregates of the tests if --trace-json is provided,
+    and send the profile of the component methods of a pytest-xdist worker to the controller
+    """
+    trace_json = session.config.getoption("--trace-json")
+    if trace_json:
+        path = COMMAND_TRACER.write_json(trace_json)
+        LOGGER.info("WebDriver command trace written to {}".format(path))
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None and COMPONENT_PROFILER.enabled:
+        workeroutput[PROFILE_WORKEROUTPUT_KEY] = COMPONENT_PROFILER.export_stats()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Merge the profile of the component methods of a pytest-xdist worker
+    """
+    exported = getattr(node, "workeroutput", dict()).get(PROFILE_WORKEROUTPUT_KEY)
+    if exported:
+        COMPONENT_PROFILER.merge_stats(exported)
+
+
+def pytest_unconfigure(config):
+    """
+    Print the profile of the component methods if --profile-components is provided.
+    With pytest-xdist, the controller prints the profiles of all the workers.
+    """
+    if not config.getoption("--profile-components") or hasattr(config, "workerinput"):
+        return
+    lines = COMPONENT_PROFILER.format_table(
+        sort=config.getoption("--profile-sort"),
+        limit=config.getoption("--profile-limit"),
+    )
+    terminalreporter = config.pluginmanager.get_plugin("terminalreporter")
+    if terminalreporter:
+        terminalreporter.write_sep("-", "ucc-smartx component profile")
+        for line in lines:
+            terminalreporter.write_line(line)
+    else:
+        LOGGER.info("ucc-smartx component profile\n{}".format("\n".join(lines)))
+
+
+def configure_wait_engine(config):
+    """
+    Configure the polling policies of the component waits from the ini file & the command line.
+    The policies are given as "<component class name or *>:min_poll=0.05,max_poll=1,backoff=1.5"
+    """
+    policies = list(config.getini("ucc_smartx_wait_policies"))
+    policies += config.getoption("--wait-policy") or []
+    default_policy = WAIT_ENGINE.default_policy
+    overrides = dict()
+    for each in policies:
+        component, _, policy = each.partition(":")
+        component = component.strip()
+        if component == "*":
+            default_policy = parse_policy(policy, default_policy)
+        else:
+            overrides[component] = parse_policy(
+                policy, overrides.get(component, default_policy)
+            )
+    for param in ("min_poll", "max_poll", "backoff"):
+        value = config.getoption("--wait-{}".format(param.replace("_", "-")))
+        if value is not None:
+            default_policy = default_policy._replace(**{param: value})
+    WAIT_ENGINE.configure(default_policy, overrides)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Print the poll counters of the waits if --wait-stats is provided,
+    and the requests of the pages if --page-stats is provided
+    """
+    if config.getoption("--page-stats"):
+        write_page_stats(terminalreporter)
+    if not config.getoption("--wait-stats"):
+        return
+    terminalreporter.write_sep("-", "ucc-smartx wait stats")
+    terminalreporter.write_line(
+        "{:<40} {:>8} {:>8} {:>10} {:>9} {:>12}".format(
+            "wait", "waits", "polls", "max polls", "timeouts", "wait time(s)"
+        )
+    )
+    stats = WAIT_ENGINE.get_stats()
+    for name in sorted(stats, key=lambda name: stats[name].wait_time, reverse=True):
+        each = stats[name]
+        terminalreporter.write_line(
+            "{:<40} {:>8} {:>8} {:>10} {:>9} {:>12.2f}".format(
+                str(name),
+                each.waits,
+                each.polls,
+                each.max_polls,
+                each.timeouts,
+                each.wait_time,
+            )
+        )
+
+
+def write_page_stats(terminalreporter):
+    """
+    Print the requests & the bytes transferred per page
+    """
+    terminalreporter.write_sep("-", "ucc-smartx page stats")
+    terminalreporter.write_line(
+        "{:<60} {:>6} {:>9} {:>7} {:>10}".format(
+            "page", "loads", "requests", "cached", "KB"
+        )
+    )
+    stats = PAGE_STATS.get_stats()
+    for path in sorted(stats, key=lambda path: stats[path].bytes, reverse=True):
+        each = stats[path]
+        terminalreporter.write_line(
+            "{:<60} {:>6} {:>9} {:>7} {:>10.1f}".format(
+                path, each.loads, each.requests, each.cached, each.bytes / 1024
+            )
+        )
+    truncated = sum(each.truncated for each in stats.values())
+    if truncated:
+        terminalreporter.write_line(
+            "{} page record(s) exceeded the resource timing buffer of the browser, "
+            "their requests are undercounted".format(truncated)
+        )
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Add browser name as prefix in test class name
@@ -93,6 +244,204 @@ def pytest_addoption(parser):
         "--headless", action="store_true", help="Run the test case on headless mode"
     )
 
+    group.addoption(
+        "--fast-login",
+        action="store_true",
+        help=(
+            "Login to Splunk web once per host & user and inject the session cookies into the new browsers"
+            " instead of filling the login form every time."
+        ),
+    )
+
+    group.addoption(
+        "--browser-pool-size",
+        action="store",
+        type=int,
+        default=0,
+        help=(
+            "Keep a pool of pre-launched & logged in browsers which are reused across the tests."
+            " The browser is reset between the tests. (Default: 0, pool disabled)"
+        ),
+    )
+
+    group.addoption(
+        "--browser-profile-dir",
+        action="store",
+        default=None,
+        help=(
+            "Keep the disk cache of the local Chrome & Firefox browsers in this directory, per worker,"
+            " so that the static assets of Splunk web are not downloaded again by every browser."
+            " Every browser still gets a fresh profile. (Only supported with --local)"
+        ),
+    )
+
+    group.addoption(
+        "--browser-cache-size",
+        action="store",
+        type=int,
+        default=200,
+        help="The maximum size of the disk cache kept with --browser-profile-dir, in MB. (Default: 200)",
+    )
+
+    group.addoption(
+        "--perf-preset",
+        action="store",
+        default=None,
+        choices=list(PERF_PRESETS),
+        help=(
+            "Performance preset of the Chrome & Firefox browsers. lean: no background throttling, no extensions,"
+            " reduced motion. no-media: lean, and the images & web fonts are blocked."
+            " minimal: no-media, and the telemetry & news requests of Splunk web are blocked."
+        ),
+    )
+
+    group.addoption(
+        "--block-url",
+        action="append",
+        help=(
+            "Url pattern, with * as wildcard, blocked in addition to the ones of --perf-preset."
+            " Can be provided multiple times. (Only supported with the local Chrome)"
+        ),
+    )
+
+    group.addoption(
+        "--page-stats",
+        action="store_true",
+        help="Print the requests & the bytes transferred per page at the end of the test run.",
+    )
+
+    group.addoption(
+        "--profile-components",
+        action="store_true",
+        help=(
+            "Profile the public methods of the components: calls, wall time, WebDriver round trips & wait time"
+            " per component class & method, printed at the end of the test run."
+            " The shared methods of the base components, for ex. wait_for, are counted per calling component."
+        ),
+    )
+
+    group.addoption(
+        "--profile-sort",
+        action="store",
+        default="wall_time",
+        choices=SORT_KEYS,
+        help="The column by which the component profile is sorted. (Default: wall_time)",
+    )
+
+    group.addoption(
+        "--profile-limit",
+        action="store",
+        type=int,
+        default=None,
+        help="The maximum number of component methods printed in the component profile. (Default: all)",
+    )
+
+    group.addoption(
+        "--trace-commands",
+        action="store_true",
+        help=(
+            "Record the WebDriver commands of the browsers, and attach the command count, the time spent in the waits"
+            " & the actions and the slowest commands of every test to the pytest-html report."
+        ),
+    )
+
+    group.addoption(
+        "--trace-json",
+        action="store",
+        default=None,
+        help=(
+            "Write the WebDriver command aggregates of every test to this JSON file, implies --trace-commands."
+            " The pytest-xdist workers suffix the file name with the name of the worker."
+        ),
+    )
+
+    group.addoption(
+        "--explicit-waits-only",
+        action="store_true",
+        help=(
+            "Do not set the implicit wait on the remote browsers (SELENIUM_HOST)."
+            " The components rely on their explicit waits, so the lookups of absent elements return immediately."
+        ),
+    )
+
+    group.addoption(
+        "--grid-queue-timeout",
+        action="store",
+        type=float,
+        default=300,
+        help=(
+            "When SELENIUM_HOST lists several hubs and all of them are saturated,"
+            " the number of seconds to wait for a free slot before failing."
+            " The browser creation fails at once if none of the hubs answers. (Default: 300)"
+        ),
+    )
+
+    group.addoption(
+        "--fast-fill",
+        action="store_true",
+        help=(
+            "Set the values of the TextBox & TextArea controls in one operation instead of typing them."
+            " Falls back to typing if the value could not be set."
+        ),
+    )
+
+    group.addoption(
+        "--smart-navigation",
+        action="store_true",
+        help=(
+            "Reuse the page displayed in the browser when a page is opened: skip the navigation if already on the page,"
+            " switch the tab through the tab bar if already on the UCC page, load the page otherwise."
+        ),
+    )
+
+    group.addoption(
+        "--wait-min-poll",
+        action="store",
+        type=float,
+        default=None,
+        help="The first poll interval (in seconds) of the component waits. (Default: 0.05)",
+    )
+
+    group.addoption(
+        "--wait-max-poll",
+        action="store",
+        type=float,
+        default=None,
+        help="The maximum poll interval (in seconds) of the component waits. (Default: 1)",
+    )
+
+    group.addoption(
+        "--wait-backoff",
+        action="store",
+        type=float,
+        default=None,
+        help="The factor by which the poll interval grows after each poll. (Default: 1.5)",
+    )
+
+    group.addoption(
+        "--wait-policy",
+        action="append",
+        help=(
+            "Override the polling policy of a component class and its subclasses."
+            ' Format: "<component>:min_poll=0.1,max_poll=2,backoff=2". Can be provided multiple times.'
+        ),
+    )
+
+    group.addoption(
+        "--wait-stats",
+        action="store_true",
+        help="Print how many polls the waits took at the end of the test run.",
+    )
+
+    parser.addini(
+        "ucc_smartx_wait_policies",
+        type="linelist",
+        default=[],
+        help=(
+            'Polling policies of the component waits, one per line. Format: "<component or *>:min_poll=0.1,max_poll=2,backoff=2"'
+        ),
+    )
+
 
 SmartConfigs = namedtuple(
     "SmartConfigs",
@@ -102,6 +451,12 @@ SmartConfigs = namedtuple(
         "local_run",
         "retry_count",
         "headless_run",
+        "browser_pool_size",
+        "fast_login",
+        "explicit_waits_only",
+        "browser_profiles",
+        "perf_preset",
+        "selenium_grid",
     ],
 )
 
@@ -141,6 +496,34 @@ def ucc_smartx_configs(request):
     else:
         headless_run = False
 
+    browser_pool_size = request.config.getoption("--browser-pool-size")
+    LOGGER.debug("--browser-pool-size={}".format(browser_pool_size))
+
+    browser_profiles = None
+    browser_profile_dir = request.config.getoption("--browser-profile-dir")
+    if browser_profile_dir and local_run:
+        browser_profiles = BrowserProfiles(
+            browser_profile_dir,
+            cache_size=request.config.getoption("--browser-cache-size") * 1024 * 1024,
+        )
+        LOGGER.debug("--browser-profile-dir={}".format(browser_profiles.root))
+
+    perf_preset = get_perf_preset(
+        request.config.getoption("--perf-preset"),
+        request.config.getoption("--block-url"),
+    )
+    if perf_preset:
+        LOGGER.debug("--perf-preset={}".format(perf_preset.name))
+
+    selenium_grid = None
+    selenium_hosts = get_hosts(os.environ.get("SELENIUM_HOST"))
+    if not local_run and len(selenium_hosts) > 1:
+        selenium_grid = SeleniumGrid(
+            selenium_hosts,
+            queue_timeout=request.config.getoption("--grid-queue-timeout"),
+        )
+        LOGGER.debug("Balancing the sessions across {}".format(selenium_grid.hubs))
+
     LOGGER.info(
         f"Calling SeleniumHelper with:: browser={driver}, local-run={local_run}, headless={headless_run})"
     )
@@ -150,6 +533,12 @@ def ucc_smartx_configs(request):
         local_run=local_run,
         retry_count=retry_count,
         headless_run=headless_run,
+        browser_pool_size=browser_pool_size,
+        fast_login=request.config.getoption("--fast-login"),
+        explicit_waits_only=request.config.getoption("--explicit-waits-only"),
+        browser_profiles=browser_profiles,
+        perf_preset=perf_preset,
+        selenium_grid=selenium_grid,
     )
     return smartx_configs
 
@@ -158,20 +547,20 @@ def get_browser_scope(fixture_name, config):
     """
     Set the scope of the browser dynamically.
     """
+    if config.getoption("--browser-pool-size"):
+        return "function"
     if config.getoption("--local") and config.getoption("--persist-browser"):
         return "session"
     else:
         return "function"
 
 
-@pytest.fixture(scope=get_browser_scope)
-def ucc_smartx_selenium_helper(
-    request, ucc_smartx_configs, splunk, splunk_web_uri, splunk_rest_uri
+def create_selenium_helper(
+    ucc_smartx_configs, splunk, splunk_web_uri, splunk_rest_uri, test_case=None
 ):
-    # Try to configure selenium & Login to splunk instance
-    test_case = "{}_{}".format(
-        ucc_smartx_configs.driver, request.node.nodeid.split("::")[-1]
-    )
+    """
+    Configure selenium & Login to splunk instance. Retries as per --setup-retry-count.
+    """
     for try_number in range(ucc_smartx_configs.retry_count):
         last_exc = Exception()
         try:
@@ -184,8 +573,19 @@ def ucc_smartx_selenium_helper(
                 cred=(splunk["username"], splunk["password"]),
                 headless=ucc_smartx_configs.headless_run,
                 test_case=test_case,
+                fast_login=ucc_smartx_configs.fast_login,
+                explicit_waits_only=ucc_smartx_configs.explicit_waits_only,
+                browser_profiles=ucc_smartx_configs.browser_profiles,
+                perf_preset=ucc_smartx_configs.perf_preset,
+                selenium_grid=ucc_smartx_configs.selenium_grid,
             )
+            COMMAND_TRACER.install(selenium_helper.browser)
+            COMPONENT_PROFILER.install(selenium_helper.browser)
             break
+        except GridSaturatedError:
+            # the session creation was already queued for the whole timeout
+            LOGGER.error("The Selenium grid is saturated, not retrying")
+            raise
         except Exception as e:
             last_exc = e
             LOGGER.warning(
@@ -198,11 +598,64 @@ def ucc_smartx_selenium_helper(
             "Could not connect to Browser or login to Splunk instance. Please check the logs for detailed error of each retry"
         )
         raise (last_exc)
+    return selenium_helper
+
+
+@pytest.fixture(scope="session")
+def ucc_smartx_browser_pool(
+    ucc_smartx_configs, splunk, splunk_web_uri, splunk_rest_uri
+):
+    """
+    Session level pool of logged in browsers. None if --browser-pool-size is not provided.
+    """
+    if not ucc_smartx_configs.browser_pool_size:
+        yield None
+        return
+
+    browser_pool = BrowserPool(
+        lambda: create_selenium_helper(
+            ucc_smartx_configs, splunk, splunk_web_uri, splunk_rest_uri
+        ),
+        size=ucc_smartx_configs.browser_pool_size,
+    )
+    browser_pool.warm_up()
+    yield browser_pool
+
+    LOGGER.info("Quiting browsers of the pool..")
+    browser_pool.close()
+
+
+@pytest.fixture(scope=get_browser_scope)
+def ucc_smartx_selenium_helper(
+    request,
+    ucc_smartx_configs,
+    ucc_smartx_browser_pool,
+    splunk,
+    splunk_web_uri,
+    splunk_rest_uri,
+):
+    test_case = "{}_{}".format(
+        ucc_smartx_configs.driver, request.node.nodeid.split("::")[-1]
+    )
+    if ucc_smartx_browser_pool:
+        selenium_helper = ucc_smartx_browser_pool.checkout(test_case)
+        yield selenium_helper
+
+        PAGE_STATS.record(selenium_helper.browser)
+        LOGGER.info("Returning browser to the pool..")
+        ucc_smartx_browser_pool.checkin(selenium_helper)
+        return
+
+    selenium_helper = create_selenium_helper(
+        ucc_smartx_configs, splunk, splunk_web_uri, splunk_rest_uri, test_case
+    )
 
     yield selenium_helper
 
+    PAGE_STATS.record(selenium_helper.browser)
     LOGGER.info("Quiting browser..")
     selenium_helper.browser.quit()
+    selenium_helper.release_profile()
 
 
 @pytest.fixture(scope="session")
@@ -259,6 +712,13 @@ def pytest_runtest_makereport(item, call):
             report = outcome.get_result()
             if report.when == "call" or report.when == "setup":
                 setattr(item, "report", report)
+                if report.when == "call" and COMMAND_TRACER.enabled:
+                    report.extra = getattr(report, "extra", []) + [
+                        pytest_html.extras.json(
+                            COMMAND_TRACER.get_summary(item.nodeid),
+                            name="WebDriver commands",
+                        )
+                    ]
                 if report.failed:
                     try:
                         if report.when == "setup":
@@ -274,7 +734,9 @@ def pytest_runtest_makereport(item, call):
                                 screenshot_path
                             )
 
-                        report.extra = [pytest_html.extras.image(screenshot_path)]
+                        report.extra = getattr(report, "extra", []) + [
+                            pytest_html.extras.image(screenshot_path)
+                        ]
                     except:
                         LOGGER.warning(
                             "Screenshot can not be captured. Scope of the fixture test_helper must be 'function' to capture the screenshot. "
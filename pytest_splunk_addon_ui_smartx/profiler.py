@@ -0,0 +1,202 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import functools
+import inspect
+import threading
+import time
+import weakref
+from collections import namedtuple
+
+from .wait_engine import WAIT_ENGINE
+
+MethodStats = namedtuple(
+    "MethodStats", ["calls", "wall_time", "round_trips", "wait_time"]
+)
+SORT_KEYS = MethodStats._fields
+
+
+class ComponentProfiler:
+    """
+    Profiles the public methods of the components: the number of calls, the wall time,
+    the number of WebDriver round trips and the time spent in the waits, per component class & method.
+    The times of a method include the ones of the other profiled methods it calls.
+    The methods of the base component classes are profiled too, under the class of the component they are called on.
+    The methods are wrapped when the component classes are created, the wrappers only record when enabled.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._stats = dict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._browsers = weakref.WeakSet()
+
+    def profile_methods(self, component_class):
+        """
+        Wrap the public methods defined by the component class
+            :param component_class: The class of the component
+        """
+        for name, method in list(vars(component_class).items()):
+            if (
+                name.startswith("_")
+                or not inspect.isfunction(method)
+                or getattr(method, "_ucc_smartx_profiled", False)
+            ):
+                continue
+            setattr(component_class, name, self._wrap(method))
+
+    def _wrap(self, method):
+        @functools.wraps(method)
+        def profiled(component, *args, **kwargs):
+            if not self.enabled:
+                return method(component, *args, **kwargs)
+            return self._call(method, component, args, kwargs)
+
+        profiled._ucc_smartx_profiled = True
+        return profiled
+
+    def _call(self, method, component, args, kwargs):
+        active = self._local.__dict__.setdefault("active", set())
+        # an override calling the method of its parent class is recorded once
+        marker = (id(component), method.__name__)
+        if marker in active:
+            return method(component, *args, **kwargs)
+        active.add(marker)
+        round_trips = self.get_thread_round_trips()
+        wait_time = WAIT_ENGINE.get_thread_wait_time()
+        start_time = time.perf_counter()
+        try:
+            return method(component, *args, **kwargs)
+        finally:
+            active.discard(marker)
+            self.record(
+                type(component).__name__,
+                method.__name__,
+                time.perf_counter() - start_time,
+                self.get_thread_round_trips() - round_trips,
+                WAIT_ENGINE.get_thread_wait_time() - wait_time,
+            )
+
+    def install(self, browser):
+        """
+        Count the WebDriver round trips of the browser, by wrapping its execute method. Nothing is done if already counted.
+            :param browser: The selenium webdriver
+        """
+        if not self.enabled or browser in self._browsers:
+            return
+        execute = browser.execute
+
+        def counted_execute(driver_command, params=None):
+            self._local.round_trips = self.get_thread_round_trips() + 1
+            return execute(driver_command, params)
+
+        browser.execute = counted_execute
+        self._browsers.add(browser)
+
+    def get_thread_round_trips(self):
+        """
+        Get the number of WebDriver round trips of the current thread
+            :returns: Int
+        """
+        return getattr(self._local, "round_trips", 0)
+
+    def record(self, component, method, wall_time, round_trips, wait_time):
+        """
+        Record a call of a component method
+            :param component: name of the component class
+            :param method: name of the method
+            :param wall_time: seconds spent in the method
+            :param round_trips: number of WebDriver commands sent by the method
+            :param wait_time: seconds spent in the waits by the method
+        """
+        with self._lock:
+            stats = self._stats.get((component, method), MethodStats(0, 0.0, 0, 0.0))
+            self._stats[(component, method)] = MethodStats(
+                calls=stats.calls + 1,
+                wall_time=stats.wall_time + wall_time,
+                round_trips=stats.round_trips + round_trips,
+                wait_time=stats.wait_time + wait_time,
+            )
+
+    def get_stats(self):
+        """
+        Get the profile of the component methods
+            :returns: dictionary {(component class name, method name): MethodStats}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def export_stats(self):
+        """
+        Export the profile, to send it from a pytest-xdist worker to the controller
+            :returns: List of [component class name, method name, calls, wall time, round trips, wait time]
+        """
+        return [list(name) + list(stats) for name, stats in self.get_stats().items()]
+
+    def merge_stats(self, exported):
+        """
+        Add a profile exported by export_stats to the profile
+            :param exported: List returned by export_stats
+        """
+        with self._lock:
+            for component, method, *values in exported:
+                stats = self._stats.get(
+                    (component, method), MethodStats(0, 0.0, 0, 0.0)
+                )
+                self._stats[(component, method)] = MethodStats(
+                    *(total + value for total, value in zip(stats, values))
+                )
+
+    def reset_stats(self):
+        """
+        Reset the profile of the component methods
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def format_table(self, sort="wall_time", limit=None):
+        """
+        Format the profile as a table, the hottest methods first
+            :param sort: field of MethodStats to sort by
+            :param limit: maximum number of rows
+            :returns: List of lines
+        """
+        stats = self.get_stats()
+        names = sorted(stats, key=lambda name: getattr(stats[name], sort), reverse=True)
+        lines = [
+            "{:<60} {:>8} {:>12} {:>11} {:>12}".format(
+                "component method",
+                "calls",
+                "wall time(s)",
+                "round trips",
+                "wait time(s)",
+            )
+        ]
+        for name in names[:limit]:
+            each = stats[name]
+            lines.append(
+                "{:<60} {:>8} {:>12.2f} {:>11} {:>12.2f}".format(
+                    ".".join(name),
+                    each.calls,
+                    each.wall_time,
+                    each.round_trips,
+                    each.wait_time,
+                )
+            )
+        return lines
+
+
+COMPONENT_PROFILER = ComponentProfiler()
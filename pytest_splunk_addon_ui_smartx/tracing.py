@@ -0,0 +1,239 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import namedtuple
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .wait_engine import AdaptiveWebDriverWait
+
+logger = logging.getLogger(__name__)
+
+PACKAGE = __name__.rpartition(".")[0]
+# The modules of the components & pages, in which the originating method of a command is looked for.
+ORIGIN_MODULES = (PACKAGE + ".components", PACKAGE + ".pages")
+# The generic lookups of the base component are skipped in favour of the method calling them.
+GENERIC_MODULES = (PACKAGE + ".components.base_component",)
+WAIT_CODES = (
+    AdaptiveWebDriverWait._wait.__code__,
+    WebDriverWait.until.__code__,
+    WebDriverWait.until_not.__code__,
+)
+
+CommandRecord = namedtuple(
+    "CommandRecord",
+    ["command", "locator", "origin", "duration", "in_wait", "attempt", "failed"],
+)
+
+
+class CommandTracer:
+    """
+    Records the commands sent by the browsers to the WebDriver, per test:
+    the name & locator of the command, its duration, the component method it originates from,
+    whether it was sent by a wait and how many times the same command was sent in a row (the retries of the waits).
+    """
+
+    def __init__(self, slowest=10):
+        """
+        :param slowest: Number of the slowest commands kept in the summary of a test
+        """
+        self.enabled = False
+        self.slowest = slowest
+        self.test = None
+        self._records = dict()
+        self._lock = threading.Lock()
+        self._browsers = weakref.WeakSet()
+
+    def install(self, browser):
+        """
+        Trace the commands of the browser, by wrapping its execute method. Nothing is done if already traced.
+            :param browser: The selenium webdriver
+        """
+        if not self.enabled or browser in self._browsers:
+            return
+        execute = browser.execute
+
+        def traced_execute(driver_command, params=None):
+            start_time = time.perf_counter()
+            failed = True
+            try:
+                response = execute(driver_command, params)
+                failed = False
+                return response
+            finally:
+                self.record(
+                    driver_command,
+                    params,
+                    time.perf_counter() - start_time,
+                    failed,
+                    sys._getframe(1),
+                )
+
+        browser.execute = traced_execute
+        self._browsers.add(browser)
+
+    def start_test(self, name):
+        """
+        Attribute the next commands to the test
+            :param name: id of the test
+        """
+        with self._lock:
+            self.test = name
+            self._records[name] = list()
+
+    def record(self, command, params, duration, failed, frame):
+        """
+        Record a command sent to the WebDriver
+            :param command: name of the command
+            :param params: parameters of the command
+            :param duration: seconds spent in the command
+            :param failed: whether the command raised an exception
+            :param frame: the frame which sent the command
+        """
+        if self.test is None:
+            return
+        origin, in_wait = get_origin(frame)
+        locator = get_locator(params)
+        with self._lock:
+            records = self._records.setdefault(self.test, list())
+            attempt = 1
+            if records:
+                last = records[-1]
+                if (last.command, last.locator, last.origin) == (
+                    command,
+                    locator,
+                    origin,
+                ):
+                    attempt = last.attempt + 1
+            records.append(
+                CommandRecord(
+                    command, locator, origin, duration, in_wait, attempt, failed
+                )
+            )
+
+    def get_records(self, name):
+        """
+        Get the commands of the test
+            :param name: id of the test
+            :returns: List of CommandRecord
+        """
+        with self._lock:
+            return list(self._records.get(name, list()))
+
+    def get_summary(self, name):
+        """
+        Get the aggregates of the commands of the test
+            :param name: id of the test
+            :returns: Dict, JSON serializable
+        """
+        records = self.get_records(name)
+        wait_time = sum(each.duration for each in records if each.in_wait)
+        wire_time = sum(each.duration for each in records)
+        slowest = sorted(records, key=lambda each: each.duration, reverse=True)
+        return {
+            "test": name,
+            "commands": len(records),
+            "wire_time": round(wire_time, 4),
+            "wait_commands": sum(1 for each in records if each.in_wait),
+            "wait_time": round(wait_time, 4),
+            "action_time": round(wire_time - wait_time, 4),
+            "retries": sum(1 for each in records if each.attempt > 1),
+            "failed": sum(1 for each in records if each.failed),
+            "slowest": [
+                {
+                    "command": each.command,
+                    "locator": each.locator,
+                    "origin": each.origin,
+                    "duration": round(each.duration, 4),
+                }
+                for each in slowest[: self.slowest]
+            ],
+        }
+
+    def get_summaries(self):
+        """
+        Get the aggregates of all the traced tests
+            :returns: List of Dict
+        """
+        with self._lock:
+            names = list(self._records)
+        return [self.get_summary(name) for name in names]
+
+    def write_json(self, path):
+        """
+        Write the aggregates of the traced tests as JSON, for the trend analysis.
+        Every pytest-xdist worker writes its own file, suffixed with the name of the worker.
+            :param path: path of the JSON file
+            :returns: Str path of the written file
+        """
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker:
+            root, extension = os.path.splitext(path)
+            path = "{}.{}{}".format(root, worker, extension)
+        with open(path, "w") as output:
+            json.dump(
+                {"created": time.time(), "tests": self.get_summaries()},
+                output,
+                indent=2,
+            )
+        return path
+
+
+def get_locator(params):
+    """
+    Get the locator of a find command
+        :param params: parameters of the command
+        :returns: Str "<by>=<select>", or None for the other commands
+    """
+    if params and "using" in params:
+        return "{}={}".format(params["using"], params.get("value"))
+    return None
+
+
+def get_origin(frame):
+    """
+    Find the component or page method which sent the command, and whether it was sent by a wait
+        :param frame: the frame which sent the command
+        :returns: Tuple (Str "<class>.<method>" or None, Bool in wait)
+    """
+    origin = None
+    generic_origin = None
+    in_wait = False
+    while frame is not None:
+        code = frame.f_code
+        if code in WAIT_CODES:
+            in_wait = True
+        elif origin is None and not code.co_name.startswith("<"):
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith(ORIGIN_MODULES) and "self" in frame.f_locals:
+                name = "{}.{}".format(
+                    type(frame.f_locals["self"]).__name__, code.co_name
+                )
+                if module.startswith(GENERIC_MODULES):
+                    generic_origin = generic_origin or name
+                else:
+                    origin = name
+        frame = frame.f_back
+    return origin or generic_origin, in_wait
+
+
+COMMAND_TRACER = CommandTracer()
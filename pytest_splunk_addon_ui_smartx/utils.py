@@ -14,22 +14,39 @@
 # limitations under the License.
 #
 
+import functools
+import time
+import weakref
+from contextlib import contextmanager
 from typing import List, NamedTuple, Optional
 from enum import Enum, auto
 
+# Selenium does not expose the current implicit wait, so it is remembered per browser
+_implicit_waits = weakref.WeakKeyDictionary()
+_navigation_generations = weakref.WeakKeyDictionary()
+
+
+def backend_retry(retry_count, backoff=0, retry_on=Exception):
+    """
+    Retry the decorated method if it raises an exception.
+        :param retry_count: number of attempts
+        :param backoff: seconds to wait before the second attempt, doubled for every next attempt
+        :param retry_on: exception class or tuple of the exceptions to retry, the other ones are raised at once
+    """
 
-def backend_retry(retry_count):
     # The decorator itself
     def backend_retry_decorator(method):
         # Inner method in the decorator
+        @functools.wraps(method)
         def retry_method(*args, **kwargs):
             last_exc = Exception()
 
-            # Try 3 times
-            for _ in range(retry_count):
+            for attempt in range(retry_count):
+                if attempt and backoff:
+                    time.sleep(backoff * 2 ** (attempt - 1))
                 try:
                     return method(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
                     last_exc = e
             else:
                 if last_exc:
@@ -40,6 +57,59 @@ def backend_retry(retry_count):
     return backend_retry_decorator
 
 
+def set_implicit_wait(browser, seconds):
+    """
+    Set the implicit wait of the browser and remember it, so that it can be restored after suppress_implicit_wait.
+        :param browser: The instance of the selenium webdriver
+        :param seconds: The implicit wait in seconds
+    """
+    browser.implicitly_wait(seconds)
+    _implicit_waits[browser] = seconds
+
+
+def get_implicit_wait(browser):
+    """
+    Get the implicit wait set with set_implicit_wait
+        :param browser: The instance of the selenium webdriver
+        :returns: The implicit wait in seconds, 0 if it was not set
+    """
+    return _implicit_waits.get(browser, 0)
+
+
+@contextmanager
+def suppress_implicit_wait(browser):
+    """
+    Disable the implicit wait of the browser within the context, so that a lookup of an absent element returns immediately.
+        :param browser: The instance of the selenium webdriver
+    """
+    seconds = get_implicit_wait(browser)
+    if not seconds:
+        yield
+        return
+    browser.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        browser.implicitly_wait(seconds)
+
+
+def mark_navigation(browser):
+    """
+    Record that the browser has navigated to a new page, so that the web elements cached by the components are located again.
+        :param browser: The instance of the selenium webdriver
+    """
+    _navigation_generations[browser] = _navigation_generations.get(browser, 0) + 1
+
+
+def get_navigation_generation(browser):
+    """
+    Get the number of navigations recorded with mark_navigation
+        :param browser: The instance of the selenium webdriver
+        :returns: Int the navigation generation of the browser
+    """
+    return _navigation_generations.get(browser, 0)
+
+
 class LogLevel(Enum):
     INFO = auto()
     DEBUG = auto()
@@ -0,0 +1,251 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+WaitPolicy = namedtuple(
+    "WaitPolicy", ["min_poll", "max_poll", "backoff"], defaults=[0.05, 1.0, 1.5]
+)
+DEFAULT_POLICY = WaitPolicy()
+WaitStats = namedtuple(
+    "WaitStats", ["waits", "polls", "max_polls", "timeouts", "wait_time"]
+)
+
+
+def parse_policy(value, base=DEFAULT_POLICY):
+    """
+    Parse the policy overrides given in the format "min_poll=0.1,max_poll=2,backoff=2"
+        :param value: str policy
+        :param base: WaitPolicy whose values are used for the parameters not mentioned
+        :returns: WaitPolicy
+    """
+    params = dict()
+    for each in value.split(","):
+        if not each.strip():
+            continue
+        param, _, param_value = each.partition("=")
+        param = param.strip()
+        if param not in WaitPolicy._fields:
+            raise ValueError(
+                "Invalid wait policy parameter {}. Supported values: {}".format(
+                    param, WaitPolicy._fields
+                )
+            )
+        params[param] = float(param_value)
+    return base._replace(**params)
+
+
+class AdaptiveWebDriverWait(WebDriverWait):
+    """
+    WebDriverWait which starts polling fast and backs off exponentially up to the max poll interval.
+    The fast conditions return quickly while the slow ones do not hammer the browser.
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeout,
+        policy=DEFAULT_POLICY,
+        name=None,
+        engine=None,
+        ignored_exceptions=None,
+    ):
+        """
+        :param driver: The instance of the selenium webdriver
+        :param timeout: Number of seconds before timing out
+        :param policy: WaitPolicy with the min & max poll interval and the backoff factor
+        :param name: name under which the polls are counted in the engine stats
+        :param engine: WaitEngine collecting the stats
+        :param ignored_exceptions: iterable structure of exception classes ignored during calls
+        """
+        super().__init__(
+            driver,
+            timeout,
+            poll_frequency=policy.min_poll,
+            ignored_exceptions=ignored_exceptions,
+        )
+        self.policy = policy
+        self.name = name
+        self.engine = engine
+        self.last_polls = 0
+
+    def until(self, method, message=""):
+        """
+        Calls the method provided with the driver as an argument until the return value is not False.
+            :param method: callable(driver)
+            :param message: the error-msg of the TimeoutException
+            :returns: the result of the last call to the method
+        """
+        return self._wait(method, message, until_not=False)
+
+    def until_not(self, method, message=""):
+        """
+        Calls the method provided with the driver as an argument until the return value is False.
+            :param method: callable(driver)
+            :param message: the error-msg of the TimeoutException
+            :returns: the result of the last call to the method
+        """
+        return self._wait(method, message, until_not=True)
+
+    def _wait(self, method, message, until_not):
+        """
+        Poll the method with the growing interval until the expected result or the timeout.
+            :param method: callable(driver)
+            :param message: the error-msg of the TimeoutException
+            :param until_not: wait for a falsy result instead of a truthy one
+            :returns: the result of the last call to the method
+        """
+        screen = None
+        stacktrace = None
+        interval = self.policy.min_poll
+        start_time = time.monotonic()
+        end_time = start_time + self._timeout
+        self.last_polls = 0
+        timed_out = False
+        try:
+            while True:
+                self.last_polls += 1
+                try:
+                    value = method(self._driver)
+                    if bool(value) != until_not:
+                        return value
+                except self._ignored_exceptions as exc:
+                    if until_not:
+                        return True
+                    screen = getattr(exc, "screen", None)
+                    stacktrace = getattr(exc, "stacktrace", None)
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(interval, remaining))
+                interval = min(interval * self.policy.backoff, self.policy.max_poll)
+            timed_out = True
+            raise TimeoutException(message, screen, stacktrace)
+        finally:
+            if self.engine:
+                self.engine.record(
+                    self.name, self.last_polls, time.monotonic() - start_time, timed_out
+                )
+
+
+class WaitEngine:
+    """
+    Creates the waits of the components with the configured polling policy and counts the polls of each wait.
+    The policy can be overridden per component class, the overrides are inherited by the subclasses.
+    """
+
+    def __init__(self, default_policy=DEFAULT_POLICY):
+        """
+        :param default_policy: WaitPolicy used if there is no override
+        """
+        self.default_policy = default_policy
+        self.overrides = dict()
+        self._stats = dict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, default_policy=None, overrides=None):
+        """
+        Configure the polling policies
+            :param default_policy: WaitPolicy used if there is no override
+            :param overrides: dictionary {component class name: WaitPolicy}
+        """
+        if default_policy:
+            self.default_policy = default_policy
+        if overrides is not None:
+            self.overrides = dict(overrides)
+
+    def get_policy(self, owner=None):
+        """
+        Get the polling policy
+            :param owner: the component, or the name of the wait
+            :returns: WaitPolicy
+        """
+        if isinstance(owner, str):
+            return self.overrides.get(owner, self.default_policy)
+        for each_class in type(owner).__mro__:
+            if each_class.__name__ in self.overrides:
+                return self.overrides[each_class.__name__]
+        return self.default_policy
+
+    def create_wait(self, driver, timeout, owner=None, ignored_exceptions=None):
+        """
+        Create the wait with the policy of the owner
+            :param driver: The instance of the selenium webdriver
+            :param timeout: Number of seconds before timing out
+            :param owner: the component, or the name of the wait
+            :param ignored_exceptions: iterable structure of exception classes ignored during calls
+            :returns: AdaptiveWebDriverWait
+        """
+        name = (
+            owner if isinstance(owner, str) or owner is None else type(owner).__name__
+        )
+        return AdaptiveWebDriverWait(
+            driver,
+            timeout,
+            policy=self.get_policy(owner),
+            name=name,
+            engine=self,
+            ignored_exceptions=ignored_exceptions,
+        )
+
+    def record(self, name, polls, wait_time, timed_out):
+        """
+        Count the polls of a finished wait
+            :param name: name of the wait
+            :param polls: number of times the condition was checked
+            :param wait_time: seconds spent in the wait
+            :param timed_out: whether the wait timed out
+        """
+        self._local.wait_time = self.get_thread_wait_time() + wait_time
+        with self._lock:
+            stats = self._stats.get(name, WaitStats(0, 0, 0, 0, 0.0))
+            self._stats[name] = WaitStats(
+                waits=stats.waits + 1,
+                polls=stats.polls + polls,
+                max_polls=max(stats.max_polls, polls),
+                timeouts=stats.timeouts + int(timed_out),
+                wait_time=stats.wait_time + wait_time,
+            )
+
+    def get_thread_wait_time(self):
+        """
+        Get the time spent in the waits by the current thread, since the start of the session
+            :returns: seconds
+        """
+        return getattr(self._local, "wait_time", 0.0)
+
+    def get_stats(self):
+        """
+        Get the poll counters
+            :returns: dictionary {wait name: WaitStats}
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        """
+        Reset the poll counters
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+WAIT_ENGINE = WaitEngine()
@@ -0,0 +1,132 @@
+#
+# Copyright 2025 Splunk Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+import requests
+
+from .utils import backend_retry
+
+LOGIN_URL_FRAGMENT = "/account/login"
+SESSION_COOKIE_PREFIXES = ("splunkd_", "splunkweb_")
+# Any lightweight page of Splunk web, cookies can only be added for the domain of the current page.
+COOKIE_DOMAIN_PATH = "/robots.txt"
+
+
+class SplunkWebSessionCache:
+    """
+    Cache of the Splunk web session cookies per Splunk web url & username.
+    The cookies are injected into the new browsers so that they do not have to go through the login form.
+    """
+
+    def __init__(self):
+        self._cookies = dict()
+        self._lock = threading.Lock()
+
+    def get(self, splunk_web_url, username):
+        """
+        Get the cached cookies
+            :param splunk_web_url: Splunk web url
+            :param username: username of the Splunk instance
+            :returns: list of cookie dictionaries or None
+        """
+        with self._lock:
+            return self._cookies.get((splunk_web_url, username))
+
+    def set(self, splunk_web_url, username, cookies):
+        """
+        Store the session cookies. Only the Splunk web session cookies are kept.
+            :param splunk_web_url: Splunk web url
+            :param username: username of the Splunk instance
+            :param cookies: list of cookie dictionaries, as returned by WebDriver.get_cookies()
+        """
+        session_cookies = [
+            {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "path": cookie.get("path") or "/",
+                "secure": bool(cookie.get("secure")),
+            }
+            for cookie in cookies
+            if cookie["name"].startswith(SESSION_COOKIE_PREFIXES)
+        ]
+        with self._lock:
+            self._cookies[(splunk_web_url, username)] = session_cookies
+
+    def invalidate(self, splunk_web_url, username):
+        """
+        Drop the cached cookies, for example when Splunk has expired the session.
+            :param splunk_web_url: Splunk web url
+            :param username: username of the Splunk instance
+        """
+        with self._lock:
+            self._cookies.pop((splunk_web_url, username), None)
+
+    def login(self, splunk_web_url, username, password):
+        """
+        Get the session cookies from the cache, or authenticate once over http and cache them.
+            :param splunk_web_url: Splunk web url
+            :param username: username of the Splunk instance
+            :param password: password of the Splunk instance
+            :returns: list of cookie dictionaries
+        """
+        cookies = self.get(splunk_web_url, username)
+        if cookies is None:
+            self.set(
+                splunk_web_url,
+                username,
+                get_session_cookies(splunk_web_url, username, password),
+            )
+            cookies = self.get(splunk_web_url, username)
+        return cookies
+
+
+@backend_retry(3)
+def get_session_cookies(splunk_web_url, username, password):
+    """
+    Login to Splunk web without a browser and return the session cookies.
+    Splunk web expects the cval cookie, issued by the login page, to be posted back with the credentials.
+        :param splunk_web_url: Splunk web url
+        :param username: username of the Splunk instance
+        :param password: password of the Splunk instance
+        :returns: list of cookie dictionaries
+    """
+    login_url = "{}/en-US{}".format(splunk_web_url, LOGIN_URL_FRAGMENT)
+    with requests.Session() as session:
+        session.get(login_url, verify=False)
+        res = session.post(
+            login_url,
+            data={
+                "username": username,
+                "password": password,
+                "cval": session.cookies.get("cval", ""),
+                "set_has_logged_in": "false",
+            },
+            verify=False,
+        )
+        cookies = [
+            {"name": cookie.name, "value": cookie.value, "path": cookie.path}
+            for cookie in session.cookies
+        ]
+    if not any(cookie["name"].startswith("splunkd_") for cookie in cookies):
+        raise Exception(
+            "Could not login to Splunk web, verify credentials. status_code={}".format(
+                res.status_code
+            )
+        )
+    return cookies
+
+
+SPLUNK_WEB_SESSIONS = SplunkWebSessionCache()
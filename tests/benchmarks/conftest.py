@@ -0,0 +1,126 @@
+import json
+import os
+import time
+from collections import namedtuple
+
+import pytest
+
+from pytest_splunk_addon_ui_smartx.dom_driver import DomWebDriver
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "round_trips.json")
+SNAPSHOTS = os.path.join(os.path.dirname(__file__), "snapshots")
+
+BenchmarkResult = namedtuple(
+    "BenchmarkResult", ["name", "round_trips", "baseline", "wall_time", "latency"]
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ucc-smartx benchmarks")
+    group.addoption(
+        "--grid-latency",
+        action="store",
+        type=float,
+        default=50,
+        help="Simulated latency of every WebDriver command, in ms. (Default: 50)",
+    )
+    group.addoption(
+        "--update-round-trips",
+        action="store_true",
+        help="Record the measured round trips as the new baseline instead of checking them.",
+    )
+
+
+class Benchmarks:
+    """
+    Runs the component operations against the DOM driver and checks their round trips against the baseline.
+    Every command is charged the latency of a remote grid in the simulated time.
+    """
+
+    def __init__(self, latency, update):
+        self.latency = latency
+        self.update = update
+        self.results = list()
+        with open(BASELINE_PATH) as baseline:
+            self.baseline = json.load(baseline)
+
+    def browser(self, snapshot):
+        """
+        :param snapshot: file name of the HTML snapshot
+        :returns: DomWebDriver serving the snapshot
+        """
+        return DomWebDriver.from_file(os.path.join(SNAPSHOTS, snapshot))
+
+    def run(self, name, browser, operation):
+        """
+        Run the operation and record its round trips.
+        Fails if the operation takes more round trips than its baseline.
+            :param name: name of the benchmark in the baseline
+            :param browser: the DomWebDriver used by the operation
+            :param operation: callable
+            :returns: the result of the operation
+        """
+        browser.reset_counters()
+        start_time = time.perf_counter()
+        result = operation()
+        wall_time = time.perf_counter() - start_time
+        baseline = self.baseline.get(name)
+        self.results.append(
+            BenchmarkResult(
+                name, browser.round_trips, baseline, wall_time, self.latency
+            )
+        )
+        if self.update:
+            self.baseline[name] = browser.round_trips
+        elif baseline is None:
+            pytest.fail(
+                "No round trip baseline for {}, run with --update-round-trips".format(
+                    name
+                )
+            )
+        elif browser.round_trips > baseline:
+            pytest.fail(
+                "{} regressed: {} round trips, baseline {}. Commands: {}".format(
+                    name, browser.round_trips, baseline, browser.commands
+                )
+            )
+        return result
+
+    def save_baseline(self):
+        with open(BASELINE_PATH, "w") as baseline:
+            json.dump(self.baseline, baseline, indent=2, sort_keys=True)
+            baseline.write("\n")
+
+
+@pytest.fixture(scope="session")
+def benchmarks(request):
+    benchmarks = Benchmarks(
+        request.config.getoption("--grid-latency") / 1000,
+        request.config.getoption("--update-round-trips"),
+    )
+    request.config._ucc_smartx_benchmarks = benchmarks
+    yield benchmarks
+    if benchmarks.update:
+        benchmarks.save_baseline()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    benchmarks = getattr(config, "_ucc_smartx_benchmarks", None)
+    if not benchmarks or not benchmarks.results:
+        return
+    terminalreporter.write_sep("-", "ucc-smartx component benchmarks")
+    terminalreporter.write_line(
+        "{:<45} {:>11} {:>9} {:>11} {:>16}".format(
+            "operation", "round trips", "baseline", "wall (ms)", "simulated (ms)"
+        )
+    )
+    for each in benchmarks.results:
+        terminalreporter.write_line(
+            "{:<45} {:>11} {:>9} {:>11.1f} {:>16.1f}".format(
+                each.name,
+                each.round_trips,
+                "-" if each.baseline is None else each.baseline,
+                each.wall_time * 1000,
+                (each.wall_time + each.round_trips * each.latency) * 1000,
+            )
+        )
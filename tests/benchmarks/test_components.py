@@ -0,0 +1,227 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from pytest_splunk_addon_ui_smartx.components.base_component import Selector
+from pytest_splunk_addon_ui_smartx.components.controls.checkbox import Checkbox
+from pytest_splunk_addon_ui_smartx.components.controls.checkboxgroup import (
+    CheckboxGroup,
+)
+from pytest_splunk_addon_ui_smartx.components.controls.multi_select import MultiSelect
+from pytest_splunk_addon_ui_smartx.components.controls.single_select import (
+    SingleSelect,
+)
+from pytest_splunk_addon_ui_smartx.components.controls.textarea import TextArea
+from pytest_splunk_addon_ui_smartx.components.controls.textbox import TextBox
+from pytest_splunk_addon_ui_smartx.components.dropdown import Dropdown
+from pytest_splunk_addon_ui_smartx.components.entity import Entity
+from pytest_splunk_addon_ui_smartx.components.input_table import InputTable
+from pytest_splunk_addon_ui_smartx.components.message_tray import MessageTray
+
+MODAL = '[data-test="modal"]'
+
+
+def control_group(name):
+    return Selector(
+        select=MODAL + ' [data-test="control-group"][data-name="{}"]'.format(name)
+    )
+
+
+class ExampleEntity(Entity):
+    def __init__(self, browser):
+        super().__init__(browser, Selector(select=MODAL), is_single_page=True)
+        self.name = TextBox(browser, control_group("name"))
+        self.example_checkbox = Checkbox(browser, control_group("input_one_checkbox"))
+        self.interval = TextBox(browser, control_group("interval"))
+        self.index = SingleSelect(browser, control_group("index"))
+        self.account = SingleSelect(browser, control_group("account"))
+        self.multiple_select = MultiSelect(browser, control_group("multipleSelectTest"))
+        self.description = TextArea(browser, control_group("description"))
+
+
+@pytest.fixture()
+def inputs_page(benchmarks):
+    return benchmarks.browser("inputs_page.html")
+
+
+@pytest.fixture()
+def entity_form(benchmarks):
+    return benchmarks.browser("entity_form.html")
+
+
+@pytest.fixture()
+def table(inputs_page):
+    return InputTable(
+        inputs_page,
+        Selector(select=' div[role="main"]'),
+        mapping={"status": "disabled"},
+    )
+
+
+def test_table_get_table(benchmarks, inputs_page, table):
+    rows = benchmarks.run("Table.get_table", inputs_page, table.get_table)
+    assert len(rows) == 20
+    assert rows["input_03"]["status"] == "Disabled"
+    assert rows["input_01"]["actions"] == "Edit | Clone | Search | Delete"
+
+
+def test_table_get_cell_value(benchmarks, inputs_page, table):
+    value = benchmarks.run(
+        "Table.get_cell_value",
+        inputs_page,
+        lambda: table.get_cell_value("input_07", "interval"),
+    )
+    assert value == "420"
+
+
+def test_table_get_column_values(benchmarks, inputs_page, table):
+    values = benchmarks.run(
+        "Table.get_column_values",
+        inputs_page,
+        lambda: table.get_column_values("account"),
+    )
+    assert values[:2] == ["account_1", "account_2"]
+
+
+def test_table_get_row_count(benchmarks, inputs_page, table):
+    assert benchmarks.run("Table.get_row_count", inputs_page, table.get_row_count) == 20
+
+
+def test_entity_get_values(benchmarks, entity_form):
+    entity = ExampleEntity(entity_form)
+    values = benchmarks.run("Entity.get_values", entity_form, entity.get_values)
+    assert values == {
+        "name": "input_01",
+        "example_checkbox": True,
+        "interval": "300",
+        "index": "main",
+        "account": "account_3",
+        "multiple_select": ["Option A", "Option B"],
+        "description": "Collects the example events",
+    }
+
+
+def test_entity_set_values(benchmarks, entity_form):
+    entity = ExampleEntity(entity_form)
+    changed = benchmarks.run(
+        "Entity.set_values",
+        entity_form,
+        lambda: entity.set_values(
+            {"interval": "300", "example_checkbox": True, "account": "account_7"}
+        ),
+    )
+    assert changed == ["account"]
+
+
+def test_single_select_select(benchmarks, entity_form):
+    account = SingleSelect(entity_form, control_group("account"))
+    assert benchmarks.run(
+        "SingleSelect.select", entity_form, lambda: account.select("account_11")
+    )
+
+
+def test_single_select_list_of_values(benchmarks, entity_form):
+    index = SingleSelect(entity_form, control_group("index"), searchable=False)
+    values = benchmarks.run(
+        "SingleSelect.list_of_values", entity_form, index.list_of_values
+    )
+    assert len(values) == 7
+
+
+def test_single_select_get_value(benchmarks, entity_form):
+    account = SingleSelect(entity_form, control_group("account"))
+    assert (
+        benchmarks.run("SingleSelect.get_value", entity_form, account.get_value)
+        == "account_3"
+    )
+
+
+def test_multi_select_get_values(benchmarks, entity_form):
+    multiple_select = MultiSelect(entity_form, control_group("multipleSelectTest"))
+    values = benchmarks.run(
+        "MultiSelect.get_values", entity_form, multiple_select.get_values
+    )
+    assert values == ["Option A", "Option B"]
+
+
+def test_multi_select_select(benchmarks, entity_form):
+    multiple_select = MultiSelect(entity_form, control_group("multipleSelectTest"))
+    assert benchmarks.run(
+        "MultiSelect.select", entity_form, lambda: multiple_select.select("Option D")
+    )
+
+
+def test_multi_select_list_of_values(benchmarks, entity_form):
+    multiple_select = MultiSelect(entity_form, control_group("multipleSelectTest"))
+    values = benchmarks.run(
+        "MultiSelect.list_of_values", entity_form, multiple_select.list_of_values
+    )
+    assert values == ["Option A", "Option B", "Option C", "Option D"]
+
+
+def test_dropdown_get_inputs_list(benchmarks, inputs_page):
+    create_new_input = Dropdown(inputs_page, Selector(select='[id="addInputBtn"]'))
+    values = benchmarks.run(
+        "Dropdown.get_inputs_list", inputs_page, create_new_input.get_inputs_list
+    )
+    assert len(values) == 4
+
+
+def test_dropdown_select_input_type(benchmarks, inputs_page):
+    create_new_input = Dropdown(inputs_page, Selector(select='[id="addInputBtn"]'))
+    assert benchmarks.run(
+        "Dropdown.select_input_type",
+        inputs_page,
+        lambda: create_new_input.select_input_type("Example Input Three"),
+    )
+
+
+def test_dropdown_get_value(benchmarks, inputs_page):
+    type_filter = Dropdown(inputs_page, Selector(select=".dropdownInput"))
+    assert (
+        benchmarks.run("Dropdown.get_value", inputs_page, type_filter.get_value)
+        == "All"
+    )
+
+
+def test_message_tray_get_message_list(benchmarks, inputs_page):
+    message_tray = MessageTray(inputs_page)
+    messages = benchmarks.run(
+        "MessageTray.get_message_list", inputs_page, message_tray.get_message_list
+    )
+    assert len(messages) == 3
+
+
+def test_message_tray_get_icon_attribute(benchmarks, inputs_page):
+    message_tray = MessageTray(inputs_page)
+    icon = benchmarks.run(
+        "MessageTray.get_icon_attribute",
+        inputs_page,
+        lambda: message_tray.get_icon_attribute(0),
+    )
+    assert icon == "error"
+
+
+def test_checkbox_group_get_checkbox_text_value(benchmarks, entity_form):
+    checkbox_group = CheckboxGroup(
+        entity_form, Selector(by=By.XPATH, select="//div[@type='checkboxGroup']")
+    )
+    value = benchmarks.run(
+        "CheckboxGroup.get_checkbox_text_value",
+        entity_form,
+        lambda: checkbox_group.get_checkbox_text_value(
+            "Collect folder metadata", "collectFolderMetadata"
+        ),
+    )
+    assert value == "3600"
+
+
+def test_checkbox_group_is_group_expanded(benchmarks, entity_form):
+    checkbox_group = CheckboxGroup(
+        entity_form, Selector(by=By.XPATH, select="//div[@type='checkboxGroup']")
+    )
+    expanded = benchmarks.run(
+        "CheckboxGroup.is_group_expanded",
+        entity_form,
+        lambda: checkbox_group.is_group_expanded("Collect task and tasklist"),
+    )
+    assert expanded is False
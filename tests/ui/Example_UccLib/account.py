@@ -1,7 +1,7 @@
 from pytest_splunk_addon_ui_smartx.pages.page import Page
 from pytest_splunk_addon_ui_smartx.components.base_component import Selector
 from pytest_splunk_addon_ui_smartx.components.base_component import BaseComponent
-from pytest_splunk_addon_ui_smartx.components.tabs import Tab
+from pytest_splunk_addon_ui_smartx.navigation import Navigator
 from pytest_splunk_addon_ui_smartx.components.entity import Entity
 from pytest_splunk_addon_ui_smartx.components.controls.button import Button
 from pytest_splunk_addon_ui_smartx.components.controls.single_select import SingleSelect
@@ -151,13 +151,12 @@ class AccountPage(Page):
         Open the required page. Page(super) class opens the page by default.
         """
 
-        self.browser.get(
+        Navigator(self.browser).open(
             "{}/en-US/app/Splunk_TA_UCCExample/configuration".format(
                 self.splunk_web_url
-            )
+            ),
+            tab="account",
         )
-        tab = Tab(self.browser)
-        tab.open_tab("account")
 
     def _get_account_endpoint(self):
         """
@@ -1,5 +1,5 @@
 from pytest_splunk_addon_ui_smartx.components.base_component import Selector
-from pytest_splunk_addon_ui_smartx.components.tabs import Tab
+from pytest_splunk_addon_ui_smartx.navigation import Navigator
 from pytest_splunk_addon_ui_smartx.components.entity import Entity
 from pytest_splunk_addon_ui_smartx.components.controls.textbox import TextBox
 from pytest_splunk_addon_ui_smartx.components.controls.toggle import Toggle
@@ -82,13 +82,12 @@ class Custom(Entity):
         """
         Open the required page. Page(super) class opens the page by default.
         """
-        self.browser.get(
+        Navigator(self.browser).open(
             "{}/en-US/app/Splunk_TA_UCCExample/configuration".format(
                 self.splunk_web_url
-            )
+            ),
+            tab="custom_tab",
         )
-        tab = Tab(self.browser)
-        tab.open_tab("custom_tab")
 
     def _get_custom_url(self):
         """
@@ -1,6 +1,7 @@
 from pytest_splunk_addon_ui_smartx.components.controls.checkboxgroup import (
     CheckboxGroup,
 )
+from pytest_splunk_addon_ui_smartx.navigation import Navigator
 from pytest_splunk_addon_ui_smartx.pages.page import Page
 from pytest_splunk_addon_ui_smartx.components.base_component import Selector
 from pytest_splunk_addon_ui_smartx.components.base_component import BaseComponent
@@ -320,7 +321,7 @@ class InputPage(Page):
             )
 
     def open(self):
-        self.browser.get(
+        Navigator(self.browser).open(
             "{}/en-US/app/Splunk_TA_UCCExample/inputs".format(self.splunk_web_url)
         )
 
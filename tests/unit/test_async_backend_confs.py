@@ -0,0 +1,94 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pytest_splunk_addon_ui_smartx.async_backend_confs import (
+    AsyncListBackendConf,
+    AsyncSingleBackendConf,
+    run_concurrently,
+)
+from pytest_splunk_addon_ui_smartx.backend_confs import (
+    DEFAULT_POOL_SIZE,
+    BulkOperationError,
+    ListBackendConf,
+    close_http_sessions,
+)
+
+MGMT_URL = "https://localhost:8089"
+ENDPOINT = MGMT_URL + "/servicesNS/nobody/Splunk_TA_example/example_account"
+
+
+@pytest.fixture(autouse=True)
+def http_sessions():
+    close_http_sessions()
+    yield
+    close_http_sessions()
+
+
+def test_calls_run_concurrently_within_limit():
+    conf = AsyncListBackendConf(ENDPOINT, "admin", "Chang3d!", max_concurrency=3)
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    def delete_stanza(stanza):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+        return stanza
+
+    with patch.object(conf.backend_conf, "delete_stanza", side_effect=delete_stanza):
+        results = run_concurrently(
+            *[conf.delete_stanza("account_{}".format(index)) for index in range(9)]
+        )
+    assert results == ["account_{}".format(index) for index in range(9)]
+    assert 1 < running["max"] <= 3
+
+
+def test_pool_enlarged_for_existing_session():
+    session = ListBackendConf(ENDPOINT, "admin", "Chang3d!").session
+    assert session.get_adapter(ENDPOINT)._pool_maxsize == DEFAULT_POOL_SIZE
+    conf = AsyncListBackendConf(ENDPOINT, "admin", "Chang3d!", max_concurrency=30)
+    assert conf.backend_conf.session is session
+    assert session.get_adapter(ENDPOINT)._pool_maxsize == 30
+    assert conf._executor._max_workers == 30
+    AsyncListBackendConf(ENDPOINT, "admin", "Chang3d!", max_concurrency=5)
+    assert session.get_adapter(ENDPOINT)._pool_maxsize == 30
+    conf.close()
+
+
+def test_run_concurrently_mixes_confs():
+    accounts = AsyncListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    logging = AsyncSingleBackendConf(MGMT_URL + "/settings/logging", "admin", "pw")
+    assert accounts.backend_conf.session is logging.backend_conf.session
+    with patch.object(
+        accounts.backend_conf, "get_all_stanzas", return_value={"account": {}}
+    ), patch.object(
+        logging.backend_conf, "update_parameters", return_value={"entry": []}
+    ) as update:
+        assert run_concurrently(
+            accounts.get_all_stanzas(),
+            logging.update_parameters({"loglevel": "INFO"}),
+        ) == [{"account": {}}, {"entry": []}]
+    update.assert_called_once_with({"loglevel": "INFO"})
+
+
+def test_delete_all_stanzas_aggregates_failures():
+    conf = AsyncListBackendConf(ENDPOINT, "admin", "Chang3d!")
+
+    def delete_stanza(stanza):
+        if stanza == "account_2":
+            raise AssertionError("status_code=500")
+
+    with patch.object(
+        conf.backend_conf,
+        "get_all_stanzas",
+        return_value={"account_{}".format(index): {} for index in range(4)},
+    ), patch.object(conf.backend_conf, "delete_stanza", side_effect=delete_stanza):
+        with pytest.raises(BulkOperationError) as error:
+            run_concurrently(conf.delete_all_stanzas())
+    assert list(error.value.failures) == ["account_2"]
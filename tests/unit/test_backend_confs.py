@@ -0,0 +1,188 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from pytest_splunk_addon_ui_smartx import backend_confs
+from pytest_splunk_addon_ui_smartx.backend_confs import (
+    BulkOperationError,
+    ListBackendConf,
+    SingleBackendConf,
+    get_http_session,
+)
+
+MGMT_URL = "https://localhost:8089"
+ENDPOINT = MGMT_URL + "/servicesNS/nobody/Splunk_TA_example/example_account"
+
+
+@pytest.fixture(autouse=True)
+def http_sessions():
+    backend_confs.close_http_sessions()
+    backend_confs._stanza_caches.clear()
+    yield
+    backend_confs.close_http_sessions()
+
+
+def make_response(status_code=200, json=None):
+    return MagicMock(status_code=status_code, **{"json.return_value": json})
+
+
+def test_session_shared_per_mgmt_url():
+    list_conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    single_conf = SingleBackendConf(MGMT_URL + "/services/settings", "admin", "pw")
+    assert list_conf.session is single_conf.session
+    assert get_http_session("https://other:8089/services") is not list_conf.session
+    adapter = list_conf.session.get_adapter(ENDPOINT)
+    assert adapter._pool_maxsize == backend_confs.DEFAULT_POOL_SIZE
+
+
+def test_session_key_used_instead_of_basic_auth():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!", session_key="key")
+    with patch.object(
+        conf.session, "request", return_value=make_response(json={"entry": []})
+    ) as request:
+        assert conf.get_all_stanzas() == {}
+    assert request.call_args[1]["headers"] == {"Authorization": "Splunk key"}
+    assert "auth" not in request.call_args[1]
+
+
+def test_expired_session_key_falls_back_to_basic_auth():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!", session_key="expired")
+    with patch.object(
+        conf.session,
+        "request",
+        side_effect=[make_response(401), make_response(200), make_response(200)],
+    ) as request:
+        conf.delete_stanza("account one")
+        conf.delete_stanza("account two")
+    assert request.call_count == 3
+    assert request.call_args[0] == ("DELETE", ENDPOINT + "/account+two")
+    assert request.call_args[1]["auth"] == ("admin", "Chang3d!")
+    assert conf.session_key is None
+
+
+def test_post_retried_with_backoff():
+    conf = SingleBackendConf(ENDPOINT, "admin", "Chang3d!")
+    with patch.object(
+        conf.session,
+        "request",
+        side_effect=[
+            make_response(503),
+            make_response(503),
+            make_response(200, {"entry": []}),
+        ],
+    ) as request, patch("time.sleep") as sleep:
+        conf.update_parameters({"loglevel": "DEBUG"})
+    assert request.call_count == 3
+    assert request.call_args[1]["data"] == {"loglevel": "DEBUG", "output_mode": "json"}
+    assert [each[0][0] for each in sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_post_and_delete_not_retried_on_client_errors():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    with patch.object(
+        conf.session, "request", return_value=make_response(409)
+    ) as request, patch("time.sleep") as sleep:
+        with pytest.raises(AssertionError, match="status_code=409"):
+            conf.post_stanza(ENDPOINT, {"name": "account one"})
+        request.return_value = make_response(404)
+        with pytest.raises(AssertionError, match="status_code=404"):
+            conf.delete_stanza("account one")
+    assert request.call_count == 2
+    sleep.assert_not_called()
+
+
+def test_delete_retried_when_connection_fails():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    with patch.object(
+        conf.session,
+        "request",
+        side_effect=[requests.ConnectionError("reset"), make_response(200)],
+    ) as request, patch("time.sleep"):
+        conf.delete_stanza("account one")
+    assert request.call_count == 2
+
+
+def test_delete_all_stanzas_reports_all_failures():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    stanzas = {"account_{}".format(index): {} for index in range(20)}
+
+    def delete_stanza(stanza):
+        if stanza in ("account_3", "account_7"):
+            raise AssertionError("status_code=500")
+
+    with patch.object(conf, "get_all_stanzas", return_value=stanzas), patch.object(
+        conf, "delete_stanza", side_effect=delete_stanza
+    ) as delete:
+        with pytest.raises(BulkOperationError) as error:
+            conf.delete_all_stanzas(max_workers=4)
+    assert delete.call_count == 20
+    assert set(error.value.failures) == {"account_3", "account_7"}
+    assert "failed for 2 stanza(s)" in str(error.value)
+
+
+def test_post_stanzas_keeps_order():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    stanzas = [{"name": "account_{}".format(index)} for index in range(5)]
+    with patch.object(
+        conf, "rest_call_post", side_effect=lambda url, kwargs: kwargs["name"]
+    ) as post:
+        assert conf.post_stanzas(ENDPOINT, stanzas) == [
+            "account_{}".format(index) for index in range(5)
+        ]
+    assert post.call_count == 5
+    assert all(each[0][1]["output_mode"] == "json" for each in post.call_args_list)
+
+
+STANZA_RESPONSE = {"entry": [{"name": "account", "content": {"username": "u1"}}]}
+
+
+def test_cache_disabled_by_default():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!")
+    with patch.object(conf, "rest_call", return_value=STANZA_RESPONSE) as rest_call:
+        conf.get_stanza_value("account", "username")
+        conf.get_stanza_value("account", "username")
+    assert rest_call.call_count == 2
+
+
+def test_cache_reused_within_ttl_and_cleared_by_writes():
+    conf = ListBackendConf(ENDPOINT, "admin", "Chang3d!", cache_ttl=60)
+    other_conf = SingleBackendConf(MGMT_URL + "/services/settings", "admin", "pw")
+    with patch.object(conf, "rest_call", return_value=STANZA_RESPONSE) as rest_call:
+        assert conf.get_stanza_value("account", "username") == "u1"
+        conf.get_stanza("account")["username"] = "changed"
+        assert conf.get_stanza_value("account", "username") == "u1"
+        assert rest_call.call_count == 1
+        conf.get_stanza("account", decrypt=True)
+        conf.get_stanza("account", bypass_cache=True)
+        assert rest_call.call_count == 3
+
+        with patch.object(
+            other_conf.session, "request", return_value=make_response(200, {})
+        ):
+            other_conf.update_parameters({"loglevel": "DEBUG"})
+        conf.get_stanza("account")
+        assert rest_call.call_count == 4
+
+
+def test_cache_expires_after_ttl():
+    conf = SingleBackendConf(ENDPOINT, "admin", "Chang3d!", cache_ttl=5)
+    with patch.object(
+        conf, "rest_call", return_value=STANZA_RESPONSE
+    ) as rest_call, patch("time.monotonic", side_effect=[100, 103, 106, 106]):
+        conf.get_parameter("username")
+        conf.get_parameter("username")
+        conf.get_parameter("username")
+    assert rest_call.call_count == 2
+
+
+def test_stanza_cache_is_lru_bounded():
+    cache = backend_confs.StanzaCache(max_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key, cache.generation)
+        cache.get("a", 60)
+    assert cache.get("a", 60) == "a"
+    assert cache.get("b", 60) is None
+    cache.clear()
+    cache.set("a", "stale", generation=0)
+    assert cache.get("a", 60) is None
@@ -0,0 +1,156 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.remote.webelement import WebElement
+
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    BaseComponent,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.utils import (
+    get_implicit_wait,
+    mark_navigation,
+    set_implicit_wait,
+)
+
+
+def make_component(positions):
+    browser = MagicMock()
+    browser.execute_script.side_effect = positions
+    component = BaseComponent(browser, Selector(select="#container"))
+    component.elements["button"] = Selector(select="#container button")
+    return component
+
+
+def test_wait_for_settle_until_position_is_stable():
+    component = make_component([None, "0,0,10,10", "0,5,10,10", "0,5,10,10"])
+    assert component.wait_for_settle("button") is True
+    assert component.browser.execute_script.call_count == 4
+    assert (
+        component.browser.execute_script.call_args[0][1]
+        is component.browser.find_elements.return_value[0]
+    )
+
+
+def test_wait_for_settle_gives_up_after_timeout():
+    component = make_component(lambda *args: None)
+    assert component.wait_for_settle(timeout=0.1) is False
+
+
+def test_wait_for_settle_skips_missing_element():
+    component = make_component([])
+    component.browser.find_elements.return_value = []
+    assert component.wait_for_settle("button") is False
+    component.browser.execute_script.assert_not_called()
+
+
+def test_wait_to_be_clickable_waits_for_settle_instead_of_sleeping():
+    component = make_component(["0,0,10,10", "0,0,10,10"])
+    button = component.browser.find_element.return_value
+    button.is_displayed.return_value = True
+    component.wait_to_be_clickable("button")
+    assert component.browser.execute_script.call_count == 2
+    assert component.browser.execute_script.call_args[0][1] is button
+
+
+def test_count_now_uses_single_script():
+    component = make_component([2, 0])
+    row = MagicMock()
+    assert component.count_now("button", within=row) == 2
+    assert component.exists_now("button") is False
+    assert component.browser.execute_script.call_args_list[0][0][1:] == (
+        "css selector",
+        "#container button",
+        row,
+    )
+    component.browser.find_elements.assert_not_called()
+
+
+def test_count_now_falls_back_without_implicit_wait():
+    component = make_component(JavascriptException())
+    set_implicit_wait(component.browser, 3)
+    component.browser.find_elements.return_value = ["button"]
+    with patch.object(
+        component.browser, "implicitly_wait", wraps=component.browser.implicitly_wait
+    ) as implicitly_wait:
+        assert component.exists_now("button") is True
+    assert [each[0][0] for each in implicitly_wait.call_args_list] == [0, 3]
+    assert get_implicit_wait(component.browser) == 3
+
+
+def make_settled_component(states):
+    component = make_component(states)
+    component.elements["spinner"] = Selector(select="#container .spinner")
+    component.settled_when["button"] = {"spinner": False}
+    return component
+
+
+def test_get_elements_returns_empty_list_once_settled():
+    component = make_settled_component(["settled", "settled"])
+    assert component.get_child_elements("button") == []
+    assert component.browser.execute_script.call_count == 2
+    assert component.browser.execute_script.call_args[0][1:] == (
+        ["css selector", "#container button"],
+        [[["css selector", "#container .spinner"], False]],
+    )
+    component.browser.find_elements.assert_not_called()
+
+
+def test_get_elements_waits_while_rendering():
+    component = make_settled_component(["settled", None, "present"])
+    rows = [MagicMock()]
+    component.browser.find_elements.return_value = rows
+    assert component.get_elements("button") == rows
+    assert component.browser.execute_script.call_count == 3
+
+
+def test_get_elements_falls_back_when_probe_fails():
+    component = make_settled_component(JavascriptException())
+    rows = [MagicMock()]
+    component.browser.find_elements.return_value = rows
+    assert component.get_elements("button") == rows
+    component.browser.find_element.assert_called_with(
+        "css selector", "#container button"
+    )
+
+
+def make_caching_component(*ids):
+    component = make_component([])
+    component.browser.find_element.side_effect = [
+        WebElement(component.browser, each) for each in ids
+    ]
+    return component
+
+
+def test_get_element_reuses_cached_element():
+    component = make_caching_component("first")
+    assert component.button is component.get_element("button")
+    assert component.button.id == "first"
+    component.browser.find_element.assert_called_once_with(
+        "css selector", "#container button"
+    )
+
+
+def test_cached_element_recovers_once_stale():
+    component = make_caching_component("first", "second")
+    component.browser.execute.side_effect = [
+        StaleElementReferenceException(),
+        {"value": "Save"},
+    ]
+    assert component.button.text == "Save"
+    assert component.browser.execute.call_args[0][1]["id"] == "second"
+    assert component.button.id == "second"
+
+
+def test_navigation_invalidates_cached_element():
+    component = make_caching_component("first", "second")
+    assert component.button.id == "first"
+    mark_navigation(component.browser)
+    assert component.button.id == "second"
+    component.invalidate_element_cache()
+    with pytest.raises(StopIteration):
+        component.get_element("button")
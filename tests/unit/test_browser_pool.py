@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pytest_splunk_addon_ui_smartx.browser_pool import BrowserPool
+
+
+def make_helper():
+    helper = MagicMock()
+    helper.splunk_web_url = "https://localhost:8000"
+    helper.cred = ("admin", "Chang3d!")
+    helper.browser.window_handles = ["main"]
+    helper.browser.current_url = "https://localhost:8000/en-US/app/launcher/home"
+    return helper
+
+
+@pytest.fixture()
+def pool():
+    return BrowserPool(MagicMock(side_effect=make_helper), size=2)
+
+
+def test_warm_up_launches_browsers_upfront(pool):
+    pool.warm_up()
+    assert pool.idle_count == 2
+    assert pool.factory.call_count == 2
+
+
+def test_checkout_reuses_returned_browser(pool):
+    helper = pool.checkout("chrome_test_one")
+    assert helper.test_case == "chrome_test_one"
+    pool.checkin(helper)
+    assert pool.checkout("chrome_test_two") is helper
+    assert pool.factory.call_count == 1
+
+
+def test_checkin_resets_browser(pool):
+    helper = pool.checkout()
+    helper.browser.window_handles = ["main", "popup"]
+    pool.checkin(helper)
+    helper.browser.close.assert_called_once()
+    helper.browser.switch_to.window.assert_called_with("main")
+    helper.browser.get.assert_called_with("https://localhost:8000")
+    helper.login_to_splunk.assert_not_called()
+
+
+def test_checkin_logs_in_again_when_session_expired(pool):
+    helper = pool.checkout()
+    helper.browser.current_url = "https://localhost:8000/en-US/account/login"
+    pool.checkin(helper)
+    helper.login_to_splunk.assert_called_once_with("admin", "Chang3d!")
+
+
+def test_checkin_evicts_browser_which_can_not_be_reset(pool):
+    helper = pool.checkout()
+    helper.browser.get.side_effect = Exception("session deleted")
+    pool.checkin(helper)
+    helper.browser.quit.assert_called_once()
+    assert pool.idle_count == 0
+
+
+def test_checkout_evicts_unhealthy_browser(pool):
+    pool.warm_up()
+    unhealthy = pool._idle[-1]
+    type(unhealthy.browser).current_url = property(
+        MagicMock(side_effect=Exception("no such session"))
+    )
+    helper = pool.checkout()
+    assert helper is not unhealthy
+    unhealthy.browser.quit.assert_called_once()
+
+
+def test_close_quits_idle_browsers(pool):
+    pool.warm_up()
+    idle = list(pool._idle)
+    pool.close()
+    assert pool.idle_count == 0
+    for helper in idle:
+        helper.browser.quit.assert_called_once()
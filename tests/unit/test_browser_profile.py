@@ -0,0 +1,68 @@
+import os
+
+from pytest_splunk_addon_ui_smartx.base_test import SeleniumHelper
+from pytest_splunk_addon_ui_smartx.browser_profile import BrowserProfiles
+
+# test_base_test replaces the option builders of SeleniumHelper with mocks
+get_local_chrome_opts = SeleniumHelper.get_local_chrome_opts
+get_local_firefox_opts = SeleniumHelper.get_local_firefox_opts
+
+
+def write_cache(session, size):
+    with open(os.path.join(session, "cache", "asset.js"), "wb") as asset:
+        asset.write(b"x" * size)
+
+
+def test_session_cache_becomes_template(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), cache_size=100, worker="gw0")
+    session = profiles.create_session()
+    assert os.listdir(os.path.join(session, "cache")) == []
+    write_cache(session, 10)
+    profiles.release_session(session)
+    assert not os.path.exists(session)
+
+    next_session = profiles.create_session()
+    assert os.listdir(os.path.join(next_session, "cache")) == ["asset.js"]
+    assert os.listdir(os.path.join(next_session, "profile")) == []
+    assert profiles.root == os.path.join(str(tmp_path), "gw0")
+
+
+def test_cache_over_cap_is_discarded(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), cache_size=100, worker="gw0")
+    session = profiles.create_session()
+    write_cache(session, 101)
+    profiles.release_session(session)
+    assert not os.path.exists(profiles.template)
+    assert os.listdir(profiles.sessions) == []
+
+
+def test_stale_sessions_are_removed(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), worker="gw0")
+    session = profiles.create_session()
+    os.utime(session, (0, 0))
+    BrowserProfiles(str(tmp_path), worker="gw0")
+    assert not os.path.exists(session)
+
+
+def test_chrome_uses_session_directories(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), cache_size=100, worker="gw0")
+    session = profiles.create_session()
+    arguments = get_local_chrome_opts(
+        False, profile_arguments=profiles.get_chrome_arguments(session)
+    ).arguments
+    assert "--guest" not in arguments
+    assert "--disk-cache-dir={}".format(os.path.join(session, "cache")) in arguments
+    assert "--disk-cache-size=100" in arguments
+    assert "--guest" in get_local_chrome_opts(False).arguments
+
+
+def test_firefox_uses_session_cache(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), cache_size=2048, worker="gw0")
+    session = profiles.create_session()
+    options = get_local_firefox_opts(
+        False, preferences=profiles.get_firefox_preferences(session)
+    )
+    assert options.preferences["browser.cache.disk.capacity"] == 2
+    assert options.preferences["browser.cache.disk.parent_directory"] == os.path.join(
+        session, "cache"
+    )
@@ -0,0 +1,209 @@
+import lxml.html
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.by import By
+
+from pytest_splunk_addon_ui_smartx.alert_actions.components.checkbox import (
+    AlertCheckbox,
+)
+from pytest_splunk_addon_ui_smartx.alert_actions.components.textbox import (
+    AlertTextBox,
+)
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    BaseComponent,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.components.controls.button import Button
+from pytest_splunk_addon_ui_smartx.components.controls.textbox import TextBox
+from pytest_splunk_addon_ui_smartx.components.select_options import get_options
+from pytest_splunk_addon_ui_smartx.components.table import TABLE_GENERATION_SCRIPT
+from pytest_splunk_addon_ui_smartx.dom_driver import DomWebDriver
+
+PAGE = """
+<html>
+<head><title>Inputs</title></head>
+<body>
+<div data-test="modal">
+    <div data-test="control-group" data-name="name">
+        <label data-test="label" id="name-label">Name <span>*</span></label>
+        <input data-test="textbox" value="input_01"/>
+        <span data-test="help">Enter a unique name</span>
+    </div>
+    <div data-test="control-group" data-name="interval">
+        <input data-test="textbox" value="300" disabled/>
+    </div>
+    <p id="hint" hidden>Hidden hint</p>
+    <p id="status">Status: <b>enabled</b></p>
+    <button id="disableBtn" data-test="button"><span>Disable</span></button>
+</div>
+<form class="alert-form">
+    <div class="control-group">
+        <label class="control-label">Alert name</label>
+        <div id="alert_name"><input type="text" value="alert_01"/></div>
+        <span class="help-block">Name of the alert</span>
+    </div>
+    <div class="checkbox"><input id="alert_enabled" type="checkbox"/></div>
+</form>
+</body>
+</html>
+"""
+
+
+@pytest.fixture()
+def browser():
+    return DomWebDriver(PAGE)
+
+
+def test_find_element(browser):
+    assert browser.find_element_by_css_selector("#status b").text == "enabled"
+    assert browser.find_element(By.XPATH, "//p[@id='status']").text == (
+        "Status: enabled"
+    )
+    assert browser.find_element(By.ID, "hint").tag_name == "p"
+    assert len(browser.find_elements_by_css_selector('[data-test="textbox"]')) == 2
+    with pytest.raises(NoSuchElementException):
+        browser.find_element_by_css_selector("#missing")
+
+
+def test_find_child_element_matches_whole_selector(browser):
+    modal = browser.find_element_by_css_selector('[data-test="modal"]')
+    # like in the browser, the ancestors of the selector may be outside of the element
+    assert modal.find_element_by_css_selector('body [id="status"]').text == (
+        "Status: enabled"
+    )
+    group = modal.find_element_by_css_selector('[data-name="interval"]')
+    assert group.find_elements_by_css_selector('[data-name="name"] input') == []
+
+
+def test_get_attribute(browser):
+    assert browser.find_element_by_id("hint").get_attribute("innerText") == ""
+    assert browser.find_element_by_id("hint").get_attribute("textContent") == (
+        "Hidden hint"
+    )
+    assert not browser.find_element_by_id("hint").is_displayed()
+    textboxes = browser.find_elements_by_css_selector('[data-test="textbox"]')
+    assert textboxes[0].get_attribute("value") == "input_01"
+    assert textboxes[0].get_attribute("disabled") is None
+    assert textboxes[1].get_attribute("disabled") == "true"
+    assert not textboxes[1].is_enabled()
+    assert browser.title == "Inputs"
+
+
+def test_commands_are_counted(browser):
+    browser.find_element_by_id("status").text
+    assert browser.round_trips == 2
+    browser.reset_counters()
+    assert browser.commands == []
+
+
+def test_load_makes_elements_stale(browser):
+    status = browser.find_element_by_id("status")
+    browser.load(PAGE)
+    with pytest.raises(StaleElementReferenceException):
+        status.text
+    assert browser.find_element_by_id("status").text == "Status: enabled"
+
+
+def test_unsupported_script(browser):
+    with pytest.raises(JavascriptException):
+        browser.execute_script("return window.location.href")
+
+
+def test_textbox(browser):
+    name = TextBox(browser, Selector(select='[data-name="name"]'))
+    name.set_value("input_02")
+    assert name.get_value() == "input_02"
+    assert name.get_input_label() == "Name"
+    assert name.get_help_text() == "Enter a unique name"
+    name.clear_text()
+    assert name.get_value() == ""
+
+
+def test_textbox_fast_fill(browser):
+    name = TextBox(browser, Selector(select='[data-name="name"]'), fast_fill=True)
+    name.set_value("input_03")
+    assert name.get_value() == "input_03"
+
+
+def test_click_hook(browser):
+    def disable(driver, element):
+        status = driver.query_one(driver.document, ("id", "status"))
+        status.find("b").text = "disabled"
+        element.find("span").text = "Enable"
+
+    browser.on_click(By.ID, "disableBtn", disable)
+    generation = browser.execute_script(TABLE_GENERATION_SCRIPT, "status", "#status")
+    button = Button(browser, Selector(select="#disableBtn"))
+    button.click()
+    assert browser.find_element_by_id("status").text == "Status: disabled"
+    assert button.container.text == "Enable"
+    assert (
+        browser.execute_script(TABLE_GENERATION_SCRIPT, "status", "#status")
+        != generation
+    )
+
+
+def test_click_hooks_run_innermost_first(browser):
+    calls = list()
+    browser.on_click(
+        By.CSS_SELECTOR, '[data-test="modal"]', lambda d, e: calls.append("modal")
+    )
+    browser.on_click(
+        By.CSS_SELECTOR, "#disableBtn", lambda d, e: calls.append("button")
+    )
+    browser.find_element_by_css_selector("#disableBtn span").click()
+    assert calls == ["button", "modal"]
+
+
+def test_alert_textbox(browser):
+    textbox = AlertTextBox(browser, Selector(select="#alert_name"))
+    assert textbox.get_value() == "alert_01"
+    textbox.set_value("alert_02")
+    assert textbox.get_value() == "alert_02"
+    assert textbox.get_help_text() == "Name of the alert"
+    assert textbox.get_input_label() == "Alert name"
+
+
+def test_alert_checkbox(browser):
+    checkbox = AlertCheckbox(browser, Selector(select="#alert_enabled"))
+    assert not checkbox.is_checked()
+    assert checkbox.check() is True
+    assert checkbox.is_checked()
+    assert checkbox.uncheck() is True
+    assert not checkbox.is_checked()
+
+
+def test_options_loaded_on_scroll():
+    browser = DomWebDriver(
+        '<html><body><div data-test="popover">'
+        '<button data-test="option" data-test-value="a">Option A</button>'
+        "</div></body></html>"
+    )
+    select = '[data-test="popover"] [data-test="option"]'
+    batches = ["b", "c"]
+
+    def load_batch(driver):
+        value = batches.pop(0)
+        popover = driver.query_one(
+            driver.document, ("css selector", select)
+        ).getparent()
+        option = lxml.html.fragment_fromstring(
+            '<button data-test="option" data-test-value="{0}">Option {0}</button>'.format(
+                value.upper()
+            )
+        )
+        popover.append(option)
+        return bool(batches)
+
+    browser.on_scroll(select, load_batch)
+    component = BaseComponent(browser, Selector(select="#select"))
+    component.elements["values"] = Selector(select=select)
+    assert [each.label for each in get_options(component, "values")] == [
+        "Option A",
+        "Option B",
+        "Option C",
+    ]
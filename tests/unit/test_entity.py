@@ -0,0 +1,187 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pytest_splunk_addon_ui_smartx.components.base_component import Selector
+from pytest_splunk_addon_ui_smartx.components.controls.checkbox import Checkbox
+from pytest_splunk_addon_ui_smartx.components.controls.multi_select import MultiSelect
+from pytest_splunk_addon_ui_smartx.components.controls.textbox import TextBox
+from pytest_splunk_addon_ui_smartx.components.entity import (
+    FORM_VALUES_SCRIPT,
+    SAVE_WATCH_SCRIPT,
+    Entity,
+    SaveOutcome,
+    SaveStatus,
+)
+from pytest_splunk_addon_ui_smartx.dom_driver import DomWebDriver
+
+SINGLE_PAGE = """
+<html><body><div id="proxyTab">
+    <input data-test="textbox" value="proxy.example.com"/>
+    <button class="saveBtn">Save</button>
+</div></body></html>
+"""
+
+
+def probe(error="", warning="", container=True, spinner=False, submitted=False):
+    return {
+        "error": error,
+        "warning": warning,
+        "container": container,
+        "spinner": spinner,
+        "submitted": submitted,
+    }
+
+
+def make_entity(probes, is_single_page=False):
+    browser = MagicMock()
+    browser.execute_script.side_effect = probes
+    entity = Entity(
+        browser,
+        Selector(select='[data-test="modal"]'),
+        add_btn=MagicMock(),
+        is_single_page=is_single_page,
+    )
+    entity.save_btn = MagicMock()
+    return entity
+
+
+@pytest.mark.parametrize(
+    "probes,result",
+    [
+        ([probe(spinner=True), probe(error="Invalid interval")], "Invalid interval"),
+        ([probe(warning="Unsaved", error="")], "Unsaved"),
+        ([probe(spinner=True), probe(container=False)], True),
+    ],
+)
+def test_save_returns_on_first_outcome(probes, result):
+    entity = make_entity(probes)
+    with pytest.deprecated_call():
+        assert entity.save() == result
+    entity.save_btn.click.assert_called_once()
+    assert entity.browser.execute_script.call_count == len(probes)
+    locators = entity.browser.execute_script.call_args[0][1:]
+    assert locators[2] == ["css selector", '[data-test="modal"]']
+
+
+def test_single_page_saved_once_submitted():
+    entity = make_entity(
+        [
+            True,
+            probe(),
+            probe(spinner=True, submitted=True),
+            probe(submitted=True),
+        ],
+        is_single_page=True,
+    )
+    with pytest.deprecated_call():
+        assert entity.save() is True
+    scripts = [each[0][0] for each in entity.browser.execute_script.call_args_list]
+    assert scripts[0] == SAVE_WATCH_SCRIPT
+    assert entity.browser.execute_script.call_count == 4
+
+
+def test_single_page_not_saved_without_submission():
+    entity = make_entity(lambda *args: probe(), is_single_page=True)
+    assert entity.wait_for_save_outcome(timeout=0.1).status == SaveStatus.TIMEOUT
+
+
+def test_single_page_save_on_dom():
+    browser = DomWebDriver(SINGLE_PAGE)
+    entity = Entity(browser, Selector(select="#proxyTab"), is_single_page=True)
+
+    def save(driver, element):
+        element.set("disabled", "true")
+
+    browser.on_click(By.CSS_SELECTOR, "#proxyTab .saveBtn", save)
+    assert entity.watch_save()
+    entity.save_btn.click()
+    assert entity.wait_for_save_outcome(timeout=0.1).status == SaveStatus.TIMEOUT
+    del browser.query_one(browser.document, ("css selector", ".saveBtn")).attrib[
+        "disabled"
+    ]
+    browser.mutated()
+    assert entity.wait_for_save_outcome() == SaveOutcome(SaveStatus.SAVED)
+
+
+def test_wait_for_save_outcome_timeout():
+    entity = make_entity(lambda *args: probe(spinner=True))
+    assert entity.wait_for_save_outcome(timeout=0.1).status == SaveStatus.TIMEOUT
+
+
+def test_save_falls_back_to_messages_when_probe_fails():
+    entity = make_entity(JavascriptException())
+    entity.msg_error = MagicMock(**{"get_msg.side_effect": TimeoutException()})
+    entity.msg_warning = MagicMock(**{"get_msg.return_value": "Warning"})
+    with pytest.deprecated_call():
+        assert entity.save() == "Warning"
+
+
+def test_is_error_closed_does_not_wait():
+    entity = make_entity([probe(error="Invalid"), probe()])
+    assert entity.is_error_closed() is False
+    assert entity.is_error_closed() is True
+
+
+def make_form(values):
+    entity = make_entity(lambda *args: values)
+    container = '[data-test="modal"] [data-test="control-group"]'
+    entity.name = TextBox(entity.browser, Selector(select=container + "[data-name=n]"))
+    entity.enabled = Checkbox(
+        entity.browser, Selector(select=container + "[data-name=e]")
+    )
+    entity.groups = MultiSelect(
+        entity.browser, Selector(select=container + "[data-name=g]")
+    )
+    return entity
+
+
+def test_get_values_reads_all_controls_at_once():
+    values = {"name": "input_one", "enabled": True, "groups": ["a", "b"]}
+    entity = make_form(values)
+    assert set(entity.get_controls()) == {"name", "enabled", "groups"}
+    assert entity.get_values() == values
+    script, probes = entity.browser.execute_script.call_args[0]
+    assert script == FORM_VALUES_SCRIPT
+    assert probes[0] == [
+        "name",
+        "value_trim",
+        [
+            "css selector",
+            '[data-test="modal"] [data-test="control-group"][data-name=n] input',
+        ],
+    ]
+    assert [each[1] for each in probes] == ["value_trim", "checked", "texts"]
+
+
+def test_set_values_updates_only_changed_controls():
+    entity = make_form({"name": "input_one", "enabled": True})
+    entity.name.set_form_value = MagicMock()
+    entity.enabled.set_form_value = MagicMock()
+    assert entity.set_values({"name": "input_one", "enabled": False}) == ["enabled"]
+    entity.name.set_form_value.assert_not_called()
+    entity.enabled.set_form_value.assert_called_once_with(False)
+    probes = entity.browser.execute_script.call_args[0][1]
+    assert [each[0] for each in probes] == ["name", "enabled"]
+
+
+def test_set_values_sets_text_through_set_value():
+    entity = make_form({"name": "input_one"})
+    entity.name.set_value = MagicMock()
+    assert entity.set_values({"name": "input_two"}) == ["name"]
+    entity.name.set_value.assert_called_once_with("input_two")
+
+
+def test_set_values_rejects_unknown_controls():
+    entity = make_form({})
+    with pytest.raises(ValueError, match="interval"):
+        entity.set_values({"interval": "60"})
+
+
+def test_get_values_falls_back_to_controls():
+    entity = make_form({})
+    entity.browser.execute_script.side_effect = JavascriptException()
+    entity.browser.find_element.return_value.get_attribute.return_value = " input "
+    assert entity.get_values(["name"]) == {"name": "input"}
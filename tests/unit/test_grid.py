@@ -0,0 +1,165 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from selenium.common.exceptions import SessionNotCreatedException
+
+from pytest_splunk_addon_ui_smartx.base_test import SeleniumHelper
+from pytest_splunk_addon_ui_smartx.grid import (
+    GridSaturatedError,
+    GridUnreachableError,
+    SeleniumGrid,
+    get_free_slots,
+    get_hosts,
+    get_hub_url,
+)
+
+HUB_ONE = "http://hub1:4444/wd/hub"
+HUB_TWO = "http://hub2:4444/wd/hub"
+
+
+def get_status(free, busy=0, browser="chrome", ready=True):
+    slots = [{"stereotype": {"browserName": browser}, "session": None}] * free
+    slots += [{"stereotype": {"browserName": browser}, "session": {"id": "s"}}] * busy
+    return {
+        "value": {
+            "ready": ready,
+            "nodes": [{"availability": "UP", "slots": slots}],
+        }
+    }
+
+
+def mock_hubs(statuses):
+    def get(url, timeout):
+        status = statuses[url.rpartition("/status")[0]]
+        if isinstance(status, Exception):
+            raise status
+        response = MagicMock()
+        response.json.return_value = status
+        return response
+
+    return patch("requests.get", side_effect=get)
+
+
+def test_get_hub_url():
+    assert get_hub_url("http://selenium") == "http://selenium:4444/wd/hub"
+    assert get_hub_url(" http://selenium:5555/wd/hub/") == (
+        "http://selenium:5555/wd/hub"
+    )
+    assert get_hosts("http://hub1, http://hub2,") == ["http://hub1", "http://hub2"]
+    assert get_hosts(None) == []
+
+
+def test_get_free_slots():
+    status = get_status(2, busy=1)["value"]
+    status["nodes"].append(
+        {
+            "availability": "DRAINING",
+            "slots": [{"stereotype": {"browserName": "chrome"}, "session": None}],
+        }
+    )
+    status["nodes"].append(
+        {"slots": [{"stereotype": {"browserName": "firefox"}, "session": None}]}
+    )
+    assert get_free_slots(status) == 3
+    assert get_free_slots(status, "chrome") == 2
+    assert get_free_slots({"ready": True}) is None
+
+
+def test_rank_least_loaded_first():
+    grid = SeleniumGrid(["http://hub1", "http://hub2"])
+    with mock_hubs({HUB_ONE: get_status(1, busy=3), HUB_TWO: get_status(3)}):
+        assert [each.url for each in grid.rank("chrome")] == [HUB_TWO, HUB_ONE]
+
+
+def test_rank_skips_saturated_and_unreachable_hubs():
+    grid = SeleniumGrid(["http://hub1", "http://hub2", "http://hub3"])
+    with mock_hubs(
+        {
+            HUB_ONE: get_status(0, busy=4),
+            HUB_TWO: requests.ConnectionError("refused"),
+            "http://hub3:4444/wd/hub": {"value": {"ready": True}},
+        }
+    ):
+        ranked = grid.rank("chrome")
+    assert [(each.url, each.free_slots) for each in ranked] == [
+        ("http://hub3:4444/wd/hub", None)
+    ]
+
+
+def test_create_session_fails_over():
+    grid = SeleniumGrid(["http://hub1", "http://hub2"])
+    factory = MagicMock(side_effect=[SessionNotCreatedException("full"), "driver"])
+    with mock_hubs({HUB_ONE: get_status(2), HUB_TWO: get_status(1)}):
+        assert grid.create_session(factory, "chrome") == "driver"
+        assert [each.args[0] for each in factory.call_args_list] == [HUB_ONE, HUB_TWO]
+        # the failed hub is skipped during the cooldown
+        assert [each.url for each in grid.rank("chrome")] == [HUB_TWO]
+
+
+def test_create_session_raises_last_error():
+    grid = SeleniumGrid(["http://hub1"])
+    factory = MagicMock(side_effect=SessionNotCreatedException("full"))
+    with mock_hubs({HUB_ONE: get_status(1)}), pytest.raises(SessionNotCreatedException):
+        grid.create_session(factory, "chrome")
+
+
+def test_create_session_waits_for_a_free_slot():
+    grid = SeleniumGrid(["http://hub1", "http://hub2"], poll_frequency=0)
+    statuses = [
+        {HUB_ONE: get_status(0, busy=1), HUB_TWO: get_status(0, busy=1)},
+        {HUB_ONE: get_status(0, busy=1), HUB_TWO: get_status(0, busy=1)},
+        {HUB_ONE: get_status(0, busy=1), HUB_TWO: get_status(1)},
+    ]
+    queries = list()
+
+    def get_statuses(browser=None):
+        queries.append(browser)
+        with mock_hubs(statuses[len(queries) - 1]):
+            return SeleniumGrid.get_statuses(grid, browser)
+
+    grid.get_statuses = get_statuses
+    factory = MagicMock(return_value="driver")
+    assert grid.create_session(factory, "chrome") == "driver"
+    assert len(queries) == 3
+    factory.assert_called_once_with(HUB_TWO)
+
+
+def test_create_session_queue_timeout():
+    grid = SeleniumGrid(["http://hub1"], queue_timeout=0)
+    factory = MagicMock()
+    with mock_hubs({HUB_ONE: get_status(0, busy=2)}), pytest.raises(GridSaturatedError):
+        grid.create_session(factory, "chrome")
+    factory.assert_not_called()
+
+
+def test_create_session_fails_fast_when_no_hub_answers():
+    grid = SeleniumGrid(["http://hub1", "http://hub2"])
+    factory = MagicMock()
+    with mock_hubs(
+        {
+            HUB_ONE: requests.ConnectionError("refused"),
+            HUB_TWO: requests.Timeout("timeout"),
+        }
+    ), patch("time.sleep") as sleep, pytest.raises(GridUnreachableError):
+        grid.create_session(factory, "chrome")
+    sleep.assert_not_called()
+    factory.assert_not_called()
+
+
+def test_selenium_helper_creates_remote_browser_on_grid():
+    helper = SeleniumHelper.__new__(SeleniumHelper)
+    helper.selenium_grid = MagicMock()
+    helper.selenium_grid.create_session.side_effect = lambda factory, browser: factory(
+        HUB_TWO
+    )
+    options = MagicMock(capabilities={"browserName": "chrome"})
+    with patch("selenium.webdriver.Remote") as remote:
+        helper.get_remote_browser("http://hub1,http://hub2", options)
+    remote.assert_called_once_with(command_executor=HUB_TWO, options=options)
+    assert helper.selenium_grid.create_session.call_args[0][1] == "chrome"
+
+    helper.selenium_grid = None
+    with patch("selenium.webdriver.Remote") as remote:
+        helper.get_remote_browser("http://hub1,http://hub2", options)
+    remote.assert_called_once_with(command_executor=HUB_ONE, options=options)
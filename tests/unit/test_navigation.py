@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from pytest_splunk_addon_ui_smartx.navigation import (
+    NAVIGATION_STATE_SCRIPT,
+    Navigator,
+    is_same_page,
+)
+from pytest_splunk_addon_ui_smartx.utils import get_navigation_generation
+
+CONFIGURATION_URL = "https://localhost:8000/en-US/app/Splunk_TA_example/configuration"
+
+
+def state(url=CONFIGURATION_URL, ready=True, modal=False, tab="present"):
+    return {"url": url, "ready": ready, "modal": modal, "tab": tab}
+
+
+@pytest.fixture()
+def navigator(monkeypatch):
+    monkeypatch.setattr(Navigator, "enabled", True)
+    with patch("pytest_splunk_addon_ui_smartx.navigation.Tab") as tab:
+        navigator = Navigator(MagicMock())
+        navigator.tab = tab
+        yield navigator
+
+
+def test_switches_tab_on_same_page(navigator):
+    navigator.browser.execute_script.return_value = state(
+        url=CONFIGURATION_URL + "?tab=account"
+    )
+    assert navigator.open(CONFIGURATION_URL, tab="proxy") is False
+    navigator.browser.get.assert_not_called()
+    navigator.browser.execute_script.assert_called_once_with(
+        NAVIGATION_STATE_SCRIPT, "proxy"
+    )
+    navigator.tab.return_value.open_tab.assert_called_once_with("proxy")
+    assert get_navigation_generation(navigator.browser) == 1
+
+
+def test_skips_navigation_on_active_tab(navigator):
+    navigator.browser.execute_script.return_value = state(tab="active")
+    assert navigator.open(CONFIGURATION_URL, tab="proxy") is False
+    navigator.tab.assert_not_called()
+    assert get_navigation_generation(navigator.browser) == 0
+
+
+@pytest.mark.parametrize(
+    "current",
+    [
+        state(url="https://localhost:8000/en-US/app/Splunk_TA_example/inputs"),
+        state(modal=True),
+        state(ready=False),
+        state(tab=None),
+        WebDriverException(),
+    ],
+)
+def test_loads_page_when_current_page_can_not_be_reused(navigator, current):
+    navigator.browser.execute_script.side_effect = [current]
+    assert navigator.open(CONFIGURATION_URL, tab="proxy") is True
+    navigator.browser.get.assert_called_once_with(CONFIGURATION_URL)
+    navigator.tab.return_value.open_tab.assert_called_once_with("proxy")
+
+
+def test_disabled_navigator_always_loads_page(navigator, monkeypatch):
+    monkeypatch.setattr(Navigator, "enabled", False)
+    assert navigator.open(CONFIGURATION_URL) is True
+    navigator.browser.execute_script.assert_not_called()
+
+
+def test_is_same_page():
+    assert is_same_page(CONFIGURATION_URL + "/?tab=proxy", CONFIGURATION_URL)
+    assert not is_same_page(CONFIGURATION_URL, CONFIGURATION_URL + "?tab=proxy")
+    assert not is_same_page(
+        CONFIGURATION_URL.replace("8000", "8001"), CONFIGURATION_URL
+    )
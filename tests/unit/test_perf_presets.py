@@ -0,0 +1,123 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from pytest_splunk_addon_ui_smartx.base_test import SeleniumHelper
+from pytest_splunk_addon_ui_smartx.browser_profile import BrowserProfiles
+from pytest_splunk_addon_ui_smartx.perf_presets import (
+    LEAN_CHROME_ARGUMENTS,
+    PAGE_RESOURCES_SCRIPT,
+    PageStat,
+    PageStats,
+    block_urls,
+    get_firefox_preferences,
+    get_perf_preset,
+)
+
+# test_base_test replaces the option builders of SeleniumHelper with mocks
+get_local_chrome_opts = SeleniumHelper.get_local_chrome_opts
+
+
+def test_get_perf_preset():
+    assert get_perf_preset(None) is None
+    preset = get_perf_preset(None, ["*/telemetry*"])
+    assert preset.blocked_urls == ("*/telemetry*",)
+    assert not preset.lean
+    preset = get_perf_preset("no-media", ["*/telemetry*"])
+    assert "*.woff2?*" in preset.blocked_urls
+    assert preset.blocked_urls[-1] == "*/telemetry*"
+    assert get_perf_preset("lean").blocked_urls == ()
+    with pytest.raises(ValueError, match="Unknown performance preset fast"):
+        get_perf_preset("fast")
+
+
+def test_firefox_preferences():
+    assert get_firefox_preferences(get_perf_preset("lean")) == {
+        "dom.timeout.enable_budget_throttling": False,
+        "dom.min_background_timeout_value": 4,
+        "ui.prefersReducedMotion": 1,
+    }
+    preferences = get_firefox_preferences(get_perf_preset("minimal"))
+    assert preferences["permissions.default.image"] == 2
+    assert preferences["gfx.downloadable_fonts.enabled"] is False
+
+
+def test_block_urls():
+    browser = MagicMock()
+    preset = get_perf_preset(None, ["*.png"])
+    assert block_urls(browser, preset)
+    browser.execute_cdp_cmd.assert_called_with(
+        "Network.setBlockedURLs", {"urls": ["*.png"]}
+    )
+    browser.execute_cdp_cmd.side_effect = WebDriverException()
+    assert not block_urls(browser, preset)
+    assert not block_urls(MagicMock(spec=["execute_script"]), preset)
+    assert not block_urls(browser, get_perf_preset("lean"))
+
+
+def make_helper(perf_preset, browser_profiles=None, profile_session=None):
+    helper = SeleniumHelper.__new__(SeleniumHelper)
+    helper.perf_preset = perf_preset
+    helper.browser_profiles = browser_profiles
+    helper.profile_session = profile_session
+    return helper
+
+
+def test_chrome_options_of_preset():
+    helper = make_helper(get_perf_preset("no-media"))
+    options = get_local_chrome_opts(False, **helper.get_browser_options("chrome"))
+    for argument in LEAN_CHROME_ARGUMENTS:
+        assert argument in options.arguments
+    assert options.experimental_options["prefs"] == {
+        "profile.managed_default_content_settings.images": 2
+    }
+    assert make_helper(None).get_browser_options("chrome") == {}
+
+
+def test_firefox_options_merge_preset_and_profile(tmp_path):
+    profiles = BrowserProfiles(str(tmp_path), worker="gw0")
+    helper = make_helper(
+        get_perf_preset("no-media"), profiles, profiles.create_session()
+    )
+    preferences = helper.get_browser_options("firefox")["preferences"]
+    assert preferences["permissions.default.image"] == 2
+    assert preferences["browser.cache.disk.enable"] is True
+
+
+def test_page_stats_accumulate_per_path():
+    stats = PageStats()
+    browser = MagicMock()
+    browser.execute_script.return_value = {
+        "url": "https://localhost:8000/en-US/app/TA/inputs?tab=one",
+        "load": True,
+        "requests": 40,
+        "bytes": 2048,
+        "cached": 10,
+    }
+    stats.record(browser)
+    browser.execute_script.assert_not_called()
+
+    stats.enabled = True
+    stats.record(browser)
+    browser.execute_script.return_value = dict(
+        browser.execute_script.return_value, load=False, requests=2, bytes=100
+    )
+    stats.record(browser)
+    browser.execute_script.assert_called_with(PAGE_RESOURCES_SCRIPT, 250, 10000)
+    assert stats.get_stats() == {
+        "/en-US/app/TA/inputs": PageStat(
+            loads=1, requests=42, bytes=2148, cached=20, truncated=0
+        )
+    }
+
+    browser.execute_script.return_value = dict(
+        browser.execute_script.return_value, load=True, truncated=True
+    )
+    stats.record(browser)
+    assert stats.get_stats()["/en-US/app/TA/inputs"].truncated == 1
+
+    browser.execute_script.side_effect = WebDriverException()
+    stats.record(browser)
+    stats.reset_stats()
+    assert stats.get_stats() == {}
@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from pytest_splunk_addon_ui_smartx import plugin
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    BaseComponent,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.components.tabs import Tab
+from pytest_splunk_addon_ui_smartx.profiler import (
+    COMPONENT_PROFILER,
+    ComponentProfiler,
+    MethodStats,
+)
+from pytest_splunk_addon_ui_smartx.wait_engine import WAIT_ENGINE
+
+
+@pytest.fixture()
+def profiler():
+    COMPONENT_PROFILER.enabled = True
+    COMPONENT_PROFILER.reset_stats()
+    yield COMPONENT_PROFILER
+    COMPONENT_PROFILER.enabled = False
+    COMPONENT_PROFILER.reset_stats()
+
+
+class Parent(BaseComponent):
+    def get_value(self):
+        self.browser.execute("getTitle")
+        WAIT_ENGINE.record("Parent", 1, 0.25, False)
+        return "value"
+
+    def _private(self):
+        return "private"
+
+
+class Child(Parent):
+    def get_value(self):
+        return super().get_value().upper()
+
+
+def test_subclass_methods_are_profiled(profiler):
+    browser = MagicMock()
+    profiler.install(browser)
+    child = Child(browser, Selector(select="#child"))
+    assert child.get_value() == "VALUE"
+    assert child._private() == "private"
+    Parent(browser, Selector(select="#parent")).get_value()
+
+    stats = profiler.get_stats()
+    assert set(stats) == {("Child", "get_value"), ("Parent", "get_value")}
+    assert stats[("Child", "get_value")].calls == 1
+    assert stats[("Child", "get_value")].round_trips == 1
+    assert stats[("Child", "get_value")].wait_time == pytest.approx(0.25)
+    assert getattr(Tab.open_tab, "_ucc_smartx_profiled", False)
+    assert getattr(BaseComponent.get_element, "_ucc_smartx_profiled", False)
+    assert not getattr(BaseComponent._get_element, "_ucc_smartx_profiled", False)
+
+
+def test_base_component_methods_profiled_per_component(profiler):
+    browser = MagicMock()
+    Child(browser, Selector(select="#child")).get_element("container")
+    Parent(browser, Selector(select="#parent")).get_element("container")
+    stats = profiler.get_stats()
+    assert stats[("Child", "get_element")].calls == 1
+    assert stats[("Parent", "get_element")].calls == 1
+
+
+def test_disabled_profiler_records_nothing(profiler):
+    profiler.enabled = False
+    Child(MagicMock(), Selector(select="#child")).get_value()
+    assert profiler.get_stats() == {}
+
+
+def test_exceptions_are_recorded():
+    profiler = ComponentProfiler()
+    profiler.enabled = True
+
+    class Failing:
+        def fail(self):
+            raise ValueError("failed")
+
+    profiler.profile_methods(Failing)
+    with pytest.raises(ValueError):
+        Failing().fail()
+    with pytest.raises(ValueError):
+        Failing().fail()
+    assert profiler.get_stats()[("Failing", "fail")].calls == 2
+
+
+def test_format_table_sorted():
+    profiler = ComponentProfiler()
+    profiler.record("Table", "get_table", 2.0, 3, 0.5)
+    profiler.record("Entity", "save", 1.0, 30, 0.9)
+    lines = profiler.format_table(sort="round_trips")
+    assert lines[1].startswith("Entity.save")
+    assert lines[2].startswith("Table.get_table")
+    assert len(profiler.format_table(limit=1)) == 2
+    assert profiler.get_stats()[("Table", "get_table")] == MethodStats(1, 2.0, 3, 0.5)
+
+
+def test_install_counts_round_trips_once(profiler):
+    browser = MagicMock()
+    profiler.install(browser)
+    profiler.install(browser)
+    Parent(browser, Selector(select="#parent")).get_value()
+    assert profiler.get_stats()[("Parent", "get_value")].round_trips == 1
+
+
+def test_worker_profiles_are_merged():
+    worker = ComponentProfiler()
+    worker.record("Table", "get_table", 2.0, 3, 0.5)
+    profiler = ComponentProfiler()
+    profiler.record("Table", "get_table", 1.0, 2, 0.25)
+    profiler.merge_stats(worker.export_stats())
+    profiler.merge_stats(worker.export_stats())
+    assert profiler.get_stats() == {
+        ("Table", "get_table"): MethodStats(3, 5.0, 8, 1.25)
+    }
+
+
+def test_profile_sent_by_the_workers_printed_by_the_controller(profiler):
+    profiler.record("Table", "get_table", 2.0, 3, 0.5)
+    worker_config = MagicMock(workeroutput=dict(), workerinput=dict())
+    worker_config.getoption.return_value = None
+    plugin.pytest_sessionfinish(MagicMock(config=worker_config), 0)
+    plugin.pytest_unconfigure(worker_config)
+    worker_config.pluginmanager.get_plugin.assert_not_called()
+
+    profiler.reset_stats()
+    plugin.pytest_testnodedown(MagicMock(workeroutput=worker_config.workeroutput), None)
+    config = MagicMock(spec=["getoption", "pluginmanager"])
+    options = {"--profile-components": True, "--profile-sort": "wall_time"}
+    config.getoption.side_effect = options.get
+    plugin.pytest_unconfigure(config)
+    terminalreporter = config.pluginmanager.get_plugin.return_value
+    lines = [each.args[0] for each in terminalreporter.write_line.call_args_list]
+    assert lines[1].startswith("Table.get_table")
@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock, patch
+
+from selenium.common.exceptions import JavascriptException
+
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    BaseComponent,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.components.select_options import (
+    OPTIONS_SCROLL_SCRIPT,
+    OPTIONS_SNAPSHOT_SCRIPT,
+    find_option,
+    get_options,
+)
+
+OPTIONS_SELECTOR = '#popover [data-test="option"]'
+
+
+def option(label, value=None, selected=False):
+    return {
+        "element": "element_" + label,
+        "label": label,
+        "text": label + " ",
+        "value": value or label.lower(),
+        "disabled": False,
+        "selected": selected,
+    }
+
+
+def make_component(snapshots):
+    browser = MagicMock()
+    browser.execute_script.side_effect = snapshots
+    component = BaseComponent(browser, Selector(select="#select"))
+    component.elements["values"] = Selector(select=OPTIONS_SELECTOR)
+    return component
+
+
+def test_get_options_reads_list_in_one_script():
+    component = make_component(
+        [{"options": [option("main"), option("history", selected=True)], "more": False}]
+    )
+    options = get_options(component, "values")
+    assert [each.label for each in options] == ["main", "history"]
+    assert options[1].selected is True
+    assert options[0].text == "main "
+    component.browser.execute_script.assert_called_once_with(
+        OPTIONS_SNAPSHOT_SCRIPT, OPTIONS_SELECTOR
+    )
+
+
+def get_scripts(component):
+    return [each[0][0] for each in component.browser.execute_script.call_args_list]
+
+
+def test_get_options_scrolls_virtualized_list():
+    component = make_component(
+        [
+            {"options": [option("a"), option("b")], "more": True},
+            True,
+            {"options": [option("b"), option("c")], "more": True},
+            True,
+            {"options": [option("c")], "more": False},
+            {"options": [option("c")], "more": False},
+        ]
+    )
+    assert [each.label for each in get_options(component, "values")] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert get_scripts(component) == [
+        OPTIONS_SNAPSHOT_SCRIPT,
+        OPTIONS_SCROLL_SCRIPT,
+        OPTIONS_SNAPSHOT_SCRIPT,
+        OPTIONS_SCROLL_SCRIPT,
+        OPTIONS_SNAPSHOT_SCRIPT,
+        OPTIONS_SNAPSHOT_SCRIPT,
+    ]
+
+
+def test_get_options_waits_for_batch_loaded_after_scroll():
+    first = {"options": [option("a"), option("b")], "more": True}
+    component = make_component(
+        [
+            first,
+            True,
+            # the scroll event is handled & the next batch fetched asynchronously
+            first,
+            dict(first, more=False),
+            {"options": [option("a"), option("b"), option("Main")], "more": True},
+        ]
+    )
+    assert find_option(component, "values", "main").element == "element_Main"
+    assert component.browser.execute_script.call_count == 5
+
+
+def test_get_options_stops_when_no_batch_after_scroll():
+    first = {"options": [option("a")], "more": True}
+    component = make_component(lambda script, select: first)
+    with patch(
+        "pytest_splunk_addon_ui_smartx.components.select_options.OPTIONS_BATCH_TIMEOUT",
+        0.1,
+    ):
+        assert [each.label for each in get_options(component, "values")] == ["a"]
+
+
+def test_get_options_stops_when_menu_does_not_scroll():
+    component = make_component(
+        [{"options": [option("a"), option("b")], "more": True}, False]
+    )
+    assert [each.label for each in get_options(component, "values")] == ["a", "b"]
+    assert component.browser.execute_script.call_count == 2
+
+
+def test_find_option_does_not_scroll_past_match():
+    component = make_component(
+        [{"options": [option("Main"), option("z")], "more": True}]
+    )
+    assert find_option(component, "values", "main").element == "element_Main"
+    assert get_scripts(component) == [OPTIONS_SNAPSHOT_SCRIPT]
+
+
+def test_find_option_stops_at_match():
+    component = make_component(
+        [
+            {"options": [option("a"), option("b")], "more": True},
+            True,
+            {"options": [option("Main"), option("z")], "more": True},
+        ]
+    )
+    assert find_option(component, "values", "main").element == "element_Main"
+    # the matched element is read after the last scroll
+    assert get_scripts(component) == [
+        OPTIONS_SNAPSHOT_SCRIPT,
+        OPTIONS_SCROLL_SCRIPT,
+        OPTIONS_SNAPSHOT_SCRIPT,
+    ]
+    assert (
+        find_option(make_component([{"options": [], "more": False}]), "values", "x")
+        is None
+    )
+
+
+def test_get_options_falls_back_to_elements():
+    component = make_component(JavascriptException())
+    element = MagicMock(text=" main ")
+    element.get_attribute.return_value = None
+    component.browser.find_elements.return_value = [element]
+    options = get_options(component, "values")
+    assert options[0].label == "main"
+    assert options[0].element is element
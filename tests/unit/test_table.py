@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    SETTLED_PROBE_SCRIPT,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.components.table import (
+    TABLE_GENERATION_SCRIPT,
+    TABLE_SNAPSHOT_SCRIPT,
+    Table,
+)
+from pytest_splunk_addon_ui_smartx.dom_driver import DomWebDriver
+
+SNAPSHOT = {
+    "generation": "1:0",
+    "headers": ["Name", "Interval", "Status", "Actions"],
+    "rows": [
+        {
+            "element": "row_one",
+            "columns": {"name": " input_one ", "interval": "60\n"},
+            "cells": ["", "input_one", "60", "Enabled", ""],
+            "status": "Enabled ",
+            "actions": {"edit": 1, "clone": 1, "search": 0, "delete": 1},
+        },
+        {
+            "element": "row_two",
+            "columns": {"name": "input_two", "interval": "3600"},
+            "cells": ["", "input_two", "3600", "Disabled", ""],
+            "status": "Disabled",
+            "actions": {"edit": 1, "clone": 0, "search": 0, "delete": 0},
+        },
+    ],
+}
+
+
+@pytest.fixture()
+def table():
+    browser = MagicMock()
+    browser.generation = "1:0"
+    browser.execute_script.side_effect = lambda script, *args: {
+        TABLE_GENERATION_SCRIPT: browser.generation,
+        SETTLED_PROBE_SCRIPT: "present",
+    }.get(script, SNAPSHOT)
+    return Table(browser, Selector(select="#table"))
+
+
+def test_get_table_uses_single_script(table):
+    assert table.get_table() == {
+        "input_one": {
+            "name": "input_one",
+            "interval": "60",
+            "status": "Enabled",
+            "actions": "Edit | Clone | Delete",
+        },
+        "input_two": {
+            "name": "input_two",
+            "interval": "3600",
+            "status": "Disabled",
+            "actions": "Edit",
+        },
+    }
+    scripts = [each[0][0] for each in table.browser.execute_script.call_args_list]
+    assert scripts[0] == SETTLED_PROBE_SCRIPT
+    assert len(scripts) == 2
+    args = table.browser.execute_script.call_args[0]
+    assert args[1] == '#table tbody[data-test="body"] tr[data-test="row"]'
+    assert args[4]["delete"] == ".deleteBtn"
+
+
+def test_cell_and_column_values_from_snapshot(table):
+    assert table.get_cell_value("input_two", "interval") == "3600"
+    assert table.get_cell_value("input_one", "Status") == "Enabled"
+    assert table.get_column_values("name") == ["input_one", "input_two"]
+    assert table._get_row("input_two") == "row_two"
+
+
+def test_header_mapping_by_column_number(table):
+    table.header_mapping = {"status": 4}
+    assert table.get_column_values("status") == ["Enabled", "Disabled"]
+
+
+def test_row_not_found(table):
+    with pytest.raises(ValueError, match="input_three row not found"):
+        table._get_row("input_three")
+
+
+def test_cell_of_missing_row_fails_fast(table):
+    with pytest.raises(ValueError, match="input_three row not found"):
+        table.get_cell_value("input_three", "interval")
+    scripts = [each[0][0] for each in table.browser.execute_script.call_args_list]
+    assert scripts.count(TABLE_SNAPSHOT_SCRIPT) == 1
+
+
+def test_row_index_reused_until_table_renders_again(table):
+    assert table._get_row("input_one") == "row_one"
+    assert table._get_row("input_two") == "row_two"
+    scripts = [each[0][0] for each in table.browser.execute_script.call_args_list]
+    assert scripts[2:] == [TABLE_GENERATION_SCRIPT]
+
+    table.browser.generation = "1:1"
+    assert table._get_row("input_two") == "row_two"
+    assert table.browser.execute_script.call_count == 6
+
+
+def test_wait_stale_invalidates_row_index(table):
+    table._get_row("input_one")
+    table.browser.find_elements.return_value = []
+    with table.wait_stale():
+        pass
+    assert table._row_index is None
+
+
+def test_falls_back_to_elements_when_script_fails(table):
+    table.browser.execute_script.side_effect = JavascriptException()
+    row = MagicMock()
+    row.find_element.return_value.get_attribute.return_value = " input_one "
+    table.browser.find_elements.return_value = [row]
+    assert table.get_column_values("name") == ["input_one"]
+    row.find_element.assert_called_with(
+        "css selector", '#table [data-test="cell"][data-column="name"]'
+    )
+
+
+def get_table_page(*names):
+    rows = "".join(
+        '<tr data-test="row"><td data-test="cell" data-column="name">{}</td></tr>'.format(
+            name
+        )
+        for name in names
+    )
+    return (
+        '<html><body><div id="table"><table><tbody data-test="body">{}</tbody>'
+        "</table></div></body></html>".format(rows)
+    )
+
+
+def test_row_index_rebuilt_after_page_reload():
+    browser = DomWebDriver(get_table_page("input_one"))
+    table = Table(browser, Selector(select="#table"))
+    table._get_row("input_one")
+    # a fixture created input_two over REST, then the page got reloaded
+    browser.load(get_table_page("input_one", "input_two"))
+    assert table._get_row("input_two").text == "input_two"
+    assert table._get_row("input_one").text == "input_one"
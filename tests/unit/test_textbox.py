@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+from selenium.common.exceptions import JavascriptException
+
+from pytest_splunk_addon_ui_smartx.components.base_component import Selector
+from pytest_splunk_addon_ui_smartx.components.controls.textarea import TextArea
+from pytest_splunk_addon_ui_smartx.components.controls.textbox import (
+    FAST_FILL_SCRIPT,
+    TextBox,
+)
+
+CERTIFICATE = "-----BEGIN CERTIFICATE-----\nMIIB\n-----END CERTIFICATE-----"
+
+
+def make_textbox(control=TextBox, fast_fill=True, filled=CERTIFICATE):
+    browser = MagicMock()
+    browser.capabilities = {"browserName": "chrome"}
+    browser.execute_script.side_effect = lambda script, *args: (
+        filled if script == FAST_FILL_SCRIPT else "0,0,10,10"
+    )
+    browser.find_element.return_value.is_displayed.return_value = True
+    return control(browser, Selector(select="#certificate"), fast_fill=fast_fill)
+
+
+def fast_fill_calls(textbox):
+    return [
+        each[0]
+        for each in textbox.browser.execute_script.call_args_list
+        if each[0][0] == FAST_FILL_SCRIPT
+    ]
+
+
+def test_set_value_fills_in_one_operation():
+    textbox = make_textbox(TextArea)
+    textbox.set_value(CERTIFICATE)
+    assert fast_fill_calls(textbox)[0][2] == CERTIFICATE
+    textbox.browser.find_element.return_value.send_keys.assert_not_called()
+
+
+def test_set_value_types_when_value_is_not_set():
+    textbox = make_textbox(filled="")
+    textbox.set_value(CERTIFICATE)
+    input_element = textbox.browser.find_element.return_value
+    input_element.send_keys.assert_called_with(CERTIFICATE)
+
+
+def test_set_value_types_when_script_fails():
+    textbox = make_textbox()
+    textbox.browser.execute_script.side_effect = JavascriptException()
+    textbox.set_value("value")
+    textbox.browser.find_element.return_value.send_keys.assert_called_with("value")
+
+
+def test_fast_fill_defaults_to_option(monkeypatch):
+    textbox = make_textbox(fast_fill=None)
+    textbox.set_value(CERTIFICATE)
+    assert fast_fill_calls(textbox) == []
+    monkeypatch.setattr(TextBox, "fast_fill_default", True)
+    textbox.set_value(CERTIFICATE)
+    assert len(fast_fill_calls(textbox)) == 1
+
+
+def test_append_value_types_once_when_value_reads_back_differently():
+    textarea = make_textbox(TextArea)
+    input_element = textarea.browser.find_element.return_value
+    input_element.get_attribute.side_effect = lambda name: state["value"]
+    input_element.send_keys.side_effect = lambda value: state.update(
+        value=state["value"] + value.replace("\r\n", "\n")
+    )
+    state = {"value": "first\n"}
+
+    def fill(script, *args):
+        if script != FAST_FILL_SCRIPT:
+            return "0,0,10,10"
+        # a textarea normalizes the line endings
+        state["value"] = args[1].replace("\r\n", "\n")
+        return state["value"]
+
+    textarea.browser.execute_script.side_effect = fill
+    textarea.append_value("second\r\n")
+    assert state["value"] == "first\nsecond\n"
+    input_element.send_keys.assert_called_once_with("second\r\n")
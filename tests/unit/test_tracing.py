@@ -0,0 +1,109 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pytest_splunk_addon_ui_smartx.components.tabs import Tab
+from pytest_splunk_addon_ui_smartx.tracing import CommandTracer, get_locator
+
+ELEMENT = {"element-6066-11e4-a52e-4f735466cecf": "tab-1"}
+
+
+def make_browser(responses):
+    browser = WebDriver.__new__(WebDriver)
+    browser.session_id = "session"
+    browser.w3c = True
+    browser.error_handler = ErrorHandler()
+    browser.command_executor = MagicMock()
+    browser.command_executor.execute.side_effect = lambda command, params: (
+        responses.pop(0) if responses else {"status": 0, "value": None}
+    )
+    return browser
+
+
+@pytest.fixture()
+def tracer():
+    tracer = CommandTracer(slowest=2)
+    tracer.enabled = True
+    tracer.start_test("test_one")
+    return tracer
+
+
+def test_records_commands_with_origin(tracer):
+    browser = make_browser(
+        [
+            {"status": 0, "value": ELEMENT},
+            {"status": 0, "value": ELEMENT},
+        ]
+    )
+    tracer.install(browser)
+    tracer.install(browser)
+    Tab(browser).open_tab("account")
+
+    records = tracer.get_records("test_one")
+    assert [each.command for each in records] == [
+        "findElement",
+        "findElement",
+        "clickElement",
+    ]
+    assert {each.origin for each in records} == {"Tab.open_tab"}
+    assert [each.in_wait for each in records] == [True, True, False]
+    assert records[0].locator == 'css selector=[data-test="tab-bar"]'
+    assert (
+        records[1].locator
+        == 'css selector=[data-test="tab"][data-test-tab-id="account"]'
+    )
+
+
+def test_summary_counts_retries_and_failures(tracer):
+    browser = make_browser(
+        [
+            {"status": 7, "value": {"message": "no such element"}},
+            {"status": 7, "value": {"message": "no such element"}},
+            {"status": 0, "value": ELEMENT},
+        ]
+    )
+    tracer.install(browser)
+    for _ in range(2):
+        with pytest.raises(NoSuchElementException):
+            browser.find_element("css selector", "#missing")
+    browser.find_element("css selector", "#missing")
+
+    summary = tracer.get_summary("test_one")
+    assert summary["commands"] == 3
+    assert summary["retries"] == 2
+    assert summary["failed"] == 2
+    assert summary["wait_commands"] == 0
+    assert summary["action_time"] == summary["wire_time"]
+    assert len(summary["slowest"]) == 2
+    assert tracer.get_records("test_one")[-1].attempt == 3
+
+
+def test_commands_outside_of_tests_are_not_recorded():
+    tracer = CommandTracer()
+    tracer.install(MagicMock())
+    tracer.enabled = True
+    browser = make_browser([])
+    tracer.install(browser)
+    browser.execute("getTitle")
+    assert tracer.get_summaries() == []
+
+
+def test_write_json_per_worker(tracer, tmp_path, monkeypatch):
+    tracer.record("getTitle", None, 0.5, False, None)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    path = tracer.write_json(str(tmp_path / "trace.json"))
+    assert path == str(tmp_path / "trace.gw1.json")
+    with open(path) as trace:
+        tests = json.load(trace)["tests"]
+    assert tests[0]["test"] == "test_one"
+    assert tests[0]["wire_time"] == 0.5
+
+
+def test_get_locator():
+    assert get_locator({"using": "xpath", "value": "//div"}) == "xpath=//div"
+    assert get_locator({"id": "element"}) is None
+    assert get_locator(None) is None
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from pytest_splunk_addon_ui_smartx.components.base_component import (
+    BaseComponent,
+    Selector,
+)
+from pytest_splunk_addon_ui_smartx.components.table import Table
+from pytest_splunk_addon_ui_smartx.plugin import configure_wait_engine
+from pytest_splunk_addon_ui_smartx.wait_engine import (
+    AdaptiveWebDriverWait,
+    WaitEngine,
+    WaitPolicy,
+    parse_policy,
+)
+
+
+@pytest.fixture()
+def engine():
+    return WaitEngine(WaitPolicy(min_poll=0.1, max_poll=0.4, backoff=2))
+
+
+def test_poll_interval_backs_off_up_to_max_poll(engine):
+    condition = MagicMock(side_effect=[False] * 5 + ["done"])
+    wait = engine.create_wait(None, 10, "assert_util")
+    with patch("time.sleep") as sleep:
+        assert wait.until(condition) == "done"
+    assert [each[0][0] for each in sleep.call_args_list] == [0.1, 0.2, 0.4, 0.4, 0.4]
+    assert wait.last_polls == 6
+    assert engine.get_stats()["assert_util"].polls == 6
+
+
+def test_timeout_is_counted(engine):
+    wait = engine.create_wait(None, 0.2, "assert_util")
+    with pytest.raises(TimeoutException, match="not found"):
+        wait.until(MagicMock(side_effect=NoSuchElementException()), "not found")
+    stats = engine.get_stats()["assert_util"]
+    assert stats.timeouts == 1
+    assert stats.max_polls >= 2
+
+
+def test_until_not(engine):
+    wait = engine.create_wait(None, 1)
+    assert wait.until_not(MagicMock(side_effect=[True, False])) is False
+
+
+def test_component_overrides_are_inherited(engine):
+    engine.configure(
+        overrides={"Table": parse_policy("min_poll=0.5", engine.default_policy)}
+    )
+    with patch(
+        "pytest_splunk_addon_ui_smartx.components.base_component.WAIT_ENGINE", engine
+    ):
+        table = Table(MagicMock(), Selector(select="#table"))
+        component = BaseComponent(MagicMock(), Selector(select="#component"))
+    assert isinstance(table.wait, AdaptiveWebDriverWait)
+    assert table.wait.policy == WaitPolicy(min_poll=0.5, max_poll=0.4, backoff=2)
+    assert component.wait.policy == engine.default_policy
+    assert table.wait.name == "Table"
+
+
+def test_configure_from_ini_and_command_line():
+    config = MagicMock()
+    config.getini.return_value = ["*:max_poll=2", "Table:min_poll=0.3"]
+    options = {
+        "--wait-policy": ["Table:backoff=3"],
+        "--wait-min-poll": 0.01,
+        "--wait-max-poll": None,
+        "--wait-backoff": None,
+    }
+    config.getoption.side_effect = options.get
+    engine = WaitEngine()
+    with patch("pytest_splunk_addon_ui_smartx.plugin.WAIT_ENGINE", engine):
+        configure_wait_engine(config)
+    assert engine.default_policy == WaitPolicy(min_poll=0.01, max_poll=2, backoff=1.5)
+    assert engine.overrides["Table"] == WaitPolicy(min_poll=0.3, max_poll=2, backoff=3)
+
+
+def test_invalid_policy_parameter():
+    with pytest.raises(ValueError, match="Invalid wait policy parameter poll"):
+        parse_policy("poll=1")
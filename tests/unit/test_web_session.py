@@ -0,0 +1,112 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pytest_splunk_addon_ui_smartx.base_test import SeleniumHelper
+from pytest_splunk_addon_ui_smartx.web_session import (
+    SplunkWebSessionCache,
+    get_session_cookies,
+)
+
+WEB_URL = "https://localhost:8000"
+BROWSER_COOKIES = [
+    {"name": "splunkd_8000", "value": "key", "domain": "localhost", "secure": True},
+    {"name": "splunkweb_csrf_token_8000", "value": "csrf", "path": "/"},
+    {"name": "cval", "value": "123"},
+]
+
+
+def test_cache_keeps_only_session_cookies():
+    cache = SplunkWebSessionCache()
+    cache.set(WEB_URL, "admin", BROWSER_COOKIES)
+    assert cache.get(WEB_URL, "admin") == [
+        {"name": "splunkd_8000", "value": "key", "path": "/", "secure": True},
+        {
+            "name": "splunkweb_csrf_token_8000",
+            "value": "csrf",
+            "path": "/",
+            "secure": False,
+        },
+    ]
+    assert cache.get(WEB_URL, "other_user") is None
+    cache.invalidate(WEB_URL, "admin")
+    assert cache.get(WEB_URL, "admin") is None
+
+
+def test_cache_login_authenticates_once():
+    cache = SplunkWebSessionCache()
+    with patch(
+        "pytest_splunk_addon_ui_smartx.web_session.get_session_cookies",
+        return_value=BROWSER_COOKIES,
+    ) as get_cookies:
+        cache.login(WEB_URL, "admin", "Chang3d!")
+        cookies = cache.login(WEB_URL, "admin", "Chang3d!")
+    get_cookies.assert_called_once_with(WEB_URL, "admin", "Chang3d!")
+    assert [cookie["name"] for cookie in cookies] == [
+        "splunkd_8000",
+        "splunkweb_csrf_token_8000",
+    ]
+
+
+def make_cookie(name, value):
+    cookie = MagicMock(value=value, path="/")
+    cookie.name = name
+    return cookie
+
+
+def test_get_session_cookies_posts_cval():
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.cookies.get.return_value = "123"
+    session.cookies.__iter__.return_value = iter(
+        [make_cookie("cval", "123"), make_cookie("splunkd_8000", "key")]
+    )
+    with patch("requests.Session", return_value=session):
+        cookies = get_session_cookies(WEB_URL, "admin", "Chang3d!")
+    assert session.post.call_args[1]["data"]["cval"] == "123"
+    assert {"name": "splunkd_8000", "value": "key", "path": "/"} in cookies
+
+
+def test_get_session_cookies_raises_on_failed_login():
+    session = MagicMock()
+    session.__enter__.return_value = session
+    session.cookies.__iter__.side_effect = lambda: iter([make_cookie("cval", "123")])
+    with patch("requests.Session", return_value=session):
+        with pytest.raises(Exception, match="Could not login to Splunk web"):
+            get_session_cookies(WEB_URL, "admin", "wrong")
+
+
+@pytest.fixture()
+def fast_login_helper():
+    with patch("selenium.webdriver.Chrome"), patch(
+        "pytest_splunk_addon_ui_smartx.base_test.LoginPage"
+    ), patch("pytest_splunk_addon_ui_smartx.base_test.Login"), patch(
+        "pytest_splunk_addon_ui_smartx.base_test.SPLUNK_WEB_SESSIONS"
+    ) as sessions:
+        sessions.login.return_value = BROWSER_COOKIES[:2]
+        helper = SeleniumHelper(
+            "chrome", "88", WEB_URL, "https://localhost:8089", debug=True
+        )
+        helper.fast_login = True
+        helper.browser.current_url = WEB_URL + "/en-US/app/launcher/home"
+        yield helper, sessions
+
+
+def test_login_to_splunk_injects_cached_cookies(fast_login_helper):
+    helper, sessions = fast_login_helper
+    with patch("pytest_splunk_addon_ui_smartx.base_test.LoginPage") as login_page:
+        helper.login_to_splunk("admin", "Chang3d!")
+    login_page.assert_not_called()
+    helper.browser.get.assert_any_call(WEB_URL + "/robots.txt")
+    assert helper.browser.add_cookie.call_count == 2
+
+
+def test_login_to_splunk_falls_back_to_login_form(fast_login_helper):
+    helper, sessions = fast_login_helper
+    helper.browser.current_url = WEB_URL + "/en-US/account/login"
+    with patch("pytest_splunk_addon_ui_smartx.base_test.LoginPage") as login_page:
+        helper.login_to_splunk("admin", "Chang3d!")
+    sessions.invalidate.assert_called_once_with(WEB_URL, "admin")
+    login_page.return_value.login.login.assert_called_once_with("admin", "Chang3d!")
+    sessions.set.assert_called_once()